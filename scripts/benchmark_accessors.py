@@ -0,0 +1,49 @@
+"""
+Benchmark the per-call overhead of the ``mac`` accessors, i.e. of looking up
+a function on ``df.mac``/``ser.mac`` (which returns it bound to the object)
+and of calling a cheap function through it rather than directly.
+
+python -m scripts.benchmark_accessors
+python -m scripts.benchmark_accessors --number 100000
+"""
+
+import argparse
+import timeit
+
+import pandas as pd
+
+import macpie as mp
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--number", type=int, default=200_000, help="calls per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="report the best of this many")
+    args = parser.parse_args(argv)
+
+    df = pd.DataFrame({"PIDN": [1, 2], "DCDate": pd.to_datetime(["2001-01-01", "2002-02-02"])})
+    ser = pd.Series([1, 2, None])
+
+    first_df_func = mp.MacDataFrameAccessor.accessor_api[0].__name__
+    last_df_func = mp.MacDataFrameAccessor.accessor_api[-1].__name__
+
+    timings = {
+        # the accessor object itself is cached on the DataFrame by pandas
+        f"df.mac.{first_df_func} (lookup)": lambda: getattr(df.mac, first_df_func),
+        f"df.mac.{last_df_func} (lookup)": lambda: getattr(df.mac, last_df_func),
+        f"df.mac.{last_df_func} (first lookup)": lambda: getattr(
+            mp.MacDataFrameAccessor(df), last_df_func
+        ),
+        "ser.mac.rtrim_longest (lookup)": lambda: ser.mac.rtrim_longest,
+        "df.mac.get_col_name('pidn')": lambda: df.mac.get_col_name("pidn"),
+        "mp.pandas.get_col_name(df, 'pidn')": lambda: mp.pandas.get_col_name(df, "pidn"),
+    }
+
+    print(f"{'call':<45} {'ns per call':>12}")
+    for name, stmt in timings.items():
+        best = min(timeit.repeat(stmt, number=args.number, repeat=args.repeat))
+        print(f"{name:<45} {best / args.number * 1e9:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Benchmark linking and related operations on synthetic cohorts of different
+sizes (see scripts/synthetic_cohort.py), recording the wall time and peak
+memory (RSS) of each.
+
+python -m scripts.benchmark_linking
+python -m scripts.benchmark_linking --rows 10000 100000 1000000 --filter 'date_proximity*'
+python -m scripts.benchmark_linking --json results.json
+
+Each benchmark runs in a new process, so the peak RSS of one doesn't hide
+that of the next. "peak MiB" is the peak RSS of that process and "added MiB"
+is how much it grew during the timed call (i.e. beyond the input data).
+"""
+
+import argparse
+import concurrent.futures
+import fnmatch
+import gc
+import json
+import multiprocessing
+import sys
+from timeit import default_timer as timer
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import macpie as mp
+from macpie.util import Masker, MaskMap
+from scripts.synthetic_cohort import make_cohort
+
+DEFAULT_ROWS = [10_000, 100_000]
+
+
+def setup_date_proximity(n_rows, seed):
+    primary, (secondary,) = make_cohort(n_rows, seed=seed)
+    return primary, secondary
+
+
+def date_proximity(primary, secondary, get, when):
+    return mp.pandas.date_proximity(
+        primary,
+        secondary,
+        id_on="PIDN",
+        date_on="DCDate",
+        get=get,
+        when=when,
+        days=90,
+        left_link_id="InstrID",
+    )
+
+
+def setup_group_by_keep_one(n_rows, seed):
+    _, (secondary,) = make_cohort(n_rows, seed=seed)
+    return (secondary,)
+
+
+def group_by_keep_one(secondary, keep):
+    return mp.pandas.group_by_keep_one(secondary, "PIDN", "DCDate", keep=keep)
+
+
+def setup_mergeable_anchored_list(n_rows, seed, n_secondary=3):
+    primary, secondary = make_cohort(n_rows, n_secondary=n_secondary, seed=seed)
+    prim_dset = mp.Dataset(
+        primary, id_col_name="InstrID", date_col_name="DCDate", id2_col_name="PIDN", name="prim"
+    )
+    sec_dsets = [
+        mp.Dataset(
+            sec,
+            id_col_name="InstrID",
+            date_col_name="DCDate",
+            id2_col_name="PIDN",
+            name=f"sec{i}",
+        )
+        for i, sec in enumerate(secondary, start=1)
+    ]
+    linked = prim_dset.date_proximity_many(
+        right_dsets=sec_dsets,
+        get="closest",
+        when="earlier_or_later",
+        days=90,
+        merge_suffixes=mp.get_option("operators.binary.column_suffixes"),
+        prepend_level_name=False,
+        # secondary Datasets with duplicates would not be merged
+        drop_duplicates=True,
+    )
+    return prim_dset, list(linked)
+
+
+def mergeable_anchored_list_merge(prim_dset, linked):
+    collection = mp.MergeableAnchoredList(prim_dset)
+    for sec_dset in linked:
+        collection.add_secondary(sec_dset)
+    collection.merge()
+    return collection.merged_dset
+
+
+def setup_masker(n_rows, seed):
+    primary, _ = make_cohort(n_rows, n_secondary=0, seed=seed)
+    # Masker looks up lowercase column names
+    primary.columns = primary.columns.str.lower()
+
+    pidn_map = MaskMap.from_id_range(1, int(primary["pidn"].max()), random_seed=seed)
+    instrid_map = MaskMap.from_id_range(
+        1, int(primary["instrid"].max()), day_shift=False, random_seed=seed
+    )
+    masker = Masker(pidn_map, "pidn", date_col_names="dcdate")
+    masker.add(instrid_map, "instrid")
+    return masker, primary
+
+
+def masker_mask_df(masker, df):
+    return masker.mask_df(df)
+
+
+# name: (setup function, benchmark function, benchmark keyword arguments)
+BENCHMARKS = {}
+
+for _get in ["all", "closest"]:
+    for _when in ["earlier", "later", "earlier_or_later"]:
+        BENCHMARKS[f"date_proximity[{_get}-{_when}]"] = (
+            setup_date_proximity,
+            date_proximity,
+            {"get": _get, "when": _when},
+        )
+
+for _keep in ["all", "earliest", "latest"]:
+    BENCHMARKS[f"group_by_keep_one[{_keep}]"] = (
+        setup_group_by_keep_one,
+        group_by_keep_one,
+        {"keep": _keep},
+    )
+
+BENCHMARKS["MergeableAnchoredList.merge"] = (
+    setup_mergeable_anchored_list,
+    mergeable_anchored_list_merge,
+    {},
+)
+
+BENCHMARKS["Masker.mask_df"] = (setup_masker, masker_mask_df, {})
+
+
+def get_peak_rss():
+    """Peak resident set size of this process in MiB, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def run_benchmark(name, n_rows, repeat, seed):
+    """Run one benchmark (meant to be in a new process) and return its
+    best wall time and peak RSS.
+    """
+    setup, func, kwargs = BENCHMARKS[name]
+    args = setup(n_rows, seed)
+
+    # benchmarks may modify their arguments (e.g. converting dates), so each
+    # run gets its own copy, made before measuring the memory used by the runs
+    runs = [[_copy(arg) for arg in args] for _ in range(repeat)]
+    del args
+
+    times = []
+    gc.collect()
+    rss_before = get_peak_rss()
+    while runs:
+        run_args = runs.pop()
+        start = timer()
+        func(*run_args, **kwargs)
+        times.append(timer() - start)
+        del run_args
+        gc.collect()
+    rss_after = get_peak_rss()
+
+    return {
+        "name": name,
+        "rows": n_rows,
+        "seconds": min(times),
+        "peak_mib": rss_after,
+        "added_mib": None if rss_after is None else rss_after - rss_before,
+    }
+
+
+def _copy(arg):
+    if isinstance(arg, list):
+        return [_copy(item) for item in arg]
+    return arg.copy() if hasattr(arg, "copy") else arg
+
+
+def run_all(names, rows, repeat=1, seed=0):
+    # "spawn" so each benchmark starts from a fresh process
+    context = multiprocessing.get_context("spawn")
+    for n_rows in rows:
+        for name in names:
+            with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as executor:
+                yield executor.submit(run_benchmark, name, n_rows, repeat, seed).result()
+
+
+def format_result(result):
+    def mib(value):
+        return "n/a" if value is None else f"{value:.1f}"
+
+    return (
+        f"{result['name']:<45} {result['rows']:>10} {result['seconds']:>10.3f} "
+        f"{mib(result['peak_mib']):>10} {mib(result['added_mib']):>10}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=DEFAULT_ROWS,
+        help="approximate number of primary rows of each cohort (e.g. 10000 up to 10000000)",
+    )
+    parser.add_argument(
+        "--filter",
+        nargs="+",
+        default=["*"],
+        help="only run benchmarks whose name matches one of these glob patterns",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="report the best of this many runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this json file")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in args.filter)
+    ]
+
+    if args.list:
+        print("\n".join(names))
+        return
+
+    print(f"{'benchmark':<45} {'rows':>10} {'seconds':>10} {'peak MiB':>10} {'added MiB':>10}")
+    results = []
+    for result in run_all(names, args.rows, repeat=args.repeat, seed=args.seed):
+        print(format_result(result), flush=True)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Generate synthetic longitudinal cohort data shaped like the data macpie links:
+a "primary" table of patient visits and "secondary" tables of assessments
+collected around those visits.
+
+python -m scripts.synthetic_cohort --patients 1000 --outdir /tmp/cohort
+"""
+
+import argparse
+import pathlib
+
+import numpy as np
+import pandas as pd
+
+START_DATE = pd.Timestamp("2005-01-01")
+
+
+def make_primary(
+    n_patients,
+    visits_per_patient=4,
+    visit_interval_days=365,
+    jitter_days=30,
+    duplicate_rate=0.0,
+    n_extra_cols=5,
+    seed=None,
+):
+    """
+    Create the primary table, with one row per patient visit.
+
+    Parameters
+    ----------
+    n_patients : int
+        Number of patients (``PIDN`` 1 to ``n_patients``)
+    visits_per_patient : float, default 4
+        Mean number of visits per patient (at least one each)
+    visit_interval_days : int, default 365
+        Mean number of days between visits of the same patient
+    jitter_days : int, default 30
+        Standard deviation of the number of days a visit is off schedule
+    duplicate_rate : float, default 0.0
+        Fraction of visits that have a second row with the same ``PIDN``
+        and ``DCDate`` (but a different ``InstrID``)
+    n_extra_cols : int, default 5
+        Number of data columns besides the id and date columns
+    seed : int, optional
+        Seed for :func:`numpy.random.default_rng`
+
+    Returns
+    -------
+    DataFrame
+        With columns ``InstrID`` (unique), ``PIDN``, ``DCDate`` and
+        ``Col1`` to ``Col<n_extra_cols>``, sorted by ``PIDN`` and ``DCDate``
+    """
+    rng = np.random.default_rng(seed)
+
+    n_visits = np.maximum(rng.poisson(visits_per_patient, n_patients), 1)
+    pidns = np.repeat(np.arange(1, n_patients + 1), n_visits)
+    visit_nums = _group_positions(n_visits)
+
+    first_visit = rng.integers(0, 15 * 365, n_patients)
+    days = (
+        np.repeat(first_visit, n_visits)
+        + visit_nums * visit_interval_days
+        + np.rint(rng.normal(0, jitter_days, len(pidns))).astype(np.int64)
+    )
+    dates = START_DATE + pd.to_timedelta(days, unit="D")
+
+    df = pd.DataFrame({"PIDN": pidns, "DCDate": dates})
+    df = df.drop_duplicates(ignore_index=True)
+
+    if duplicate_rate:
+        dups = df.sample(frac=duplicate_rate, random_state=rng.integers(2**32))
+        df = pd.concat([df, dups], ignore_index=True)
+        df = df.sort_values(["PIDN", "DCDate"], ignore_index=True)
+
+    df.insert(0, "InstrID", np.arange(1, len(df) + 1))
+
+    return _add_extra_cols(df, n_extra_cols, rng)
+
+
+def make_secondary(
+    primary,
+    collect_rate=0.8,
+    jitter_days=60,
+    duplicate_rate=0.01,
+    missing_date_rate=0.001,
+    unknown_id_rate=0.01,
+    n_extra_cols=20,
+    seed=None,
+):
+    """
+    Create a secondary table of assessments collected around the visits of
+    ``primary`` (see :func:`make_primary`).
+
+    Parameters
+    ----------
+    primary : DataFrame
+    collect_rate : float, default 0.8
+        Fraction of the visits with an assessment
+    jitter_days : int, default 60
+        Standard deviation of the number of days between a visit and its
+        assessment
+    duplicate_rate : float, default 0.01
+        Fraction of assessments that are entered twice
+    missing_date_rate : float, default 0.001
+        Fraction of assessments without a date
+    unknown_id_rate : float, default 0.01
+        Fraction of assessments of patients who are not in ``primary``
+    n_extra_cols : int, default 20
+        Number of data columns besides the id and date columns
+    seed : int, optional
+        Seed for :func:`numpy.random.default_rng`
+
+    Returns
+    -------
+    DataFrame
+        With columns ``InstrID`` (unique), ``PIDN``, ``DCDate`` and
+        ``Col1`` to ``Col<n_extra_cols>``, in random order
+    """
+    rng = np.random.default_rng(seed)
+
+    visits = primary[["PIDN", "DCDate"]]
+    visits = visits[rng.random(len(visits)) < collect_rate]
+    n = len(visits)
+
+    jitter = np.rint(rng.normal(0, jitter_days, n)).astype(np.int64)
+    df = pd.DataFrame(
+        {
+            "PIDN": visits["PIDN"].to_numpy(),
+            "DCDate": visits["DCDate"].to_numpy() + pd.to_timedelta(jitter, unit="D"),
+        }
+    )
+
+    unknown = rng.random(n) < unknown_id_rate
+    df.loc[unknown, "PIDN"] += primary["PIDN"].max()
+
+    if duplicate_rate:
+        dups = df.sample(frac=duplicate_rate, random_state=rng.integers(2**32))
+        df = pd.concat([df, dups], ignore_index=True)
+
+    df.loc[rng.random(len(df)) < missing_date_rate, "DCDate"] = pd.NaT
+
+    df = df.sample(frac=1, random_state=rng.integers(2**32), ignore_index=True)
+    df.insert(0, "InstrID", np.arange(1, len(df) + 1))
+
+    return _add_extra_cols(df, n_extra_cols, rng)
+
+
+def make_cohort(n_rows, n_secondary=1, seed=0, **kwargs):
+    """
+    Create a primary table of about ``n_rows`` rows and ``n_secondary``
+    secondary tables of assessments around its visits.
+
+    Keyword arguments are passed to :func:`make_primary`.
+
+    Returns
+    -------
+    tuple
+        ``(primary, [secondary, ...])``
+    """
+    visits_per_patient = kwargs.pop("visits_per_patient", 4)
+    n_patients = max(int(n_rows / visits_per_patient), 1)
+
+    primary = make_primary(
+        n_patients, visits_per_patient=visits_per_patient, seed=seed, **kwargs
+    )
+    secondary = [make_secondary(primary, seed=seed + i + 1) for i in range(n_secondary)]
+
+    return primary, secondary
+
+
+def _group_positions(group_sizes):
+    """Position of each row within its group, for consecutive groups of
+    ``group_sizes`` rows.
+    """
+    starts = np.repeat(np.cumsum(group_sizes) - group_sizes, group_sizes)
+    return np.arange(group_sizes.sum()) - starts
+
+
+def _add_extra_cols(df, n_extra_cols, rng):
+    n = len(df)
+    extra = {}
+    for i in range(1, n_extra_cols + 1):
+        if i % 3 == 1:
+            extra[f"Col{i}"] = rng.integers(0, 100, n)
+        elif i % 3 == 2:
+            extra[f"Col{i}"] = rng.normal(size=n)
+        else:
+            extra[f"Col{i}"] = pd.Categorical.from_codes(
+                rng.integers(0, 4, n), ["none", "mild", "moderate", "severe"]
+            ).astype(object)
+    return pd.concat([df, pd.DataFrame(extra, index=df.index)], axis=1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic cohort to csv files.")
+    parser.add_argument("--rows", type=int, default=10_000, help="rows of the primary file")
+    parser.add_argument("--secondary", type=int, default=1, help="number of secondary files")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--outdir", type=pathlib.Path, default=pathlib.Path.cwd())
+    args = parser.parse_args()
+
+    primary, secondary = make_cohort(args.rows, n_secondary=args.secondary, seed=args.seed)
+
+    args.outdir.mkdir(parents=True, exist_ok=True)
+    primary.to_csv(args.outdir / "primary.csv", index=False)
+    for i, sec in enumerate(secondary, start=1):
+        sec.to_csv(args.outdir / f"secondary{i}.csv", index=False)
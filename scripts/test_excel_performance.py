@@ -1,5 +1,8 @@
 """
 python -m scripts.test_excel_performance
+
+Uses ``scripts/df_large.csv`` if it exists, or else a synthetic primary table
+(see :mod:`scripts.synthetic_cohort`) with duplicates to highlight.
 """
 
 import io
@@ -11,10 +14,18 @@ from timeit import default_timer as timer
 import pandas as pd
 
 import macpie as mp
+from scripts.synthetic_cohort import make_cohort
 
 
 def load_csv():
-    rawdata = pkgutil.get_data(__package__, "df_large.csv")
+    try:
+        rawdata = pkgutil.get_data(__package__, "df_large.csv")
+    except FileNotFoundError:
+        primary, _ = make_cohort(50_000, n_secondary=0, duplicate_rate=0.05)
+        primary[mp.get_option("column.system.duplicates")] = primary.duplicated(
+            ["PIDN", "DCDate"], keep=False
+        )
+        return primary
     csvdata = rawdata.decode("utf-8")
     csvstream = io.StringIO(csvdata)
     df = pd.read_csv(csvstream)
@@ -1,6 +1,7 @@
 import pathlib
 
 import click
+import pandas as pd
 
 from macpie import BasicList, Dataset, MACPieExcelWriter, pathtools
 from macpie._config import get_option
@@ -13,10 +14,14 @@ from macpie.cli.helpers import get_client_system_info
     "-k",
     "--keep",
     default="all",
-    type=click.Choice(
-        ["all", "earliest", "latest"],
-        case_sensitive=False,
-    ),
+    metavar="[all|earliest|latest|N|START:STOP[:STEP]]",
+    callback=lambda ctx, param, value: parse_keep(value),
+)
+@click.option(
+    "--per",
+    default=None,
+    metavar="FREQ",
+    callback=lambda ctx, param, value: parse_per(value),
 )
 @click.argument(
     "primary",
@@ -24,7 +29,7 @@ from macpie.cli.helpers import get_client_system_info
     type=click.Path(exists=True, file_okay=True, dir_okay=True, path_type=pathlib.Path),
 )
 @pass_results_resource
-def keepone(results_resource, keep, primary):
+def keepone(results_resource, keep, per, primary):
     """
     This command groups rows that have the same :option:`--id2-col` value, and
     allows you to keep only the earliest or latest row in each group as
@@ -56,7 +61,7 @@ def keepone(results_resource, keep, primary):
             name=filepath.stem,
         )
 
-        dset = dset.group_by_keep_one(keep=keep, drop_duplicates=False)
+        dset = dset.group_by_keep_one(keep=keep, drop_duplicates=False, per=per)
 
         if get_option("column.system.duplicates") in dset.columns:
             dset.add_tag(Dataset.tag_duplicates)
@@ -67,3 +72,52 @@ def keepone(results_resource, keep, primary):
         collection.to_excel(writer)
         results_resource.get_command_info().to_excel(writer)
         get_client_system_info().to_excel(writer)
+
+
+def parse_keep(value):
+    """Convert a :option:`--keep` value to a ``keep`` option of
+    :meth:`Dataset.group_by_keep_one`, i.e. a string, int or slice.
+    """
+    value = value.strip().lower()
+    if value in ["all", "earliest", "latest"]:
+        return value
+
+    try:
+        if ":" in value:
+            parts = value.split(":")
+            if len(parts) > 3:
+                raise ValueError
+            keep = slice(*(int(part) if part.strip() else None for part in parts))
+        else:
+            keep = int(value)
+    except ValueError as e:
+        raise click.BadParameter(
+            f"{value!r} is not 'all', 'earliest', 'latest', an integer or a slice "
+            "(e.g. '0:3')",
+            param_hint="'-k' / '--keep'",
+        ) from e
+
+    if isinstance(keep, slice) and keep.step is not None and keep.step <= 0:
+        raise click.BadParameter(
+            f"{value!r} is not a valid slice, its step must be positive",
+            param_hint="'-k' / '--keep'",
+        )
+    return keep
+
+
+def parse_per(value):
+    """Validate a :option:`--per` value as a ``per`` option of
+    :meth:`Dataset.group_by_keep_one`, i.e. a period frequency.
+    """
+    if value is None:
+        return None
+
+    value = value.strip()
+    try:
+        pd.Period("2000-01-01", freq=value)
+    except ValueError as e:
+        raise click.BadParameter(
+            f"{value!r} is not a period frequency (e.g. 'Y' for year or 'M' for month)",
+            param_hint="'--per'",
+        ) from e
+    return value
@@ -48,6 +48,13 @@ NEW_ID_COL_NAME = "link_id"
     default=get_option("dataset.id2_col_name"),
     help="Secondary ID2 Column Header",
 )
+@click.option(
+    "-e",
+    "--engine",
+    default="merge",
+    type=click.Choice(["merge", "interval"], case_sensitive=False),
+)
+@click.option("--n-jobs", default=1, type=int)
 @click.option("--merge-results/--no-merge-results", default=True)
 @click.option("--keep-original/--no-keep-original", default=False)
 @click.argument(
@@ -70,6 +77,8 @@ def link(
     secondary_id_col,
     secondary_date_col,
     secondary_id2_col,
+    engine,
+    n_jobs,
     merge_results,
     keep_original,
     primary,
@@ -123,30 +132,50 @@ def link(
     collection = MergeableAnchoredList(prim_dset)
 
     if secondary:
-        for sec in secondary:
-            try:
-                sec_dset = Dataset.from_file(
-                    sec,
-                    id_col_name=secondary_id_col,
-                    date_col_name=secondary_date_col,
-                    id2_col_name=secondary_id2_col,
-                    name=sec.stem,
-                )
-
-                sec_dset_linked = prim_dset.date_proximity(
-                    right_dset=sec_dset,
-                    get=secondary_get,
-                    when=secondary_when,
-                    days=secondary_days,
-                    merge_suffixes=get_option("operators.binary.column_suffixes"),
-                    prepend_level_name=False,
-                )
-
-                collection.add_secondary(sec_dset_linked)
-            except Exception as e:
-                click.echo(f'\nERROR loading secondary dataset "{sec}"\n')
+        # the secondary file being linked, for error messages
+        linking = None
+
+        def read_secondary():
+            nonlocal linking
+            for sec in secondary:
+                linking = None
+                try:
+                    sec_dset = Dataset.from_file(
+                        sec,
+                        id_col_name=secondary_id_col,
+                        date_col_name=secondary_date_col,
+                        id2_col_name=secondary_id2_col,
+                        name=sec.stem,
+                    )
+                except Exception as e:
+                    click.echo(f'\nERROR loading secondary dataset "{sec}"\n')
+                    click.echo(e)
+                    raise (e)
+                linking = sec
+                yield sec_dset
+            linking = None
+
+        try:
+            # the primary is only prepared once for all secondary datasets
+            sec_dsets_linked = prim_dset.date_proximity_many(
+                right_dsets=read_secondary(),
+                get=secondary_get,
+                when=secondary_when,
+                days=secondary_days,
+                merge_suffixes=get_option("operators.binary.column_suffixes"),
+                prepend_level_name=False,
+                engine=engine,
+                n_jobs=n_jobs,
+            )
+        except Exception as e:
+            # errors loading a secondary dataset are reported by read_secondary
+            if linking is not None:
+                click.echo(f'\nERROR linking secondary dataset "{linking}"\n')
                 click.echo(e)
-                raise (e)
+            raise (e)
+
+        for sec_dset_linked in sec_dsets_linked:
+            collection.add_secondary(sec_dset_linked)
 
     with MACPieExcelWriter(results_resource.create_results_filepath()) as writer:
         collection.to_excel(writer, merge=merge_results)
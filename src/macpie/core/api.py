@@ -3,11 +3,12 @@
 # classes
 from macpie.core.dataset import Dataset, LavaDataset
 from macpie.core.datasetfields import DatasetFields
+from macpie.core.linkindex import LinkIndex
 
 # from macpie.core.macseries import MacSeries
 
 # functions
-from macpie.core.combine import date_proximity
+from macpie.core.combine import date_proximity, date_proximity_many
 from macpie.core.groupby import group_by_keep_one
 
 # collections
@@ -1,10 +1,25 @@
 import collections
 import itertools
 from abc import abstractmethod
+from typing import NamedTuple
 
 from macpie.tools import tablibtools
 
 
+class _FieldIndex(NamedTuple):
+    """Lookups of the fields of a collection."""
+
+    #: Position of each field in :attr:`BaseCollection.all_fields`
+    #: (of its first occurrence)
+    positions: dict
+
+    #: Set of :attr:`BaseCollection.key_fields`
+    key_fields: frozenset
+
+    #: Set of :attr:`BaseCollection.sys_fields`
+    sys_fields: frozenset
+
+
 class BaseCollection(collections.abc.Collection):
     """Abstract base class for all collections."""
 
@@ -42,6 +57,45 @@ class BaseCollection(collections.abc.Collection):
         all_fields_lists = [dset.all_fields for dset in self]
         return list(itertools.chain.from_iterable(all_fields_lists))
 
+    def _get_field_index(self) -> _FieldIndex:
+        """A ``_FieldIndex`` to look up the fields of this collection
+        in constant time. It is cached until the Datasets of this collection
+        (or their columns) change.
+        """
+        state = self._field_index_state()
+        cached = getattr(self, "_field_index", None)
+        if cached is not None and _same_state(cached[0], state):
+            return cached[1]
+
+        positions = {}
+        for position, field in enumerate(self.all_fields):
+            positions.setdefault(field, position)
+
+        field_index = _FieldIndex(
+            positions=positions,
+            key_fields=frozenset(self.key_fields),
+            sys_fields=frozenset(self.sys_fields),
+        )
+        self._field_index = (state, field_index)
+        return field_index
+
+    def _field_index_state(self):
+        """The objects the fields of this collection are derived from.
+        Any of them being replaced (e.g. new columns) invalidates the
+        cached ``_FieldIndex``.
+        """
+        return [
+            (
+                dset,
+                dset.columns,
+                dset.name,
+                dset.id_col_name,
+                dset.date_col_name,
+                dset.id2_col_name,
+            )
+            for dset in self
+        ]
+
     @abstractmethod
     def to_excel_dict(self):
         return {"class_name": self.__class__.__name__}
@@ -56,3 +110,11 @@ class BaseCollection(collections.abc.Collection):
                 for record in dset.history:
                     info.append((dset.name, record))
         return info
+
+
+def _same_state(state, other):
+    # by identity: Datasets and Indexes don't compare with == as a bool
+    return len(state) == len(other) and all(
+        len(items) == len(other_items) and all(a is b for a, b in zip(items, other_items))
+        for items, other_items in zip(state, other)
+    )
@@ -3,7 +3,7 @@ from collections import UserList
 from macpie.core.dataset import Dataset
 from macpie.core.datasetfields import DatasetFields
 from macpie.core.collections.base import BaseCollection
-from macpie.io.excel._base import MACPieExcelFile
+from macpie.io.excel._base import MACPieExcelFile, MACPieExcelWriter
 
 
 class BasicList(UserList, BaseCollection):
@@ -49,16 +49,35 @@ class BasicList(UserList, BaseCollection):
         else:
             return BasicList(new_list)
 
-    def to_excel(self, excel_writer, write_excel_dict=True, **kwargs):
+    def to_excel(self, excel_writer, write_excel_dict=True, streaming=None, **kwargs):
         """Write :class:`BasicList` to an Excel file by calling
         :meth:`macpie.Dataset.to_excel` on each :class:`macpie.Dataset`
         in this list.
-        """
-        for dset in self.data:
-            dset.to_excel(excel_writer, **kwargs)
 
-        if write_excel_dict:
-            excel_writer.write_excel_dict(self.to_excel_dict())
+        ``excel_writer`` can be a :class:`macpie.MACPieExcelWriter` or a path,
+        in which case a writer is created (with the ``engine``, ``storage_options``
+        and ``streaming`` options, see :class:`macpie.MACPieExcelWriter`) and closed.
+        """
+        if isinstance(excel_writer, MACPieExcelWriter):
+            need_save = False
+        else:
+            excel_writer = MACPieExcelWriter(
+                excel_writer,
+                engine=kwargs.get("engine"),
+                storage_options=kwargs.get("storage_options"),
+                streaming=streaming,
+            )
+            need_save = True
+
+        try:
+            for dset in self.data:
+                dset.to_excel(excel_writer, **kwargs)
+
+            if write_excel_dict:
+                excel_writer.write_excel_dict(self.to_excel_dict())
+        finally:
+            if need_save:
+                excel_writer.close()
 
     def to_excel_dict(self):
         """Convert the :class:`BasicList` to a dictionary."""
@@ -91,10 +110,15 @@ class BasicList(UserList, BaseCollection):
         ]
 
     @classmethod
-    def from_excel_dict(cls, excel_file: MACPieExcelFile, excel_dict):
+    def from_excel_dict(cls, excel_file: MACPieExcelFile, excel_dict, lazy=False):
+        """Construct :class:`BasicList` from an Excel file.
+
+        :param lazy: If True, the Datasets are :class:`macpie.LazyDataset` proxies
+                     that only parse their sheet when used. Defaults to False.
+        """
         instance = cls()
         excel_dict_dsets = BasicList.excel_dict_dsets(excel_dict)
         for dset_excel_dict in excel_dict_dsets:
-            dset = excel_file.parse(sheet_name=dset_excel_dict["excel_sheetname"])
+            dset = excel_file.parse(sheet_name=dset_excel_dict["excel_sheetname"], lazy=lazy)
             instance.append(dset)
         return instance
@@ -3,6 +3,7 @@ import warnings
 from collections import defaultdict
 
 import numpy as np
+import pandas as pd
 
 from macpie._config import get_option
 from macpie.core.collections.anchoredlist import AnchoredList
@@ -99,14 +100,16 @@ class MergeableAnchoredList(AnchoredList):
         in this :class:`MergeableAnchoredList`.
         """
         key_fields = super().key_fields
-        prim_anchor_field = (self._primary.name, self._primary_anchor_col)
-        if self._primary_anchor_col and prim_anchor_field not in key_fields:
-            key_fields.append(prim_anchor_field)
+        seen = set(key_fields)
+        anchor_fields = []
+        if self._primary_anchor_col:
+            anchor_fields.append((self._primary.name, self._primary_anchor_col))
         if self._secondary_anchor_col:
-            for sec in self._secondary:
-                sec_anchor_field = (sec.name, self._secondary_anchor_col)
-                if sec_anchor_field not in key_fields:
-                    key_fields.append(sec_anchor_field)
+            anchor_fields.extend((sec.name, self._secondary_anchor_col) for sec in self._secondary)
+        for anchor_field in anchor_fields:
+            if anchor_field not in seen:
+                seen.add(anchor_field)
+                key_fields.append(anchor_field)
         return key_fields
 
     @property
@@ -127,6 +130,11 @@ class MergeableAnchoredList(AnchoredList):
                 fields.extend(sec.all_fields)
         return fields
 
+    def _field_index_state(self):
+        state = super()._field_index_state()
+        state.append((self._primary_anchor_col, self._secondary_anchor_col))
+        return state
+
     def add_secondary(self, dset: Dataset):
         """Append `dset` to :attr:`MergeableAnchoredList.secondary`."""
         if self._secondary_anchor_col not in dset.columns:
@@ -162,14 +170,14 @@ class MergeableAnchoredList(AnchoredList):
         fields_to_include = []
         selected_dsets = selected_fields.unique_datasets
 
+        key_fields = self.key_fields
+
         if self._primary.name not in selected_dsets:
             fields_to_include.extend(
-                field for field in self.key_fields if field[0] == self._primary.name
+                field for field in key_fields if field[0] == self._primary.name
             )
 
-        fields_to_include.extend(
-            [field for field in self.key_fields if field[0] in selected_dsets]
-        )
+        fields_to_include.extend([field for field in key_fields if field[0] in selected_dsets])
         fields_to_include.extend(
             [field for field in self.sys_fields if field[0] in selected_dsets]
         )
@@ -198,6 +206,16 @@ class MergeableAnchoredList(AnchoredList):
 
         merged_dset = self._primary.prepend_level(self._primary.name)
         merged_dset.clear_tags()
+        merged_dset.index = pd.RangeIndex(len(merged_dset))
+
+        primary_anchor_col = merged_dset.mac.get_col_name(
+            (self._primary.name, self._primary_anchor_col)
+        )
+
+        # the rows of each secondary Dataset matching each row of the primary,
+        # which are all concatenated at once at the end
+        blocks = [merged_dset]
+        merged_cols = set(merged_dset.columns)
 
         mergeable_secondary = self._secondary.filter(MergeableAnchoredList.tag_mergeable)
 
@@ -216,14 +234,33 @@ class MergeableAnchoredList(AnchoredList):
                         suffs_prefix="_",
                     )
 
-                merged_dset = merged_dset.mac.merge(
-                    sec.copy(deep=True),
-                    left_on=[(self._primary.name, self._primary_anchor_col)],
-                    right_on=[self._secondary_anchor_col],
-                    add_indexes=(None, sec.name),
-                )
+                sec_cols = [(sec.name, col) for col in sec.columns]
+                if merged_cols.intersection(sec_cols):
+                    # same Dataset name as one already merged, so merge the
+                    # usual way to get the columns suffixed like a merge does
+                    # (merge relabels the columns of the Dataset it is given)
+                    merged_dset = pd.concat(blocks, axis=1, copy=False).mac.merge(
+                        sec.copy(deep=False),
+                        left_on=[primary_anchor_col],
+                        right_on=[self._secondary_anchor_col],
+                        add_indexes=(None, sec.name),
+                    )
+                    blocks = [merged_dset]
+                    merged_cols = set(merged_dset.columns)
+                else:
+                    block = _take_anchored_rows(
+                        sec,
+                        sec.mac.get_col_name(self._secondary_anchor_col),
+                        merged_dset[primary_anchor_col],
+                    )
+                    block.columns = pd.MultiIndex.from_tuples(sec_cols)
+                    blocks.append(block)
+                    merged_cols.update(sec_cols)
                 sec.add_tag(MergeableAnchoredList.tag_merged)
 
+        if len(blocks) > 1:
+            merged_dset = pd.concat(blocks, axis=1, copy=False)
+
         # reset index to start from 1 for user readability
         start_index = 1
         merged_dset.index = np.arange(start_index, len(merged_dset) + start_index)
@@ -336,14 +373,46 @@ class MergeableAnchoredList(AnchoredList):
         _primary_anchor_col = None
         _secondary_anchor_col = None
         _selected_fields = selected_fields if len(selected_fields) > 0 else None
+        _primary_anchor_col = excel_dict["primary_anchor_col"]
+        _secondary_anchor_col = excel_dict["secondary_anchor_col"]
+
+        # only read the columns that will be kept when merging the selected fields
+        col_filters = {}
+        if _selected_fields is not None:
+            selected_cols = _selected_fields.to_dict()
+            primary_name = excel_dict["primary"]["name"]
+            col_filters[primary_name] = _make_col_filter(
+                excel_dict["primary"], selected_cols.get(primary_name, []), _primary_anchor_col
+            )
+            for dset_dict in secondary_excel_dict["dsets"]:
+                if dset_dict["name"] in selected_cols:
+                    col_filters[dset_dict["name"]] = _make_col_filter(
+                        dset_dict, selected_cols[dset_dict["name"]], _secondary_anchor_col
+                    )
+
+        def parse(sheet_name, dset_name, **kwargs):
+            col_filter = col_filters.get(dset_name)
+            if col_filter is not None:
+                kwargs["col_filter"] = col_filter
+            return excel_file.parse(sheet_name=sheet_name, **kwargs)
 
         if excel_dict["merged"] is None:
-            _primary = excel_file.parse(sheet_name=excel_dict["primary"]["excel_sheetname"])
+            _primary = parse(
+                excel_dict["primary"]["excel_sheetname"], excel_dict["primary"]["name"]
+            )
         else:
+            merged_col_filter = None
+            if col_filters:
+
+                def merged_col_filter(label):
+                    col_filter = col_filters.get(label[0])
+                    return col_filter is None or col_filter(label[1])
+
             merged_dset = excel_file.parse(
                 sheet_name=excel_dict["merged"]["excel_sheetname"],
                 index_col=0,
                 header=[0, 1],
+                col_filter=merged_col_filter,
             )
 
             _primary = merged_dset.cross_section(excel_dict["primary"])
@@ -363,14 +432,11 @@ class MergeableAnchoredList(AnchoredList):
         )
 
         for dset_dict in filtered_secondary_dict:
-            secondary_dset = excel_file.parse(sheet_name=dset_dict["excel_sheetname"])
+            secondary_dset = parse(dset_dict["excel_sheetname"], dset_dict["name"])
             secondary_dset.clear_tags()
             secondary_dset.drop_sys_cols()
             _secondary.append(secondary_dset)
 
-        _primary_anchor_col = excel_dict["primary_anchor_col"]
-        _secondary_anchor_col = excel_dict["secondary_anchor_col"]
-
         instance = cls(
             primary=_primary,
             secondary=_secondary,
@@ -379,3 +445,41 @@ class MergeableAnchoredList(AnchoredList):
             selected_fields=_selected_fields,
         )
         return instance
+
+
+def _make_col_filter(dset_dict, selected_cols, anchor_col):
+    """
+    A ``col_filter`` for :func:`macpie.read_excel` that keeps ``selected_cols``
+    of the Dataset defined by ``dset_dict``, along with its key columns,
+    ``anchor_col`` and any system columns.
+    """
+    cols = set(selected_cols)
+    cols.update(
+        col
+        for col in (
+            dset_dict["id_col_name"],
+            dset_dict["date_col_name"],
+            dset_dict["id2_col_name"],
+            anchor_col,
+        )
+        if col is not None
+    )
+    sys_col_prefix = get_option("column.system.prefix")
+    return lambda col: col in cols or (isinstance(col, str) and col.startswith(sys_col_prefix))
+
+
+def _take_anchored_rows(dset, anchor_col, anchors):
+    """
+    The rows of ``dset`` whose ``anchor_col`` value matches each of ``anchors``,
+    with missing values where there is no match, like the right side of a left
+    merge on those columns. The values of ``anchor_col`` must be unique.
+    """
+    indexer = pd.Index(dset[anchor_col]).get_indexer(anchors)
+
+    # a shallow copy, to reindex by position without copying all of the data
+    # twice (reindexing adds the missing rows with the dtypes a merge would have)
+    result = dset.copy(deep=False)
+    result.index = pd.RangeIndex(len(result))
+    result = result.reindex(indexer)
+    result.index = anchors.index
+    return result
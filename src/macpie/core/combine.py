@@ -1,3 +1,7 @@
+from typing import Iterable, List
+
+from pandas.api.types import is_datetime64_any_dtype
+
 from macpie._config import get_option
 from macpie.core.dataset import Dataset
 
@@ -13,6 +17,10 @@ def date_proximity(
     duplicates_indicator: bool = False,
     merge_suffixes=get_option("operators.binary.column_suffixes"),
     prepend_level_name: bool = True,
+    engine: str = "merge",
+    partitions: int = None,
+    n_jobs: int = None,
+    link_index=None,
 ) -> None:
     """Links data across two :class:`Dataset` objects by date proximity,
     first joining them on their :attr:`Dataset.id2_col_name`.
@@ -64,6 +72,14 @@ def date_proximity(
         Whether to add a top-level index using the :attr:`Dataset.name` attribute
         to column indexes in ``left`` and ``right`` respectively (thus
         creating a :class:`pandas.MultiIndex` if needed).
+    engine : {'merge', 'interval'}, default 'merge'
+        See :func:`macpie.pandas.date_proximity`
+    partitions : int, optional
+        See :func:`macpie.pandas.date_proximity`
+    n_jobs : int, optional
+        See :func:`macpie.pandas.date_proximity`
+    link_index : LinkIndex, optional
+        A :class:`LinkIndex` built from ``left`` with :meth:`LinkIndex.from_dataset`
     """
 
     if prepend_level_name:
@@ -90,8 +106,95 @@ def date_proximity(
         merge="partial",
         merge_suffixes=merge_suffixes,
         prepend_levels=prepend_levels,
+        engine=engine,
+        partitions=partitions,
+        n_jobs=n_jobs,
+        link_index=link_index,
     )
 
+    return _to_linked_dataset(result_df, right, prepend_level_name)
+
+    # right.set_df(result_df)
+
+
+def date_proximity_many(
+    left: Dataset,
+    rights: Iterable[Dataset],
+    get: str = "all",
+    when: str = "earlier_or_later",
+    days: int = 90,
+    dropna: bool = False,
+    drop_duplicates: bool = False,
+    duplicates_indicator: bool = False,
+    merge_suffixes=get_option("operators.binary.column_suffixes"),
+    prepend_level_name: bool = True,
+    engine: str = "merge",
+    partitions: int = None,
+    n_jobs: int = None,
+    link_index=None,
+) -> List[Dataset]:
+    """Links data across ``left`` and each :class:`Dataset` in ``rights``
+    by date proximity.
+
+    Same as calling :func:`date_proximity` once for every Dataset in ``rights``,
+    except that ``left`` is only validated and prepared once.
+
+    This is the :class:`Dataset` analog of :func:`macpie.pandas.date_proximity_many`.
+
+    Parameters
+    ----------
+    left : Dataset
+        Contains the timepoint anchor (i.e. `date_col`)
+    rights : iterable of Dataset
+        The Datasets to link, one at a time.
+
+    See :func:`date_proximity` for the other parameters.
+
+    Returns
+    -------
+    List[Dataset]
+        A linked Dataset for each Dataset in ``rights``.
+    """
+
+    from macpie.pandas.combine import date_proximity_many
+
+    rights = list(rights)
+    results = date_proximity_many(
+        left,
+        rights,
+        rights_options=[
+            {
+                "id_right_on": right.id2_col_name,
+                "date_right_on": right.date_col_name,
+                "right_level": right.name if prepend_level_name else None,
+            }
+            for right in rights
+        ],
+        id_left_on=left.id2_col_name,
+        date_left_on=left.date_col_name,
+        get=get,
+        when=when,
+        days=days,
+        left_link_id=left.id_col_name,
+        dropna=dropna,
+        drop_duplicates=drop_duplicates,
+        duplicates_indicator=duplicates_indicator,
+        merge="partial",
+        merge_suffixes=merge_suffixes,
+        prepend_levels=(left.name if prepend_level_name else None, None),
+        engine=engine,
+        partitions=partitions,
+        n_jobs=n_jobs,
+        link_index=link_index,
+    )
+
+    return [
+        _to_linked_dataset(result, right, prepend_level_name)
+        for result, right in zip(results, rights)
+    ]
+
+
+def _to_linked_dataset(result_df, right: Dataset, prepend_level_name: bool) -> Dataset:
     if prepend_level_name:
         new_id_col_name = (right.name, right.id_col_name)
         new_date_col_name = (right.name, right.date_col_name)
@@ -101,12 +204,21 @@ def date_proximity(
         new_date_col_name = right.date_col_name
         new_id2_col_name = right.id2_col_name
 
-    return Dataset(
+    new_col_names = (new_id_col_name, new_date_col_name, new_id2_col_name)
+
+    # the columns come from ``right`` and were already validated there, so only
+    # go through the validating constructor if they didn't survive the linking
+    # as is (e.g. were suffixed)
+    dataset_constructor = Dataset
+    if all(col is None or col in result_df.columns for col in new_col_names) and (
+        new_date_col_name is None or is_datetime64_any_dtype(result_df[new_date_col_name])
+    ):
+        dataset_constructor = Dataset.wrap
+
+    return dataset_constructor(
         result_df,
         id_col_name=new_id_col_name,
         date_col_name=new_date_col_name,
         id2_col_name=new_id2_col_name,
         name=right.name,
     )
-
-    # right.set_df(result_df)
@@ -69,6 +69,23 @@ cf.register_option(
 
 cf.register_option("excel.writer.engine", "mp_xlsxwriter", "", validator=pandas_cf.is_str)
 
+cf.register_option("excel.writer.streaming", False, "", validator=pandas_cf.is_bool)
+
+cf.register_option(
+    "excel.writer.autofit_sample_size", None, "", validator=pandas_cf.is_nonnegative_int
+)
+
+cf.register_option(
+    "excel.reader.engine",
+    "mp_openpyxl",
+    "",
+    validator=pandas_cf.is_one_of_factory(["auto", "mp_openpyxl", "mp_calamine"]),
+)
+
+cf.register_option(
+    "excel.reader.max_parsed_sheets", 10, "", validator=pandas_cf.is_nonnegative_int
+)
+
 cf.register_option("excel.row_index_header", "Original_Order", "", validator=pandas_cf.is_str)
 
 cf.register_option("excel.sheet_name.default", "_mp_sheet", "", validator=pandas_cf.is_str)
@@ -76,3 +93,12 @@ cf.register_option("excel.sheet_name.default", "_mp_sheet", "", validator=pandas
 cf.register_option(
     "operators.binary.column_suffixes", ("_x", "_y"), "", validator=cf.is_tuple_of_two
 )
+
+cf.register_option("operators.dates.fractional_days", True, "", validator=pandas_cf.is_bool)
+
+cf.register_option(
+    "history.mode",
+    "light",
+    "",
+    validator=pandas_cf.is_one_of_factory(["off", "light", "full"]),
+)
@@ -73,9 +73,26 @@ class Dataset(pd.DataFrame):
         "_display_name_generator",
     ]
 
+    # metadata naming a column
+    _col_name_metadata = frozenset(["_id_col_name", "_date_col_name", "_id2_col_name"])
+
     #: Tag that denotes this Dataset has duplicates
     tag_duplicates = "duplicates"
 
+    _fast_setattrs = frozenset(
+        [
+            "id_col_name",
+            "date_col_errors",
+            "date_col_name",
+            "id2_col_name",
+            "name",
+            "tags",
+            "display_name_generator",
+            "_method_history",
+        ]
+        + _metadata
+    )
+
     def __init__(
         self,
         data=None,
@@ -109,7 +126,9 @@ class Dataset(pd.DataFrame):
         # Specifically, avoids the the following warning:
         # UserWarning: Pandas doesn't allow columns to be created via a new attribute name -
         # see https://pandas.pydata.org/pandas-docs/stable/indexing.html#attribute-access
-        if attr in ("id_col_name", "date_col_name", "id2_col_name", "tags", "_method_history"):
+        # The metadata is set the way pandas would (after first looking for a
+        # column of the same name), without pandas' slower lookups.
+        if attr in Dataset._fast_setattrs:
             object.__setattr__(self, attr, val)
         else:
             super().__setattr__(attr, val)
@@ -581,6 +600,7 @@ class Dataset(pd.DataFrame):
         storage_options=None,
         write_excel_dict=True,
         highlight_duplicates=True,
+        streaming=None,
         **kwargs,
     ) -> None:
         """Write :class:`Dataset` to an Excel sheet.
@@ -597,6 +617,10 @@ class Dataset(pd.DataFrame):
         highlight_duplicates : bool, default True
             Whether to highlight any duplicate rows. Only applies to Datasets with a
             ``_mp_duplicates`` column where the row value is ``True``.
+        streaming : bool, optional
+            If ``excel_writer`` is not a :class:`MACPieExcelWriter`, whether
+            to write the file row by row in constant memory. See
+            :class:`MACPieExcelWriter`.
         **kwargs
             All remaining keyword arguments are passed through to the underlying
             :meth:`pandas.DataFrame.to_excel` method.
@@ -617,6 +641,7 @@ class Dataset(pd.DataFrame):
                 excel_writer,
                 engine=engine,
                 storage_options=storage_options,
+                streaming=streaming,
             )
             need_save = True
 
@@ -729,6 +754,59 @@ class Dataset(pd.DataFrame):
             tags=kwargs.get("tags"),
         )
 
+    @classmethod
+    def wrap(
+        cls,
+        df,
+        id_col_name=None,
+        date_col_name=None,
+        id2_col_name=None,
+        name=None,
+        tags=None,
+        display_name_generator=None,
+        date_col_errors="raise",
+    ) -> "Dataset":
+        """
+        Construct :class:`Dataset` from a DataFrame and metadata that is
+        already known to be valid.
+
+        Unlike the constructor, the data of ``df`` is not copied and the
+        metadata is not validated: column names are not looked up
+        (so they must match exactly) and ``date_col_name`` is not
+        converted to ``datetime``. Use this when the metadata comes from
+        another :class:`Dataset`, e.g. for the result of an operation on it.
+
+        Parameters
+        ----------
+        df : DataFrame
+            The DataFrame containing the data. The returned Dataset shares
+            its data, as with ``Dataset(df)``.
+        id_col_name, date_col_name, id2_col_name : str (optional)
+            Columns of ``df``, see :class:`Dataset`.
+        name, tags, display_name_generator, date_col_errors : optional
+            See :class:`Dataset`.
+
+        Examples
+        --------
+        >>> dates = pd.to_datetime(["1/1/2001", "2/2/2002"])
+        >>> df = pd.DataFrame({"pidn": [1, 2], "dcdate": dates})
+        >>> dset = mp.Dataset.wrap(df, date_col_name="dcdate", id2_col_name="pidn", name="cdr")
+        >>> dset.date_col_name, dset.name
+        ('dcdate', 'cdr')
+        """
+        dset = cls._from_mgr(df._mgr)
+        dset._id_col_name = id_col_name
+        dset._date_col_errors = date_col_errors
+        dset._date_col_name = date_col_name
+        dset._id2_col_name = id2_col_name
+        if name:
+            dset._name = name
+        if tags is not None:
+            dset._tags = list(tags)
+        if display_name_generator is not None:
+            dset.display_name_generator = display_name_generator
+        return dset
+
     # -------------------------------------------------------------------------
     # Data Transformation Methods
     # -------------------------------------------------------------------------
@@ -745,6 +823,10 @@ class Dataset(pd.DataFrame):
         duplicates_indicator: bool = False,
         merge_suffixes=get_option("operators.binary.column_suffixes"),
         prepend_level_name: bool = True,
+        engine: str = "merge",
+        partitions: int = None,
+        n_jobs: int = None,
+        link_index=None,
     ) -> None:
         """
         Links data across this :class:`Dataset` and ``right_dset``,
@@ -766,10 +848,84 @@ class Dataset(pd.DataFrame):
             duplicates_indicator=duplicates_indicator,
             merge_suffixes=merge_suffixes,
             prepend_level_name=prepend_level_name,
+            engine=engine,
+            partitions=partitions,
+            n_jobs=n_jobs,
+            link_index=link_index,
+        )
+
+    def date_proximity_many(
+        self,
+        right_dsets,
+        get: str = "all",
+        when: str = "earlier_or_later",
+        days: int = 90,
+        dropna: bool = False,
+        drop_duplicates: bool = False,
+        duplicates_indicator: bool = False,
+        merge_suffixes=get_option("operators.binary.column_suffixes"),
+        prepend_level_name: bool = True,
+        engine: str = "merge",
+        partitions: int = None,
+        n_jobs: int = None,
+        link_index=None,
+    ) -> list:
+        """
+        Links data across this :class:`Dataset` and each Dataset in
+        ``right_dsets``, only preparing this Dataset once.
+
+        Calls :func:`macpie.date_proximity_many`, passing in this Dataset as
+        the "left" Dataset.
+
+        Like calling :meth:`date_proximity` for each Dataset, it adds a
+        ``date_proximity`` record naming that Dataset to :attr:`history`.
+        """
+        from macpie.core.combine import date_proximity_many
+
+        def recorded_right_dsets():
+            for right_dset in right_dsets:
+                # the record spans the linking of right_dset, until the next one is requested
+                with MethodHistory.record(
+                    self,
+                    "date_proximity",
+                    (self,),
+                    {
+                        "right_dset": right_dset,
+                        "get": get,
+                        "when": when,
+                        "days": days,
+                        "dropna": dropna,
+                        "drop_duplicates": drop_duplicates,
+                        "duplicates_indicator": duplicates_indicator,
+                        "merge_suffixes": merge_suffixes,
+                        "prepend_level_name": prepend_level_name,
+                        "engine": engine,
+                        "partitions": partitions,
+                        "n_jobs": n_jobs,
+                        "link_index": link_index,
+                    },
+                ):
+                    yield right_dset
+
+        return date_proximity_many(
+            left=self,
+            rights=recorded_right_dsets(),
+            get=get,
+            when=when,
+            days=days,
+            dropna=dropna,
+            drop_duplicates=drop_duplicates,
+            duplicates_indicator=duplicates_indicator,
+            merge_suffixes=merge_suffixes,
+            prepend_level_name=prepend_level_name,
+            engine=engine,
+            partitions=partitions,
+            n_jobs=n_jobs,
+            link_index=link_index,
         )
 
     @MethodHistory
-    def group_by_keep_one(self, keep="all", drop_duplicates=False):
+    def group_by_keep_one(self, keep="all", drop_duplicates=False, per=None):
         """
         Group on the :attr:`id2_col_name` column and keep only the earliest
         or latest row in each group as determined by the date in the
@@ -781,10 +937,12 @@ class Dataset(pd.DataFrame):
             See :meth:`macpie.pandas.group_by_keep_one`
         drop_duplicates :
             See :meth:`macpie.pandas.group_by_keep_one`
+        per :
+            See :meth:`macpie.pandas.group_by_keep_one`
         """
         from macpie.core.groupby import group_by_keep_one
 
-        return group_by_keep_one(self, keep, drop_duplicates)
+        return group_by_keep_one(self, keep, drop_duplicates, per=per)
 
     # -------------------------------------------------------------------------
     # Overriding methods
@@ -793,7 +951,42 @@ class Dataset(pd.DataFrame):
     @property
     def _constructor(self):
         """Retain Dataset as a result of an operation."""
-        return Dataset
+        return self._constructor_from_data
+
+    def _constructor_from_data(self, data=None, *args, **kwargs):
+        """Construct the Dataset resulting from an operation on this one.
+
+        pandas mostly passes a BlockManager, which is wrapped with :meth:`_from_mgr`
+        and given the metadata of this Dataset without validating it again (columns
+        no longer in the result are unset). Anything else goes through :meth:`__init__`.
+        """
+        if not isinstance(data, pd.core.internals.BlockManager) or args or kwargs:
+            return Dataset(data, *args, **kwargs)
+
+        dset = Dataset._from_mgr(data)
+        columns = data.axes[0]
+        for attr in self._metadata:
+            val = getattr(self, attr, None)
+            if attr in self._col_name_metadata and val is not None and val not in columns:
+                val = None
+            setattr(dset, attr, val)
+        return dset
+
+    @classmethod
+    def _from_mgr(cls, mgr, axes=None):
+        """Construct a Dataset with default metadata directly from a pandas
+        BlockManager, without copying it or going through :meth:`__init__`.
+        """
+        dset = cls.__new__(cls)
+        pd.core.generic.NDFrame.__init__(dset, mgr)
+        dset._id_col_name = None
+        dset._date_col_errors = "raise"
+        dset._date_col_name = None
+        dset._id2_col_name = None
+        dset._name = get_option("dataset.default.name")
+        dset._tags = []
+        dset._display_name_generator = cls.default_display_name_generator
+        return dset
 
     """ In development
     @property
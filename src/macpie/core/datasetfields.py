@@ -1,5 +1,9 @@
 import collections
-from typing import NamedTuple
+import operator
+from typing import List, NamedTuple
+
+import numpy as np
+from tablib.core import Row
 
 from macpie.tools import tablibtools
 
@@ -9,12 +13,129 @@ class DatasetField(NamedTuple):
     field: str
 
 
+class _FieldColumns(NamedTuple):
+    """Columnar representation of the rows of a :class:`DatasetFields`."""
+
+    #: Position of the Dataset name of each row in :attr:`datasets`
+    dataset_codes: np.ndarray
+
+    #: Object array of the Dataset names (in order of first appearance)
+    datasets: np.ndarray
+
+    #: Object array of the field of each row
+    fields: np.ndarray
+
+    #: Position of the tags of each row in :attr:`tag_sets`
+    tag_codes: np.ndarray
+
+    #: Tuples of the tags rows have (in order of first appearance)
+    tag_sets: List[tuple]
+
+    @classmethod
+    def from_rows(cls, rows, tags=None):
+        """Construct from rows of ``(dataset, field)`` pairs, with their
+        tags taken from ``tags`` if given, or else from the rows themselves
+        (i.e. :class:`tablib.Row` objects).
+        """
+        dataset_lookup = {}
+        tag_set_lookup = {}
+        if tags is not None:
+            tag_set_lookup[tuple(tags)] = 0
+
+        dataset_codes = []
+        fields = []
+        tag_codes = []
+        for row in rows:
+            dataset_codes.append(dataset_lookup.setdefault(row[0], len(dataset_lookup)))
+            fields.append(row[1])
+            if tags is None:
+                tag_codes.append(tag_set_lookup.setdefault(tuple(row.tags), len(tag_set_lookup)))
+
+        return cls(
+            dataset_codes=np.array(dataset_codes, dtype=np.intp),
+            datasets=_object_array(list(dataset_lookup)),
+            fields=_object_array(fields),
+            tag_codes=(
+                np.zeros(len(fields), dtype=np.intp)
+                if tags is not None
+                else np.array(tag_codes, dtype=np.intp)
+            ),
+            tag_sets=list(tag_set_lookup),
+        )
+
+    def take(self, indices) -> "_FieldColumns":
+        """The rows at ``indices``. Unused Dataset names and tags are kept."""
+        return self._replace(
+            dataset_codes=self.dataset_codes[indices],
+            fields=self.fields[indices],
+            tag_codes=self.tag_codes[indices],
+        )
+
+    def concat(self, other: "_FieldColumns") -> "_FieldColumns":
+        """The rows of ``self`` followed by the rows of ``other``."""
+        datasets = {dataset: code for code, dataset in enumerate(self.datasets)}
+        dataset_codes = np.array(
+            [datasets.setdefault(dataset, len(datasets)) for dataset in other.datasets],
+            dtype=np.intp,
+        )
+        tag_sets = {tag_set: code for code, tag_set in enumerate(self.tag_sets)}
+        tag_codes = np.array(
+            [tag_sets.setdefault(tag_set, len(tag_sets)) for tag_set in other.tag_sets],
+            dtype=np.intp,
+        )
+        return _FieldColumns(
+            dataset_codes=np.concatenate(
+                [self.dataset_codes, dataset_codes[other.dataset_codes]]
+            ),
+            datasets=_object_array(list(datasets)),
+            fields=np.concatenate([self.fields, other.fields]),
+            tag_codes=np.concatenate([self.tag_codes, tag_codes[other.tag_codes]]),
+            tag_sets=list(tag_sets),
+        )
+
+    def has_tag(self, tag) -> np.ndarray:
+        """Boolean mask of the rows that have ``tag`` (or any of ``tag``
+        if it is a list), as :meth:`tablib.Row.has_tag`."""
+        tag_set_has_tag = np.array(
+            [Row((), tags=tag_set).has_tag(tag) for tag_set in self.tag_sets], dtype=bool
+        )
+        if not len(tag_set_has_tag):
+            return np.zeros(len(self.fields), dtype=bool)
+        return tag_set_has_tag[self.tag_codes]
+
+    def to_rows(self):
+        """Convert to a list of :class:`tablib.Row` objects."""
+        tag_sets = [list(tag_set) for tag_set in self.tag_sets]
+        return [
+            Row([dataset, field], tags=tag_sets[tag_code])
+            for dataset, field, tag_code in zip(
+                self.datasets[self.dataset_codes].tolist(),
+                self.fields.tolist(),
+                self.tag_codes.tolist(),
+            )
+        ]
+
+
+def _object_array(values):
+    # assign item by item so that tuples (e.g. MultiIndex columns) stay elements
+    arr = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        arr[i] = value
+    return arr
+
+
 class DatasetFields(tablibtools.MacpieTablibDataset):
     """A tabular representation of a set of :class:`macpie.Dataset` fields.
     First column is the Dataset name. Second column is the Dataset column name.
 
     It is a subclass of :class:`macpie.tablibtools.MacpieTablibDataset`, and therefore
     can be initialized with data the same way.
+
+    Its rows are stored by :mod:`tablib`, along with a copy of them as columns
+    (codes of the Dataset names, an array of the fields and codes of the tags of
+    each row), so that filtering, sorting and grouping them are done on arrays
+    rather than row by row. The columns are rebuilt from the rows whenever the
+    rows were changed by other means than the methods below.
     """
 
     #: Tag to indicate key fields
@@ -26,6 +147,10 @@ class DatasetFields(tablibtools.MacpieTablibDataset):
     #: Tag to indicate system fields
     tag_sys_field = "sys_field"
 
+    # the rows as columns, and the rows they were built from
+    _columns = None
+    _columns_rows = ()
+
     def __init__(self, *args, **kwargs):
         self._col_header_dataset = "Dataset"
         self._col_header_field = "Field"
@@ -34,27 +159,108 @@ class DatasetFields(tablibtools.MacpieTablibDataset):
         super().__init__(*args, headers=headers, **kwargs)
 
     def __iter__(self):
+        columns = self._get_columns()
+        if columns is not None:
+            return map(
+                DatasetField._make,
+                zip(columns.datasets[columns.dataset_codes].tolist(), columns.fields.tolist()),
+            )
         return (DatasetField(row[0], row[1]) for row in self.data)
 
+    def _get_columns(self):
+        """The rows as a ``_FieldColumns``, rebuilt from the rows if they changed.
+        Returns None if the rows are not pairs of Dataset name and field.
+        """
+        rows = self.data
+        if (rows and len(rows[0]) != 2) or len(self.headers or ()) not in (0, 2):
+            return None
+        # the rows are the same (tablib replaces a row with a new Row object)
+        if not (
+            self._columns is not None
+            and len(rows) == len(self._columns_rows)
+            and all(map(operator.is_, rows, self._columns_rows))
+        ):
+            self._set_columns(_FieldColumns.from_rows(rows))
+        return self._columns
+
+    def _set_columns(self, columns: _FieldColumns):
+        """Set the columns of the current rows."""
+        self._columns = columns
+        self._columns_rows = list(self.data)
+
     @property
     def unique_datasets(self):
         """A list of unique :class:`macpie.Dataset` names."""
-        return list(set(self[self._col_header_dataset]))
+        columns = self._get_columns()
+        if columns is None:
+            return list(dict.fromkeys(self[self._col_header_dataset]))
+        return columns.datasets[np.unique(columns.dataset_codes)].tolist()
+
+    def extend(self, rows, tags=()):
+        """Adds a list of rows to the :class:`DatasetFields` using
+        :meth:`tablib.Dataset.append`.
+        """
+        columns = self._get_columns()
+        rows = list(rows)
+        super().extend(rows, tags=tags)
+        if columns is not None and all(len(row) == 2 for row in rows):
+            self._set_columns(columns.concat(_FieldColumns.from_rows(rows, tags=tags)))
+
+    def extendleft(self, rows, tags=()):
+        """Prepend a list of Dataset fields."""
+        columns = self._get_columns()
+        rows = list(rows)
+        for i, row in enumerate(rows):
+            self.insert(i, row, tags=tags)
+        if columns is not None and all(len(row) == 2 for row in rows):
+            self._set_columns(_FieldColumns.from_rows(rows, tags=tags).concat(columns))
+
+    def filter(self, tag):
+        """Returns a new instance of the :class:`DatasetFields`, excluding any
+        rows that do not contain the given tag(s).
+        """
+        columns = self._get_columns()
+        _dset = super().filter(tag)
+        if columns is not None:
+            # the same rows tablib kept
+            _dset._set_columns(columns.take(np.flatnonzero(columns.has_tag(tag))))
+        return _dset
 
     def sort(self, collection):
         """Sort the Dataset fields according to the order they have in
         their respective collections.
         """
-        fields = [field for field in self]
-        fields.sort(key=lambda i: collection.all_fields.index(i))
-        self.wipe_data()
-        self.extend(fields)
+        positions = collection._get_field_index().positions
+        columns = self._get_columns()
+        if columns is None:
+            fields = [field for field in self]
+            fields.sort(key=lambda i: positions[i])
+            self.wipe_data()
+            self.extend(fields)
+            return
+
+        keys = np.array([positions[field] for field in self], dtype=np.intp)
+        order = np.argsort(keys, kind="stable")
+        rows = self.data
+        rows[:] = [rows[i] for i in order.tolist()]
+        self._set_columns(columns.take(order))
 
     def to_dict(self):
         """Convert this :class:`DatasetFields` to a dictionary."""
         d = collections.defaultdict(list)
-        for dataset_field in self:
-            d[dataset_field.dataset].append(dataset_field.field)
+        columns = self._get_columns()
+        if columns is None:
+            for dataset_field in self:
+                d[dataset_field.dataset].append(dataset_field.field)
+            return d
+
+        # group the fields by Dataset, in order of first appearance
+        order = np.argsort(columns.dataset_codes, kind="stable")
+        codes, starts = np.unique(columns.dataset_codes[order], return_index=True)
+        groups = np.split(columns.fields[order], starts[1:])
+        firsts = order[starts]
+        for i in np.argsort(firsts, kind="stable"):
+            d[columns.datasets[codes[i]]] = groups[i].tolist()
         return d
 
     @classmethod
@@ -62,17 +268,41 @@ class DatasetFields(tablibtools.MacpieTablibDataset):
         """Construct :class:`DatasetFields` from a MACPie Collection."""
         tags = kwargs.pop("tags", [])
         instance = cls(**kwargs)
+        field_index = collection._get_field_index()
 
+        tag_sets = [
+            (DatasetFields.tag_key_field, *tags),
+            (DatasetFields.tag_sys_field, *tags),
+            (DatasetFields.tag_non_key_field, *tags),
+        ]
+        datasets = {}
+        dataset_codes = []
+        fields = []
+        tag_codes = []
         for dset in collection:
             if tags and not dset.has_tag(tags):
                 continue
+            dataset_code = datasets.setdefault(dset.name, len(datasets))
             for col in dset.columns:
                 field = DatasetField(dset.name, col)
-                if field in collection.key_fields:
-                    instance.append(field, tags=[DatasetFields.tag_key_field] + tags)
-                elif field in collection.sys_fields:
-                    instance.append(field, tags=[DatasetFields.tag_sys_field] + tags)
+                if field in field_index.key_fields:
+                    tag_code = 0
+                elif field in field_index.sys_fields:
+                    tag_code = 1
                 else:
-                    instance.append(field, tags=[DatasetFields.tag_non_key_field] + tags)
+                    tag_code = 2
+                instance.append(field, tags=tag_sets[tag_code])
+                dataset_codes.append(dataset_code)
+                fields.append(col)
+                tag_codes.append(tag_code)
 
+        instance._set_columns(
+            _FieldColumns(
+                dataset_codes=np.array(dataset_codes, dtype=np.intp),
+                datasets=_object_array(list(datasets)),
+                fields=_object_array(fields),
+                tag_codes=np.array(tag_codes, dtype=np.intp),
+                tag_sets=tag_sets,
+            )
+        )
         return instance
@@ -1,7 +1,9 @@
 from macpie.core.dataset import Dataset
 
 
-def group_by_keep_one(dset: Dataset, keep: str = "all", drop_duplicates: bool = False) -> None:
+def group_by_keep_one(
+    dset: Dataset, keep="all", drop_duplicates: bool = False, per: str = None
+) -> None:
     """Given a :class:`Dataset` object, group on the :attr:`Dataset.id2_col_name` column
     and keep only the earliest or latest row in each group as determined by the date
     in the :attr:`Dataset.date_col_name` column.
@@ -11,17 +13,22 @@ def group_by_keep_one(dset: Dataset, keep: str = "all", drop_duplicates: bool =
     Parameters
     ----------
     dset : Dataset
-    keep: {'all', 'earliest', 'latest'}, default 'all'
+    keep: {'all', 'earliest', 'latest'}, int or slice, default 'all'
         Specify which row of each group to keep.
 
         * all: keep all rows
         * earliest: in each group, keep only the earliest (i.e. oldest) row
         * latest: in each group, keep only the latest (i.e. most recent) row
+        * int or slice: in each group, keep only the rows on the n-th earliest
+          date(s), see :func:`macpie.pandas.group_by_keep_one`
     drop_duplicates : bool, default: False
         If ``True``, then if more than one row is determined to be
         'earliest' or 'latest' in each group, drop all duplicates
         except the first occurrence. If ``dset`` has an ``id_col_name``,
         then that column will also be used for identifying duplicates
+    per : str, optional
+        A period frequency (e.g. ``'Y'``) to apply ``keep`` to the rows of each
+        period of each group, see :func:`macpie.pandas.group_by_keep_one`
     """
     from macpie.pandas.groupby import group_by_keep_one
 
@@ -32,6 +39,7 @@ def group_by_keep_one(dset: Dataset, keep: str = "all", drop_duplicates: bool =
         keep=keep,
         id_col_name=dset.id_col_name,
         drop_duplicates=drop_duplicates,
+        per=per,
     )
 
     return Dataset(data=result_df)
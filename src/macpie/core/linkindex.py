@@ -0,0 +1,286 @@
+import hashlib
+import json
+
+import numpy as np
+import pandas as pd
+
+from macpie.pandas.combine import _factorize_ids, _get_id_frame, _validate_left_duplicates
+from macpie.tools import datetimetools, lltools
+
+
+class LinkIndex:
+    """
+    A prebuilt index of the id and date columns of the "left" (i.e. primary)
+    data of :func:`macpie.date_proximity`, similar to a database index.
+
+    Building it factorizes the ids into integer codes, sorts the rows by id and
+    date, converts the dates into int64 values (nanoseconds since the epoch) and
+    int32 day ordinals, and checks for duplicates, which then doesn't need to be
+    done again each time the same data is linked. It can be saved with
+    :meth:`to_npz` and reloaded with :meth:`from_npz` for later runs.
+
+    Use :meth:`from_dataset` or :meth:`from_df` to build one.
+
+    Parameters
+    ----------
+    id_col_names : list
+        Names of the id columns
+    date_col_name : str
+        Name of the date column
+    link_id_col_name : str, optional
+        Name of the column checked to be unique, if any. Otherwise the rows
+        were checked to be unique on the id and date columns.
+    dtypes : list of str
+        dtypes of the id columns and of the date column
+    order : ndarray
+        Positions of the rows, sorted by id code, then date
+    offsets : ndarray
+        Start of the rows of each id in ``order``, followed by the number of rows,
+        i.e. the rows of the id with code ``i`` are ``order[offsets[i]:offsets[i + 1]]``
+    dates : ndarray
+        int64 date value of each row, in ``order``, where missing dates are ``iNaT``
+    day_ordinals : ndarray
+        int32 day ordinal of each row (see :func:`macpie.datetimetools.to_day_ordinals`),
+        in ``order``
+    ids : DataFrame
+        One row per id, in order of their codes
+    fingerprint : str, optional
+        Digest of the values of the id and date columns, and of the index, of
+        the rows the index was built from (see ``verify`` of :meth:`from_df`).
+    """
+
+    def __init__(
+        self,
+        id_col_names,
+        date_col_name,
+        link_id_col_name,
+        dtypes,
+        order,
+        offsets,
+        dates,
+        day_ordinals,
+        ids,
+        fingerprint=None,
+    ):
+        self.id_col_names = list(id_col_names)
+        self.date_col_name = date_col_name
+        self.link_id_col_name = link_id_col_name
+        self.dtypes = list(dtypes)
+        self.order = order
+        self.offsets = offsets
+        self.dates = dates
+        self.day_ordinals = day_ordinals
+        self.ids = ids
+        self.fingerprint = fingerprint
+
+    def __len__(self):
+        return len(self.order)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"id_col_names={self.id_col_names!r}, "
+            f"date_col_name={self.date_col_name!r}, "
+            f"rows={len(self)}, "
+            f"ids={len(self.ids)})"
+        )
+
+    @classmethod
+    def from_df(
+        cls, df: pd.DataFrame, id_col_names, date_col_name, link_id_col_name=None, verify=False
+    ):
+        """Build a :class:`LinkIndex` from the columns of a DataFrame.
+
+        Parameters
+        ----------
+        df : DataFrame
+        id_col_names : str or list
+            Id column(s), case-insensitive
+        date_col_name : str
+            Date column, case-insensitive. If it isn't a date column, it is
+            converted in place with :func:`pandas.to_datetime`, as linking
+            ``df`` would do.
+        link_id_col_name : str, optional
+            Column that must be unique, case-insensitive. If not given,
+            the rows must be unique on the id and date columns.
+        verify : bool, default False
+            Linking with the index checks that the data it is given has the same
+            number of rows, column names and dtypes as ``df``. If True, also check
+            that it has the same ids and dates, row by row (and the same index),
+            which costs about as much as building the index.
+        """
+        id_col_names = df.mac.get_col_names(lltools.maybe_make_list(id_col_names))
+        date_col_name = df.mac.get_col_name(date_col_name)
+        if link_id_col_name:
+            link_id_col_name = df.mac.get_col_name(link_id_col_name)
+
+        if not df.mac.is_date_col(date_col_name):
+            df.mac.to_datetime(date_col_name)
+
+        codes, ids = _factorize_ids(_get_id_frame(df, id_col_names))
+        dates = pd.DatetimeIndex(df[date_col_name]).asi8
+        day_ordinals = datetimetools.to_day_ordinals(df[date_col_name])
+
+        order = np.lexsort((dates, codes))
+        _validate_left_duplicates(
+            df,
+            id_col_names,
+            date_col_name,
+            link_id_col_name,
+            codes=codes,
+            dates=dates,
+            order=order,
+        )
+
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(ids)), out=offsets[1:])
+
+        return cls(
+            id_col_names,
+            date_col_name,
+            link_id_col_name,
+            _get_dtypes(df, id_col_names, date_col_name),
+            order,
+            offsets,
+            dates[order],
+            day_ordinals[order],
+            ids,
+            _fingerprint(df, id_col_names, date_col_name) if verify else None,
+        )
+
+    @classmethod
+    def from_dataset(cls, dset, verify=False):
+        """Build a :class:`LinkIndex` from the :attr:`Dataset.id2_col_name`,
+        :attr:`Dataset.date_col_name` and :attr:`Dataset.id_col_name` columns
+        of a :class:`Dataset`, to use when linking it as the "left" Dataset.
+
+        See :meth:`from_df` for ``verify``.
+        """
+        return cls.from_df(
+            dset, dset.id2_col_name, dset.date_col_name, dset.id_col_name, verify=verify
+        )
+
+    def validate(self, df, id_col_names, date_col_name):
+        """Raise a ValueError if the index wasn't built from the ``id_col_names``
+        and ``date_col_name`` columns of ``df``, i.e. if they don't have the same
+        names, dtypes and number of rows (or, if the index was built with
+        ``verify=True``, the same values).
+        """
+        if (
+            len(self) != len(df)
+            or self.id_col_names != list(id_col_names)
+            or self.date_col_name != date_col_name
+            or self.dtypes != _get_dtypes(df, id_col_names, date_col_name)
+        ):
+            raise ValueError(
+                f"link_index was not built from the '{id_col_names}' and "
+                f"'{date_col_name}' columns of left ({len(df)} rows)"
+            )
+        # e.g. left was reordered or modified after building the link index
+        if self.fingerprint is not None and self.fingerprint != _fingerprint(
+            df, id_col_names, date_col_name
+        ):
+            raise ValueError(
+                f"link_index was not built from the current values of the "
+                f"'{id_col_names}' and '{date_col_name}' columns of left. Rebuild it."
+            )
+
+    def get_row_codes(self):
+        """Integer code of the id of each row, in the order of the rows."""
+        codes = np.empty(len(self), dtype=np.int64)
+        codes[self.order] = np.repeat(np.arange(len(self.ids)), np.diff(self.offsets))
+        return codes
+
+    def get_row_dates(self, fractional_days=True):
+        """int64 date value (or, if not ``fractional_days``, int32 day ordinal)
+        of each row, in the order of the rows.
+        """
+        sorted_dates = self.dates if fractional_days else self.day_ordinals
+        dates = np.empty_like(sorted_dates)
+        dates[self.order] = sorted_dates
+        return dates
+
+    def to_npz(self, filepath):
+        """Save to a ``.npz`` file (see :func:`numpy.savez_compressed`).
+
+        Ids that aren't numbers (e.g. strings) are stored as JSON, so they must
+        be JSON serializable, i.e. strings, numbers or None.
+        """
+        meta = {
+            "id_col_names": self.id_col_names,
+            "date_col_name": self.date_col_name,
+            "link_id_col_name": self.link_id_col_name,
+            "dtypes": self.dtypes,
+            "fingerprint": self.fingerprint,
+            # object ids, by column position, so no pickles are needed to load them
+            "object_ids": {},
+        }
+        ids = {}
+        for i, col in enumerate(self.ids.columns):
+            values = self.ids[col].to_numpy()
+            if values.dtype == object:
+                meta["object_ids"][str(i)] = values.tolist()
+            else:
+                ids[f"ids_{i}"] = values
+
+        try:
+            meta = json.dumps(meta)
+        except TypeError as e:
+            raise ValueError("Only ids of numbers, strings or None can be saved") from e
+
+        np.savez_compressed(
+            filepath,
+            meta=np.array(meta),
+            order=self.order,
+            offsets=self.offsets,
+            dates=self.dates,
+            day_ordinals=self.day_ordinals,
+            **ids,
+        )
+
+    @classmethod
+    def from_npz(cls, filepath):
+        """Load a :class:`LinkIndex` saved with :meth:`to_npz`."""
+        with np.load(filepath, allow_pickle=False) as npz:
+            meta = json.loads(npz["meta"].item())
+            n_ids = len(meta["id_col_names"])
+            object_ids = meta["object_ids"]
+            ids = pd.DataFrame(
+                {
+                    i: (
+                        pd.Series(object_ids[str(i)], dtype=object)
+                        if str(i) in object_ids
+                        else npz[f"ids_{i}"]
+                    )
+                    for i in range(n_ids)
+                }
+            )
+            arrays = {name: npz[name] for name in ["order", "offsets", "dates", "day_ordinals"]}
+
+        return cls(
+            [_to_label(col) for col in meta["id_col_names"]],
+            _to_label(meta["date_col_name"]),
+            _to_label(meta["link_id_col_name"]),
+            meta["dtypes"],
+            ids=ids,
+            fingerprint=meta["fingerprint"],
+            **arrays,
+        )
+
+
+def _get_dtypes(df, id_col_names, date_col_name):
+    return [str(df[col].dtype) for col in [*id_col_names, date_col_name]]
+
+
+def _fingerprint(df, id_col_names, date_col_name):
+    """A digest of the values of the id and date columns of ``df``, row by row,
+    and of its index.
+    """
+    cols = df[[*id_col_names, date_col_name]]
+    row_hashes = pd.util.hash_pandas_object(cols, index=True).to_numpy()
+    return hashlib.sha256(row_hashes.tobytes()).hexdigest()
+
+
+def _to_label(value):
+    # column labels of MultiIndex columns are tuples, which json stores as lists
+    return tuple(value) if isinstance(value, list) else value
@@ -3,6 +3,7 @@ Data IO api
 """
 
 from macpie.io.excel import (
+    LazyDataset,
     MACPieExcelFile,
     MACPieExcelWriter,
     read_excel,
@@ -1,4 +1,5 @@
 from ._base import (
+    LazyDataset,
     MACPieExcelFile,
     MACPieExcelWriter,
     read_excel,
@@ -10,6 +11,7 @@ from ._openpyxl import _MACPieOpenpyxlWriter
 from ._xlsxwriter import _MACPieXlsxWriter
 
 __all__ = [
+    "LazyDataset",
     "MACPieExcelFile",
     "MACPieExcelWriter",
     "read_excel",
@@ -1,7 +1,11 @@
 import abc
+import collections
+import functools
 import re
 
 import pandas as pd
+from pandas.api.types import is_integer
+from pandas.io.excel._util import fill_mi_header
 
 import tablib as tl
 
@@ -21,7 +25,9 @@ def safe_xlsx_sheet_title(s, replace="-"):
     return re.sub(INVALID_TITLE_REGEX, replace, s)[:31]
 
 
-def read_excel(io, as_collection=False, storage_options=None, engine=None, **kwargs):
+def read_excel(
+    io, as_collection=False, storage_options=None, engine=None, lazy=False, **kwargs
+):
     """
     Read an Excel file into a macpie Dataset.
 
@@ -35,6 +41,14 @@ def read_excel(io, as_collection=False, storage_options=None, engine=None, **kwa
     as_collection : bool, default False
         Whether to parse the Excel file as a :class:`macpie.BaseCollection` and
         return the appropriate collection type.
+    col_filter : callable, optional
+        Only read the columns whose label (a tuple if ``header`` is list-like)
+        this returns True for, plus any ``index_col`` columns. Unlike a
+        callable ``usecols``, the cells of the other columns are never parsed.
+    lazy : bool, default False
+        Whether to return :class:`LazyDataset` proxies (in a
+        :class:`macpie.BasicList` if ``as_collection``) that only parse their
+        sheet when used. The Excel file then stays open while they are in use.
     **kwargs
         All remaining keyword arguments are passed through to the underlying
         :meth:`pandas.ExcelFile.parse` method.
@@ -48,7 +62,7 @@ def read_excel(io, as_collection=False, storage_options=None, engine=None, **kwa
     should_close = False
     if not isinstance(io, MACPieExcelFile):
         should_close = True
-        io = MACPieExcelFile(io, storage_options=storage_options)
+        io = MACPieExcelFile(io, storage_options=storage_options, engine=engine)
     elif engine and engine != io.engine:
         raise ValueError(
             "Engine should not be specified when passing "
@@ -57,12 +71,12 @@ def read_excel(io, as_collection=False, storage_options=None, engine=None, **kwa
 
     try:
         if as_collection:
-            data = io.parse_collection()
+            data = io.parse_collection(lazy=lazy)
         else:
-            data = io.parse(**kwargs)
+            data = io.parse(lazy=lazy, **kwargs)
     finally:
-        # make sure to close opened file handles
-        if should_close:
+        # make sure to close opened file handles, unless sheets are parsed later
+        if should_close and not lazy:
             io.close()
 
     return data
@@ -83,23 +97,44 @@ class MACPieExcelFile(pd.ExcelFile):
         py._path.local.LocalPath), a file-like object, or openpyxl workbook.
         If a string or path object, expected to be a path to a
         .xls, .xlsx, .xlsb, .xlsm, .odf, .ods, or .odt file.
-    engine : str, default "mp_openpyxl"
-        If io is not a buffer or path, this must be set to identify io.
-        Supported engines: ``mp_openpyxl``
+    engine : str, optional
+        Supported engines: ``mp_openpyxl``, ``mp_calamine``.
+        Default is the ``excel.reader.engine`` option, i.e. ``mp_openpyxl``.
+        ``"auto"`` uses ``mp_calamine`` if ``python-calamine`` is installed,
+        otherwise ``mp_openpyxl``.
         Engine compatibility :
 
         - ``mp_openpyxl`` supports newer Excel file formats.
+        - ``mp_calamine`` supports newer Excel file formats, and reads them
+          faster. Requires ``python-calamine``.
+
+    Notes
+    -----
+    The ``_mp_datasets`` and ``_mp_collection`` sheets are only parsed when first
+    needed, and the Datasets of :class:`LazyDataset` proxies (see :meth:`parse`)
+    are cached for the ``excel.reader.max_parsed_sheets`` most recently used ones.
     """
 
-    def __init__(self, path_or_buffer, storage_options=None):
+    def __init__(self, path_or_buffer, storage_options=None, engine=None):
+        from ._calamine import MACPieCalamineReader
         from ._openpyxl import MACPieOpenpyxlReader
 
         self._engines["mp_openpyxl"] = MACPieOpenpyxlReader
+        self._engines["mp_calamine"] = MACPieCalamineReader
 
-        super().__init__(path_or_buffer, engine="mp_openpyxl", storage_options=storage_options)
+        if engine is None:
+            engine = get_option("excel.reader.engine")
+        if engine == "auto":
+            engine = "mp_calamine" if _has_calamine() else "mp_openpyxl"
+        elif engine not in ("mp_openpyxl", "mp_calamine"):
+            raise ValueError(
+                f"Invalid engine: '{engine}'. Only 'mp_openpyxl' or 'mp_calamine' supported."
+            )
 
-        self._dataset_dicts = self.get_dataset_dicts()
-        self._collection_dict = self.get_collection_dict()
+        super().__init__(path_or_buffer, engine=engine, storage_options=storage_options)
+
+        # Datasets of LazyDataset proxies, least recently used first
+        self._parsed_datasets = collections.OrderedDict()
 
     def __repr__(self):
         return (
@@ -109,6 +144,14 @@ class MACPieExcelFile(pd.ExcelFile):
             f"collection_class={self.collection_classname!r})"
         )
 
+    @functools.cached_property
+    def _dataset_dicts(self):
+        return self.get_dataset_dicts()
+
+    @functools.cached_property
+    def _collection_dict(self):
+        return self.get_collection_dict()
+
     @property
     def dataset_sheetnames(self):
         if self._dataset_dicts:
@@ -117,7 +160,7 @@ class MACPieExcelFile(pd.ExcelFile):
 
     @property
     def collection_classname(self):
-        if self._collection_dict is None:
+        if not self._collection_dict:
             return None
         return self._collection_dict["class_name"]
 
@@ -196,30 +239,50 @@ class MACPieExcelFile(pd.ExcelFile):
         )
         return dataset_fields
 
-    def parse_collection(self):
+    def parse_collection(self, lazy=False):
+        """
+        Parse the Excel file into the collection it was written from.
+
+        Parameters
+        ----------
+        lazy : bool, default False
+            Whether the Datasets of the collection are :class:`LazyDataset`
+            proxies. Only supported for :class:`macpie.BasicList` collections.
+        """
         if not self._collection_dict:
             raise ValueError(
-                f"Cannot parse as collection without '{self.collection_sheet_name}' sheet."
+                f"Cannot parse as collection without '{COLLECTION_SHEET_NAME}' sheet."
             )
 
         import macpie.core.collections
 
         collection_class_name = self._collection_dict["class_name"]
         collection_class = getattr(macpie.core.collections, collection_class_name)
+        if lazy:
+            if not issubclass(collection_class, macpie.core.collections.BasicList):
+                raise ValueError(f"Cannot lazily parse a {collection_class_name}.")
+            return collection_class.from_excel_dict(self, self._collection_dict, lazy=True)
         return collection_class.from_excel_dict(self, self._collection_dict)
 
-    def parse(self, sheet_name=0, **kwargs):
+    def parse(self, sheet_name=0, lazy=False, **kwargs):
         """
         Parse specified sheet(s) into a macpie Dataset.
         Equivalent to read_excel(MACPieExcelFile, ...) See the :func:`read_excel`
         docstring for more info on accepted parameters.
 
+        Parameters
+        ----------
+        lazy : bool, default False
+            Whether to return :class:`LazyDataset` proxies that only parse their
+            sheet (with the other parameters) when used.
+
         Returns
         -------
         Dataset or dict of Datasets
             Dataset from the passed in Excel file.
         """
 
+        col_filter = kwargs.pop("col_filter", None)
         ret_dict = False
 
         if isinstance(sheet_name, list):
@@ -240,13 +303,22 @@ class MACPieExcelFile(pd.ExcelFile):
                 sheetname = self._reader.get_sheetname_by_index(asheetname)
 
             excel_dict = self._dataset_dicts.get(sheetname)
+            if lazy:
+                output[asheetname] = LazyDataset(
+                    self, sheetname, excel_dict, col_filter=col_filter, **kwargs
+                )
+                continue
+
             if excel_dict is not None:
                 read_excel_kwargs = excel_dict.get("read_excel_kwargs")
             else:
                 read_excel_kwargs = {}
 
             kwargs.update(read_excel_kwargs)
-            df = self._reader.parse(sheet_name=sheetname, **kwargs)
+            if col_filter is None:
+                df = self._reader.parse(sheet_name=sheetname, **kwargs)
+            else:
+                df = self._reader.parse_selected_columns(sheetname, col_filter, **kwargs)
 
             if excel_dict is not None:
                 output[asheetname] = Dataset.from_excel_dict(excel_dict, df)
@@ -258,6 +330,23 @@ class MACPieExcelFile(pd.ExcelFile):
         else:
             return output[asheetname]
 
+    def _load_lazy_dataset(self, lazy_dset):
+        """The Dataset of ``lazy_dset``, parsing its sheet unless it is cached."""
+        parsed_datasets = self._parsed_datasets
+        if lazy_dset in parsed_datasets:
+            parsed_datasets.move_to_end(lazy_dset)
+            return parsed_datasets[lazy_dset]
+
+        dset = self.parse(sheet_name=lazy_dset.sheet_name, **lazy_dset._parse_kwargs)
+
+        max_parsed_sheets = get_option("excel.reader.max_parsed_sheets")
+        if max_parsed_sheets != 0:
+            parsed_datasets[lazy_dset] = dset
+            while max_parsed_sheets is not None and len(parsed_datasets) > max_parsed_sheets:
+                # evict the least recently used
+                parsed_datasets.popitem(last=False)
+        return dset
+
     @property
     def sheet_names(self):
         return [
@@ -271,7 +360,102 @@ class MACPieExcelFile(pd.ExcelFile):
         ]
 
 
+class LazyDataset:
+    """
+    Proxy of the :class:`macpie.Dataset` of a sheet of a :class:`MACPieExcelFile`,
+    which is only parsed when the Dataset is first used.
+
+    Its name and tags are taken from the ``_mp_datasets`` sheet, when the sheet
+    has an entry there, without parsing the sheet. Any other attribute, and
+    indexing, is looked up on the Dataset returned by :meth:`load`.
+
+    The Excel file keeps the Datasets of the ``excel.reader.max_parsed_sheets``
+    most recently used proxies, so a Dataset may be parsed again after others
+    have been used, and in-place changes to it are then lost. Keep the result
+    of :meth:`load` to keep changes. The Excel file must stay open while its
+    proxies are used.
+    """
+
+    _proxy_attrs = ("_excel_file", "_sheet_name", "_excel_dict", "_parse_kwargs")
+
+    def __init__(self, excel_file, sheet_name, excel_dict=None, **parse_kwargs):
+        self._excel_file = excel_file
+        self._sheet_name = sheet_name
+        self._excel_dict = excel_dict
+        self._parse_kwargs = parse_kwargs
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            f"sheet_name={self._sheet_name!r}, "
+            f"loaded={self.is_loaded!r})"
+        )
+
+    def __getattr__(self, name):
+        # only called for attributes not defined by the proxy
+        if name.startswith("__") or name in LazyDataset._proxy_attrs:
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def __len__(self):
+        return len(self.load())
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __contains__(self, key):
+        return key in self.load()
+
+    @property
+    def sheet_name(self):
+        """Name of the sheet of the Dataset."""
+        return self._sheet_name
+
+    @property
+    def is_loaded(self):
+        """Whether the Dataset is currently parsed (and cached)."""
+        return self in self._excel_file._parsed_datasets
+
+    @property
+    def name(self):
+        """Name of Dataset."""
+        if self._excel_dict is None:
+            return self.load().name
+        return self._excel_dict.get("name")
+
+    @property
+    def tags(self):
+        """Tag(s) of Dataset."""
+        if self._excel_dict is None:
+            return self.load().tags
+        return list(self._excel_dict.get("tags") or [])
+
+    def has_tag(self, tag):
+        """Returns true if the Dataset contains tag."""
+        if self._excel_dict is None:
+            return self.load().has_tag(tag)
+        return Dataset.excel_dict_has_tags(self._excel_dict, tag)
+
+    def load(self) -> Dataset:
+        """The Dataset, parsing its sheet if it is not cached."""
+        return self._excel_file._load_lazy_dataset(self)
+
+
+def _has_calamine():
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 class MACPieExcelReader(pd.io.excel._base.BaseExcelReader):
+    # (col_filter, header rows, index column positions) while parsing selected columns
+    _selected_columns = None
+
     @abc.abstractmethod
     def get_sheetname_by_index(self, index):
         pass
@@ -286,6 +470,63 @@ class MACPieExcelReader(pd.io.excel._base.BaseExcelReader):
     ):
         pass
 
+    def parse_selected_columns(self, sheet_name, col_filter, header=0, index_col=None, **kwds):
+        """Parse ``sheet_name`` like :meth:`parse`, but only the index columns and
+        the columns whose label satisfies ``col_filter``, without reading the
+        cells of the other columns.
+
+        While parsing, :attr:`_selected_columns` is set for :meth:`get_sheet_data`
+        to only return the data of those columns (see :func:`_select_positions`).
+        """
+        if header is None:
+            raise ValueError("col_filter requires a header")
+        if kwds.get("usecols") is not None or kwds.get("skiprows") is not None:
+            raise ValueError("col_filter cannot be combined with usecols or skiprows")
+
+        header_rows = [header] if is_integer(header) else list(header)
+        if index_col is None:
+            index_cols = []
+        elif is_integer(index_col):
+            index_cols = [index_col]
+        else:
+            index_cols = list(index_col)
+
+        # the index columns are moved to the front of the selected columns
+        if index_col is not None and not is_integer(index_col):
+            index_col = list(range(len(index_cols)))
+        elif index_col is not None:
+            index_col = 0
+
+        self._selected_columns = (col_filter, header_rows, index_cols)
+        try:
+            return self.parse(sheet_name=sheet_name, header=header, index_col=index_col, **kwds)
+        finally:
+            self._selected_columns = None
+
+
+def _select_positions(header_data, col_filter, header_rows, index_cols):
+    """
+    Positions of the index columns followed by those of the columns whose
+    label satisfies ``col_filter``, given the first rows of a sheet (which
+    get their multi-level header labels filled in, like pandas does, so the
+    label of every column is complete once the others are dropped).
+    """
+    width = max(len(row) for row in header_data)
+    for row in header_data:
+        row.extend([""] * (width - len(row)))
+
+    if len(header_rows) > 1:
+        control_row = [True] * width
+        for row in header_rows:
+            header_data[row], control_row = fill_mi_header(header_data[row], control_row)
+        labels = zip(*(header_data[row] for row in header_rows))
+    else:
+        labels = header_data[header_rows[0]]
+
+    return index_cols + [
+        i for i, label in enumerate(labels) if i not in index_cols and col_filter(label)
+    ]
+
 
 class MACPieExcelWriter(pd.ExcelWriter):
     """
@@ -303,6 +544,16 @@ class MACPieExcelWriter(pd.ExcelWriter):
       returns (i.e. "\\\\r"). Otherwise Excel will encode it as "_x000D_".
       See https://github.com/jmcnamara/XlsxWriter/issues/680.
 
+    Parameters
+    ----------
+    streaming : bool, optional
+        Whether to write each sheet row by row in constant memory (xlsxwriter's
+        ``constant_memory`` mode), i.e. each row is written to a temporary file
+        as soon as a later row of its sheet is written, instead of keeping all
+        the cells in memory until the file is saved. Rows of a sheet must then
+        be written in order. Only supported by the ``mp_xlsxwriter`` engine.
+        Defaults to the ``excel.writer.streaming`` option.
+
     Examples
     --------
     .. code-block:: python
@@ -315,6 +566,13 @@ class MACPieExcelWriter(pd.ExcelWriter):
             },
         )
 
+    Write a collection in constant memory:
+
+    .. code-block:: python
+
+        with mp.MACPieExcelWriter(file_path, streaming=True) as writer:
+            collection.to_excel(writer)
+
 
     Notes
     -----
@@ -338,6 +596,9 @@ class MACPieExcelWriter(pd.ExcelWriter):
 
         return object.__new__(cls)
 
+    #: Whether the rows of each sheet are written in order, in constant memory
+    streaming = False
+
     @abc.abstractmethod
     def write_excel_dict(self, excel_dict: dict):
         pass
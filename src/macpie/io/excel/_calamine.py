@@ -0,0 +1,156 @@
+import datetime
+import json
+
+import pandas as pd
+from pandas.compat._optional import import_optional_dependency
+
+from macpie.tools import tablibtools
+
+from macpie.io.excel._base import MACPieExcelReader, _select_positions
+
+
+class MACPieCalamineReader(MACPieExcelReader):
+    """Reader using the ``python-calamine`` engine, which parses Excel files
+    (in Rust) much faster than openpyxl.
+    """
+
+    _closed = False
+
+    def __init__(self, filepath_or_buffer, storage_options=None):
+        import_optional_dependency("python_calamine", extra="Install it to use mp_calamine.")
+        super().__init__(filepath_or_buffer, storage_options=storage_options)
+
+    @property
+    def _workbook_class(self):
+        from python_calamine import CalamineWorkbook
+
+        return CalamineWorkbook
+
+    def load_workbook(self, filepath_or_buffer):
+        from python_calamine import load_workbook
+
+        return load_workbook(filepath_or_buffer)
+
+    def close(self):
+        # calamine raises if a workbook is closed twice (e.g. again on garbage collection)
+        if not self._closed:
+            self._closed = True
+            super().close()
+
+    @property
+    def sheet_names(self):
+        return self.book.sheet_names
+
+    def get_sheet_by_name(self, name):
+        self.raise_if_bad_sheet_by_name(name)
+        return self.book.get_sheet_by_name(name)
+
+    def get_sheet_by_index(self, index):
+        self.raise_if_bad_sheet_by_index(index)
+        return self.book.get_sheet_by_index(index)
+
+    def get_sheetname_by_index(self, index):
+        return self.get_sheet_by_index(index).name
+
+    def get_sheet_data(self, sheet, convert_float, *args):
+        # pandas < 1.4 does not pass file_rows_needed
+        file_rows_needed = args[0] if args else None
+        rows = sheet.to_python(skip_empty_area=False, nrows=file_rows_needed)
+
+        if self._selected_columns is not None:
+            col_filter, header_rows, index_cols = self._selected_columns
+            n_header_rows = max(header_rows) + 1
+            header_data = [
+                [_convert_cell(cell, convert_float) for cell in row]
+                for row in rows[:n_header_rows]
+            ]
+            # the header rows get their multi-level labels filled in
+            positions = _select_positions(header_data, col_filter, header_rows, index_cols)
+            rows = [[row[i] for i in positions] for row in header_data] + [
+                [row[i] if i < len(row) else "" for i in positions]
+                for row in rows[n_header_rows:]
+            ]
+
+        data = []
+        last_row_with_data = -1
+        for row_number, row in enumerate(rows):
+            converted_row = [_convert_cell(cell, convert_float) for cell in row]
+            while converted_row and converted_row[-1] == "":
+                # trim trailing empty elements
+                converted_row.pop()
+            if converted_row:
+                last_row_with_data = row_number
+            data.append(converted_row)
+
+        # Trim trailing empty rows
+        data = data[: last_row_with_data + 1]
+
+        if len(data) > 0:
+            # extend rows to max width
+            max_width = max(len(data_row) for data_row in data)
+            if min(len(data_row) for data_row in data) < max_width:
+                empty_cell = [""]
+                data = [data_row + (max_width - len(data_row)) * empty_cell for data_row in data]
+
+        return data
+
+    def parse_excel_dict_sheet(self, sheet_name):
+        sheet = (
+            self.get_sheet_by_index(0)
+            if sheet_name is None
+            else self.get_sheet_by_name(sheet_name)
+        )
+        rows = [
+            [_convert_value(cell) for cell in row]
+            for row in sheet.to_python(skip_empty_area=False)
+        ]
+        df = pd.DataFrame(rows[1:], columns=rows[0])
+        df = df.applymap(json.loads)
+        dld = tablibtools.DictLikeTablibDataset.from_df(df)
+        return dld.to_dict()
+
+    def parse_tablib_dataset(
+        self, sheet_name=None, headers=True, tablib_class=tablibtools.MacpieTablibDataset
+    ):
+        sheet = (
+            self.get_sheet_by_index(0)
+            if sheet_name is None
+            else self.get_sheet_by_name(sheet_name)
+        )
+        dset = tablib_class()
+        dset.title = sheet.name
+
+        for i, row in enumerate(sheet.to_python(skip_empty_area=False)):
+            row_vals = [_convert_value(cell) for cell in row]
+            if i == 0 and headers:
+                dset.headers = row_vals
+            else:
+                dset.append(row_vals)
+
+        return dset
+
+
+def _convert_cell(cell, convert_float=True):
+    """Convert a cell value for :meth:`pandas.ExcelFile.parse`, like the openpyxl
+    reader does (empty cells are ``""``)."""
+    if isinstance(cell, float):
+        if convert_float and cell.is_integer():
+            return int(cell)
+        return cell
+    elif isinstance(cell, datetime.date):
+        return pd.Timestamp(cell)
+    elif isinstance(cell, datetime.timedelta):
+        return pd.Timedelta(cell)
+    return cell
+
+
+def _convert_value(cell):
+    """Convert a cell value like openpyxl (values only) does, i.e. empty cells
+    are None, whole numbers are ints and dates are datetimes."""
+    if cell == "":
+        return None
+    if isinstance(cell, float) and cell.is_integer():
+        return int(cell)
+    if isinstance(cell, datetime.date) and not isinstance(cell, datetime.datetime):
+        return datetime.datetime.combine(cell, datetime.time())
+    return cell
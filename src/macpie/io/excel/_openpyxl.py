@@ -13,6 +13,7 @@ from macpie.io.excel._base import (
     safe_xlsx_sheet_title,
     MACPieExcelReader,
     MACPieExcelWriter,
+    _select_positions,
 )
 
 
@@ -34,6 +35,56 @@ class MACPieOpenpyxlReader(pd.io.excel._openpyxl.OpenpyxlReader, MACPieExcelRead
             self.book, sheet_name=sheet_name, headers=headers, tablib_class=tablib_class
         )
 
+    def get_sheet_data(self, sheet, convert_float, *args):
+        if self._selected_columns is None:
+            return super().get_sheet_data(sheet, convert_float, *args)
+
+        # pandas < 1.4 does not pass file_rows_needed
+        file_rows_needed = args[0] if args else None
+        col_filter, header_rows, index_cols = self._selected_columns
+        n_header_rows = max(header_rows) + 1
+
+        if self.book.read_only:
+            sheet.reset_dimensions()
+
+        data = []
+        positions = None
+        last_row_with_data = -1
+        for row_number, row in enumerate(sheet.rows):
+            if positions is None:
+                converted_row = [self._convert_cell(cell, convert_float) for cell in row]
+            else:
+                # only convert the cells of the selected columns
+                converted_row = [
+                    self._convert_cell(row[i], convert_float) if i < len(row) else ""
+                    for i in positions
+                ]
+            while converted_row and converted_row[-1] == "":
+                # trim trailing empty elements
+                converted_row.pop()
+            if converted_row:
+                last_row_with_data = row_number
+            data.append(converted_row)
+
+            if row_number == n_header_rows - 1:
+                positions = _select_positions(data, col_filter, header_rows, index_cols)
+                data = [[row[i] if i < len(row) else "" for i in positions] for row in data]
+
+            if file_rows_needed is not None and len(data) >= file_rows_needed:
+                break
+
+        # Trim trailing empty rows
+        data = data[: last_row_with_data + 1]
+
+        if len(data) > 0:
+            # extend rows to max width
+            max_width = max(len(data_row) for data_row in data)
+            if min(len(data_row) for data_row in data) < max_width:
+                empty_cell = [""]
+                data = [data_row + (max_width - len(data_row)) * empty_cell for data_row in data]
+
+        return data
+
 
 class _MACPieOpenpyxlWriter(pd.io.excel._OpenpyxlWriter, MACPieExcelWriter):
     if compat.PANDAS_GE_15:
@@ -41,6 +92,11 @@ class _MACPieOpenpyxlWriter(pd.io.excel._OpenpyxlWriter, MACPieExcelWriter):
     else:
         engine = "mp_openpyxl"
 
+    def __init__(self, *args, streaming=None, **kwargs):
+        if streaming:
+            raise ValueError("Streaming writes are only supported by the mp_xlsxwriter engine.")
+        super().__init__(*args, **kwargs)
+
     @property
     def sheet_names(self):
         return list(self.book.sheetnames)
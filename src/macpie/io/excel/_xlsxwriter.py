@@ -1,4 +1,6 @@
+import datetime
 import json
+import math
 
 import pandas as pd
 import tablib as tl
@@ -31,6 +33,7 @@ class _MACPieXlsxWriter(pd.io.excel._XlsxWriter, MACPieExcelWriter):
         storage_options=None,
         if_sheet_exists=None,
         engine_kwargs=None,
+        streaming=None,
         **kwargs,
     ):
         super().__init__(
@@ -46,6 +49,16 @@ class _MACPieXlsxWriter(pd.io.excel._XlsxWriter, MACPieExcelWriter):
 
         engine_kwargs = pd.io.excel._util.combine_kwargs(engine_kwargs, kwargs)
 
+        options = engine_kwargs.get("options") or {}
+        if streaming is None:
+            streaming = options.get("constant_memory") or get_option("excel.writer.streaming")
+        self.streaming = bool(streaming)
+        if self.streaming:
+            # each row is written to a temporary file as soon as a later row is written
+            engine_kwargs = {**engine_kwargs, "options": {**options, "constant_memory": True}}
+        # last row written to each sheet, to check that rows are written in order when streaming
+        self._last_rows = {}
+
         if compat.PANDAS_GE_15:
             self._book = MACPieXlsxWriterWorkbook(self._handles.handle, **engine_kwargs)
         else:
@@ -77,6 +90,157 @@ class _MACPieXlsxWriter(pd.io.excel._XlsxWriter, MACPieExcelWriter):
             ws.write_row(row_index, 0, [json.dumps(cell) for cell in row])
             row_index += 1
 
+    def _write_cells(self, cells, sheet_name=None, startrow=0, startcol=0, freeze_panes=None):
+        if self.streaming:
+            sheet_name = self._get_sheet_name(sheet_name)
+            cells = self._check_row_order(cells, sheet_name, startrow)
+        super()._write_cells(
+            cells,
+            sheet_name=sheet_name,
+            startrow=startrow,
+            startcol=startcol,
+            freeze_panes=freeze_panes,
+        )
+
+    def _check_row_order(self, cells, sheet_name, startrow):
+        for cell in cells:
+            self._check_row(sheet_name, startrow + cell.row)
+            yield cell
+
+    def _check_row(self, sheet_name, row):
+        last_row = self._last_rows.get(sheet_name, 0)
+        if row < last_row:
+            raise ValueError(
+                f"Cannot write row {row} of sheet '{sheet_name}' after row {last_row}: "
+                "a streaming writer writes the rows of a sheet in order."
+            )
+        self._last_rows[sheet_name] = row
+
+    def write_body_blocks(self, blocks, sheet_name=None, startrow=0, startcol=0, num_rows=None):
+        """Write the index and body of a DataFrame formatted by blocks of rows (see
+        :meth:`macpie.io.formats.excel.MACPieExcelFormatter.get_formatted_body_blocks`)
+        to an existing sheet, row by row, with the writer method for the type
+        of values of each column.
+
+        If the sheet autofits its columns, the strings of each column are measured
+        once per block (see :meth:`MACPieXlsxWriterWorksheet.autofit_values`)
+        instead of as each one is written. If the ``excel.writer.autofit_sample_size``
+        option is set, only that many of the ``num_rows`` rows (evenly spaced) are
+        measured.
+        """
+        sheet_name = self._get_sheet_name(sheet_name)
+        wks = self.book.get_worksheet_by_name(sheet_name)
+
+        style_dict = {"null": None}
+
+        def get_format(style, fmt):
+            # same formats as _write_cells
+            stylekey = json.dumps(style)
+            if fmt:
+                stylekey += fmt
+            if stylekey not in style_dict:
+                style_dict[stylekey] = self.book.add_format(
+                    pd.io.excel._xlsxwriter._XlsxStyler.convert(style, fmt)
+                )
+            return style_dict[stylekey]
+
+        datetime_fmt = self._value_with_fmt(datetime.datetime(2000, 1, 1))[1]
+        kind_writers = {
+            "number": (wks.write_number, None),
+            "bool": (wks.write_boolean, None),
+            "datetime": (wks.write_datetime, datetime_fmt),
+        }
+
+        autofit = getattr(wks, "autofit_columns", False)
+        sample_size = get_option("excel.writer.autofit_sample_size")
+        sample_step = 1
+        if sample_size and num_rows:
+            sample_step = max(math.ceil(num_rows / sample_size), 1)
+        rows_seen = 0
+
+        if autofit:
+            # the strings are measured by block below instead of as they are written
+            wks.autofit_columns = False
+        try:
+            for block in blocks:
+                if self.streaming and block.nrows:
+                    self._check_row(sheet_name, startrow + block.row)
+
+                # the formats of each column by (row) style, for values of its kind
+                # and for strings (i.e. missing values), and its styles for other values
+                columns = []
+                for column in block.columns:
+                    if column.style is None:
+                        styles = block.row_styles
+                    else:
+                        styles = [column.style] * len(block.row_styles)
+                    write_kind, fmt = kind_writers.get(column.kind, (None, None))
+                    columns.append(
+                        (
+                            startcol + column.col,
+                            column.values,
+                            write_kind,
+                            [get_format(style, fmt) for style in styles],
+                            [get_format(style, None) for style in styles],
+                            styles,
+                        )
+                    )
+
+                    if autofit and sample_size != 0:
+                        sample_start = -rows_seen % sample_step
+                        wks.autofit_values(
+                            startcol + column.col, column.values[sample_start::sample_step]
+                        )
+                rows_seen += block.nrows
+
+                if block.row_style_codes is not None:
+                    style_codes = block.row_style_codes.tolist()
+                else:
+                    style_codes = [0] * block.nrows
+
+                columns_by_col = {column[0]: column for column in columns}
+
+                row = startrow + block.row
+                for i, code in enumerate(style_codes):
+                    for col, values, write_kind, kind_formats, str_formats, styles in columns:
+                        val = values[i]
+                        if val.__class__ is str:
+                            wks.write(row + i, col, val, str_formats[code])
+                        elif val is None:
+                            # covered by a merged cell
+                            wks.write_blank(row + i, col, None, str_formats[code])
+                        elif write_kind is None:
+                            val, fmt = self._value_with_fmt(val)
+                            wks.write(row + i, col, val, get_format(styles[code], fmt))
+                        else:
+                            write_kind(row + i, col, val, kind_formats[code])
+
+                for first_row, first_col, last_row, last_col in block.merges:
+                    # the merged cell, with the same value and format as written above
+                    # (a streaming writer gets no merges, see get_formatted_body_blocks)
+                    i = first_row - block.row
+                    _, values, _, _, str_formats, styles = columns_by_col[startcol + first_col]
+                    val = values[i]
+                    if val.__class__ is str:
+                        fmt = str_formats[style_codes[i]]
+                    else:
+                        val, fmt = self._value_with_fmt(val)
+                        fmt = get_format(styles[style_codes[i]], fmt)
+                    wks.merge_range(
+                        startrow + first_row,
+                        startcol + first_col,
+                        startrow + last_row,
+                        startcol + last_col,
+                        val,
+                        fmt,
+                    )
+
+                if self.streaming and block.nrows:
+                    self._last_rows[sheet_name] = startrow + block.row + block.nrows - 1
+        finally:
+            if autofit:
+                wks.autofit_columns = autofit
+
     def write_tablib_dataset(self, tlset: tl.Dataset, freeze_panes=True):
         sheet_name = (
             safe_xlsx_sheet_title(tlset.title, "-")
@@ -164,26 +328,28 @@ class MACPieXlsxWriterWorksheet(xlsxwriter.worksheet.Worksheet):
         if self._check_dimensions(row, col):
             return -1
 
-        def excel_string_width(str):
-            """Calculate the length of the string in Excel character units."""
-
-            string_width = len(str)
-
-            if string_width == 0:
-                return 0
-            else:
-                return string_width * 1.1
-
-        # Set the min width for the cell. In some cases this might be the
-        # default width of 8.43. In this case we use 0 and adjust for all
-        # string widths.
-        min_width = 0
-
-        # Check if it the string is the largest we have seen for this column.
-        string_width = excel_string_width(string)
-        if string_width > min_width:
-            max_width = self.max_column_widths.get(col, min_width)
-            if string_width > max_width:
+        # Calculate the length of the string in Excel character units.
+        # Strings of width 0 don't change the width of the column.
+        string_width = len(string) * 1.1
+        if string_width > self.max_column_widths.get(col, 0):
+            self.max_column_widths[col] = string_width
+
+    def autofit_values(self, col, values):
+        """Store the width of the longest string of ``values`` (of any type),
+        to be written in column ``col``, measuring them all at once.
+        """
+        strings = pd.Series(values, dtype=object)
+        try:
+            if self.strip_carriage_returns:
+                strings = strings.str.replace("\r", "", regex=False)
+            max_length = strings.str.len().max()
+        except AttributeError:
+            # no strings
+            return
+
+        if max_length > 0:
+            string_width = max_length * 1.1
+            if string_width > self.max_column_widths.get(col, 0):
                 self.max_column_widths[col] = string_width
 
     def do_strip_carriage_returns(self, row, col, string, cell_format=None):
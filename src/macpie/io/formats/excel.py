@@ -2,7 +2,7 @@
 Utilities for conversion to writer-agnostic Excel representation.
 """
 
-from typing import Callable, Iterable
+from typing import Callable, Iterable, List, NamedTuple, Optional
 
 import numpy as np
 import pandas as pd
@@ -16,18 +16,283 @@ def highlight_axis_by_predicate(s: pd.Series, axis_label=None, predicate=None, c
     if predicate is None:
         predicate = bool
 
+    if predicate(s[axis_label]):
+        return _highlight_style(color)
+    return None
+
+
+def _highlight_style(color):
     style_converter = CSSToExcelConverter()
     css = f"background-color: {color}"
-    xlstyle = style_converter(css)
+    return style_converter(css)
 
-    if predicate(s[axis_label]):
-        return xlstyle
-    return None
+
+class ExcelBodyColumn(NamedTuple):
+    """The cells of a column of a block of rows of the body of a DataFrame,
+    formatted to be written all at once instead of as one
+    :class:`~pandas.io.formats.excel.ExcelCell` per cell.
+    """
+
+    #: Column of the cells
+    col: int
+
+    #: Formatted values, i.e. missing values are ``na_rep``, infinite
+    #: values are ``inf_rep`` and floats are formatted with ``float_format``.
+    #: None for the cells that are blank (i.e. covered by a merged cell)
+    values: list
+
+    #: The type of the values that aren't strings: "number", "bool", "datetime",
+    #: or None if the values can be of any type
+    kind: Optional[str]
+
+    #: Style of the cells, or None if given by row in the ``ExcelBodyBlock``
+    style: Optional[dict]
+
+
+class ExcelBodyBlock(NamedTuple):
+    """A block of consecutive rows of the body of a DataFrame."""
+
+    #: Row of the first cells
+    row: int
+
+    #: Number of rows
+    nrows: int
+
+    columns: List[ExcelBodyColumn]
+
+    #: Position of the style of each row in ``row_styles``, or None if the
+    #: cells have the style of their column
+    row_style_codes: Optional[np.ndarray]
+
+    row_styles: list
+
+    #: ``(first_row, first_col, last_row, last_col)`` of the cells to merge
+    #: that start in this block (e.g. of a MultiIndex index)
+    merges: list
 
 
 class MACPieExcelFormatter(ExcelFormatter):
+    #: Number of rows of the body formatted at a time when writing it by blocks
+    body_block_size = 10_000
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._body_origin = None
+
+    def write(
+        self,
+        writer,
+        sheet_name="Sheet1",
+        startrow=0,
+        startcol=0,
+        freeze_panes=None,
+        engine=None,
+        storage_options=None,
+    ):
+        """Write the formatted cells to ``writer``. If ``writer`` can write the
+        body by blocks of rows (i.e. has a ``write_body_blocks`` method), the
+        index and body are formatted by column instead of cell by cell, see
+        :meth:`get_formatted_body_blocks`.
+
+        A streaming ``writer`` (see :class:`macpie.MACPieExcelWriter`) needs
+        the cells in row order, so it must be able to write the body by blocks,
+        and the labels of a MultiIndex index are written in every row instead
+        of as merged cells.
+        """
+        write_body_blocks = getattr(writer, "write_body_blocks", None)
+        if getattr(writer, "streaming", False) and (
+            write_body_blocks is None or not self.can_format_body_blocks()
+        ):
+            raise ValueError(
+                "Cannot write with a streaming writer: the cells can only be written "
+                "in row order without a Styler, and with axis stylers that style "
+                "columns or highlight_axis_by_predicate."
+            )
+        if write_body_blocks is None or not self.can_format_body_blocks():
+            return super().write(
+                writer,
+                sheet_name=sheet_name,
+                startrow=startrow,
+                startcol=startcol,
+                freeze_panes=freeze_panes,
+                engine=engine,
+                storage_options=storage_options,
+            )
+
+        # write the header cells, which records where the index and body start
+        self._body_origin = ()
+        try:
+            super().write(
+                writer,
+                sheet_name=sheet_name,
+                startrow=startrow,
+                startcol=startcol,
+                freeze_panes=freeze_panes,
+            )
+            write_body_blocks(
+                self.get_formatted_body_blocks(
+                    merge_index_cells=not getattr(writer, "streaming", False)
+                ),
+                sheet_name=sheet_name,
+                startrow=startrow,
+                startcol=startcol,
+                num_rows=len(self.df.index),
+            )
+        finally:
+            self._body_origin = None
+
+    def can_format_body_blocks(self):
+        """Whether the body can be formatted by :meth:`get_formatted_body_blocks`,
+        i.e. there is no :class:`pandas.io.formats.style.Styler`, and any axis
+        styler styles columns or is :func:`highlight_axis_by_predicate`.
+        """
+        if self.styler is not None:
+            return False
+        if self.axis_styler:
+            axis, func, kwargs = self.axis_styler
+            return axis == 0 or func is highlight_axis_by_predicate
+        return True
+
+    def get_formatted_cells(self) -> Iterable[ExcelCell]:
+        if self._body_origin is None:
+            return super().get_formatted_cells()
+        # only the header cells, sorted for writers that need them in row order
+        return sorted(super().get_formatted_cells(), key=lambda cell: (cell.row, cell.col))
+
+    def get_formatted_body_blocks(self, merge_index_cells=True) -> Iterable[ExcelBodyBlock]:
+        """Format the index and body of the frame by blocks of
+        :attr:`body_block_size` rows, each column of a block at once.
+
+        If ``merge_index_cells`` is False, the labels of a MultiIndex index are
+        formatted in every row, instead of once per span of rows to merge
+        (e.g. for a streaming writer, which can't merge the cells of rows it
+        has already written).
+        """
+        rowcounter, coloffset = self._body_origin
+        num_rows = len(self.df.index)
+        index_spans = self._get_index_spans() if merge_index_cells else None
+
+        row_style_codes = None
+        row_styles = [None]
+        col_styles = [None] * len(self.columns)
+        if self.axis_styler:
+            axis, func, kwargs = self.axis_styler
+            if axis == 1:
+                # func is highlight_axis_by_predicate
+                predicate = kwargs.get("predicate") or bool
+                highlighted = self.df[kwargs.get("axis_label")].map(predicate)
+                row_style_codes = highlighted.to_numpy(dtype=bool).astype(np.intp)
+                row_styles = [None, _highlight_style(kwargs.get("color", "yellow"))]
+            else:
+                col_styles = [
+                    func(self.df.iloc[:, colidx], **kwargs) for colidx in range(len(self.columns))
+                ]
+
+        for start in range(0, num_rows, self.body_block_size):
+            stop = min(start + self.body_block_size, num_rows)
+            columns, merges = self._format_index_block(start, stop, rowcounter, index_spans)
+            for colidx in range(len(self.columns)):
+                values, kind = self._format_body_column(self.df.iloc[start:stop, colidx])
+                columns.append(
+                    ExcelBodyColumn(colidx + coloffset, values, kind, col_styles[colidx])
+                )
+            yield ExcelBodyBlock(
+                row=rowcounter + start,
+                nrows=stop - start,
+                columns=columns,
+                row_style_codes=(
+                    row_style_codes[start:stop] if row_style_codes is not None else None
+                ),
+                row_styles=row_styles,
+                merges=merges,
+            )
+
+    def _get_index_spans(self):
+        """The spans of the values of each level of a MultiIndex index written
+        as merged cells (see :meth:`_format_hierarchical_rows`), or None.
+        """
+        if not (self.index and self.merge_cells and isinstance(self.df.index, pd.MultiIndex)):
+            return None
+        level_strs = self.df.index.format(sparsify=True, adjoin=False, names=False)
+        spans = []
+        for level_spans in get_level_lengths(level_strs):
+            starts = np.fromiter(level_spans.keys(), dtype=np.intp, count=len(level_spans))
+            lengths = np.fromiter(level_spans.values(), dtype=np.intp, count=len(level_spans))
+            spans.append((starts, lengths))
+        return spans
+
+    def _format_index_block(self, start, stop, rowcounter, index_spans):
+        """Format rows ``start`` to ``stop`` of the index, as
+        :meth:`_format_regular_rows` and :meth:`_format_hierarchical_rows` would.
+        Returns the formatted columns and the cells to merge.
+        """
+        columns = []
+        merges = []
+        if not self.index:
+            return columns, merges
+
+        index = self.df.index[start:stop]
+        if not isinstance(index, pd.MultiIndex):
+            if isinstance(index, pd.PeriodIndex):
+                index = index.to_timestamp()
+            values, kind = self._format_body_column(pd.Series(index, copy=False))
+            columns.append(ExcelBodyColumn(0, values, kind, self.header_style))
+            return columns, merges
+
+        for lnum in range(index.nlevels):
+            level_values = index.get_level_values(lnum)
+            if index_spans is None:
+                values, kind = self._format_body_column(pd.Series(level_values, copy=False))
+            else:
+                # only the first cell of each span has a value, the others are merged to it
+                starts, lengths = index_spans[lnum]
+                in_block = (starts >= start) & (starts < stop)
+                values = [None] * (stop - start)
+                for i, length in zip(starts[in_block].tolist(), lengths[in_block].tolist()):
+                    values[i - start] = self._format_value(level_values[i - start])
+                    if length > 1:
+                        merges.append((rowcounter + i, lnum, rowcounter + i + length - 1, lnum))
+                kind = None
+            columns.append(ExcelBodyColumn(lnum, values, kind, self.header_style))
+        return columns, merges
+
+    def _format_body_column(self, series: pd.Series):
+        """Format the values of ``series`` as :meth:`_format_value` would,
+        vectorized for columns of numpy bool, int, float and (timezone naive)
+        datetime dtypes.
+        """
+        dtype = series.dtype
+        kind = dtype.kind if isinstance(dtype, np.dtype) else None
+
+        if kind == "b":
+            return series.tolist(), "bool"
+
+        if kind in ("i", "u"):
+            return series.tolist(), "number"
+
+        if kind == "f":
+            arr = series.to_numpy()
+            if self.float_format is not None:
+                values = [float(self.float_format % val) for val in arr.tolist()]
+            else:
+                values = arr.tolist()
+            for i in np.flatnonzero(~np.isfinite(arr)).tolist():
+                val = arr[i]
+                if np.isnan(val):
+                    values[i] = self.na_rep
+                elif val > 0:
+                    values[i] = self.inf_rep
+                else:
+                    values[i] = f"-{self.inf_rep}"
+            return values, "number"
+
+        if kind == "M":
+            values = series.dt.to_pydatetime().tolist()
+            for i in np.flatnonzero(series.isna().to_numpy()).tolist():
+                values[i] = self.na_rep
+            return values, "datetime"
+
+        return [self._format_value(val) for val in series], None
 
     @property
     def axis_styler(self):
@@ -145,7 +410,11 @@ class MACPieExcelFormatter(ExcelFormatter):
                 for cidx, name in enumerate(index_labels):
                     yield ExcelCell(self.rowcounter - 1, cidx, name, self.header_style)
 
-            if self.merge_cells:
+            if self._body_origin is not None:
+                # the index is written by blocks with the body, see write()
+                gcolidx = self.df.index.nlevels
+
+            elif self.merge_cells:
                 # Format hierarchical rows as merged cells.
                 level_strs = self.df.index.format(sparsify=True, adjoin=False, names=False)
                 level_lengths = get_level_lengths(level_strs)
@@ -197,7 +466,41 @@ class MACPieExcelFormatter(ExcelFormatter):
 
         yield from self._generate_body(gcolidx)
 
+    def _format_regular_rows(self) -> Iterable[ExcelCell]:
+        if self._body_origin is None:
+            yield from super()._format_regular_rows()
+            return
+
+        # as the parent, but the index is written by blocks with the body, see write()
+        if self._has_aliases or self.header:
+            self.rowcounter += 1
+
+        coloffset = 0
+        if self.index:
+            if self.index_label and isinstance(
+                self.index_label, (list, tuple, np.ndarray, pd.Index)
+            ):
+                index_label = self.index_label[0]
+            elif self.index_label and isinstance(self.index_label, str):
+                index_label = self.index_label
+            else:
+                index_label = self.df.index.names[0]
+
+            if isinstance(self.columns, pd.MultiIndex):
+                self.rowcounter += 1
+
+            if index_label and self.header is not False:
+                yield ExcelCell(self.rowcounter - 1, 0, index_label, self.header_style)
+
+            coloffset = 1
+
+        yield from self._generate_body(coloffset)
+
     def _generate_body(self, coloffset: int) -> Iterable[ExcelCell]:
+        if self._body_origin is not None:
+            # the body is written by blocks, see write()
+            self._body_origin = (self.rowcounter, coloffset)
+            return
         if self.axis_styler:
             axis, func, kwargs = self.axis_styler
             if axis == 1:
@@ -1,6 +1,6 @@
 # flake8: noqa
 
-from macpie.pandas.combine import date_proximity, merge
+from macpie.pandas.combine import date_proximity, date_proximity_many, merge
 
 from macpie.pandas.compare import compare, diff_cols, diff_rows, equals
 
@@ -10,6 +10,7 @@ from macpie.pandas.describe import (
     add_diff_days,
     any_duplicates,
     count_trailers,
+    duplicated_sorted,
     is_date_col,
     mark_duplicates_by_cols,
 )
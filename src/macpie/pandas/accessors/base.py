@@ -0,0 +1,84 @@
+import functools
+
+
+class _MacAccessor:
+    """
+    Base class of the ``mac`` accessors, which make the functions in their
+    ``accessor_api`` list available as methods of the pandas object using the
+    accessor (which is passed to them as their first argument).
+    """
+
+    accessor_api = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # name -> function, to look up accessor functions without scanning accessor_api
+        cls._accessor_funcs = {func.__name__: func for func in cls.accessor_api}
+
+    def __init__(self, obj):
+        self._validate(obj)
+        self._obj = obj
+
+    @staticmethod
+    def _validate(obj):
+        pass
+
+    def __getattr__(self, attr):
+        try:
+            func = type(self)._accessor_funcs[attr]
+        except KeyError:
+            raise AttributeError(
+                f"Function not available on this accessor: {self.__class__}.'{attr}'"
+            ) from None
+        # pandas caches the accessor on the object, so cache the bound function
+        # on the accessor, where later lookups find it without calling __getattr__
+        bound_func = functools.partial(func, self._obj)
+        self.__dict__[attr] = bound_func
+        return bound_func
+
+    @classmethod
+    def register(cls, func=None, *, name=None):
+        """
+        Make ``func`` available on this accessor (as ``name``, by default
+        the name of ``func``). Can be used as a decorator.
+
+        Parameters
+        ----------
+        func : callable
+            Function whose first argument is the DataFrame or Series using
+            the accessor
+        name : str, optional
+            Name to call it by via the ``mac`` namespace
+
+        Returns
+        -------
+        callable
+            ``func``, unchanged
+
+        Examples
+        --------
+        >>> import pandas as pd
+        >>> import macpie as mp
+
+        >>> @mp.MacDataFrameAccessor.register
+        ... def first_col_name(df):
+        ...     return df.columns[0]
+        >>> pd.DataFrame({'numeric_col': [1]}).mac.first_col_name()
+        'numeric_col'
+
+        >>> @mp.MacSeriesAccessor.register
+        ... def first_value(ser):
+        ...     return ser.iloc[0]
+        >>> pd.Series([1, 2, 3]).mac.first_value()
+        1
+        """
+        if func is None:
+            return functools.partial(cls.register, name=name)
+
+        name = func.__name__ if name is None else name
+        if name in cls._accessor_funcs:
+            raise ValueError(f"accessor function already registered: {name}")
+
+        cls.accessor_api.append(func)
+        cls._accessor_funcs[name] = func
+        return func
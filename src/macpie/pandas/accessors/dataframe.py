@@ -1,12 +1,11 @@
-import functools
-
 import pandas as pd
 
 import macpie.pandas as mppd
+from macpie.pandas.accessors.base import _MacAccessor
 
 
 @pd.api.extensions.register_dataframe_accessor("mac")
-class MacDataFrameAccessor:
+class MacDataFrameAccessor(_MacAccessor):
     """
     Custom DataFrame accessor to extend the :class:`pandas.DataFrame` object.
     This creates an additional namepace on the DataFrame object called ``mac``.
@@ -37,9 +36,11 @@ class MacDataFrameAccessor:
         mppd.compare,
         mppd.conform,
         mppd.date_proximity,
+        mppd.date_proximity_many,
         mppd.diff_cols,
         mppd.diff_rows,
         mppd.drop_suffix,
+        mppd.duplicated_sorted,
         mppd.equals,
         mppd.filter_by_id,
         mppd.filter_labels,
@@ -63,25 +64,8 @@ class MacDataFrameAccessor:
         mppd.to_datetime,
     ]
 
-    def __init__(self, df):
-        self._validate(df)
-        self._df = df
-
-    @staticmethod
-    def _validate(obj):
-        pass
-
-    def __getattr__(self, attr):
-        try:
-            func = next(filter(lambda f: f.__name__ == attr, MacDataFrameAccessor.accessor_api))
-            return functools.partial(func, self._df)
-        except StopIteration:
-            raise AttributeError(
-                f"Function not available on this accessor: {self.__class__}.'{attr}'"
-            )
-
     def col_count(self):
-        return len(self._df.columns)
+        return len(self._obj.columns)
 
     def row_count(self):
-        return len(self._df.index)
+        return len(self._obj.index)
@@ -1,12 +1,11 @@
-import functools
-
 import pandas as pd
 
 import macpie.pandas as mppd
+from macpie.pandas.accessors.base import _MacAccessor
 
 
 @pd.api.extensions.register_series_accessor("mac")
-class MacSeriesAccessor:
+class MacSeriesAccessor(_MacAccessor):
     """
     Custom Series accessor to extend the :class:`pandas.DataSeriesFrame` object.
     This creates an additional namepace on the Series object called ``mac``.
@@ -38,24 +37,8 @@ class MacSeriesAccessor:
 
     accessor_api = [
         mppd.count_trailers,
+        mppd.duplicated_sorted,
         mppd.remove_trailers,
         mppd.rtrim,
         mppd.rtrim_longest,
     ]
-
-    def __init__(self, ser):
-        self._validate(ser)
-        self._ser = ser
-
-    @staticmethod
-    def _validate(obj):
-        pass
-
-    def __getattr__(self, attr):
-        try:
-            func = next(filter(lambda f: f.__name__ == attr, MacSeriesAccessor.accessor_api))
-            return functools.partial(func, self._ser)
-        except StopIteration:
-            raise AttributeError(
-                f"Function not available on this accessor: {self.__class__}.'{attr}'"
-            )
@@ -1,10 +1,19 @@
-from typing import Optional
-import warnings
-
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import copy
+import itertools
+import os
+from typing import List, Optional
+
+import numpy as np
 import pandas as pd
 
 from macpie._config import get_option
-from macpie.tools import lltools, validatortools
+from macpie.pandas.describe import duplicated_sorted
+from macpie.tools import datetimetools, lltools, strtools, validatortools
+
+# integer value of a missing datetime64[ns]
+_iNaT = np.iinfo(np.int64).min
 
 
 def date_proximity(
@@ -26,6 +35,10 @@ def date_proximity(
     merge="partial",
     merge_suffixes=get_option("operators.binary.column_suffixes"),
     prepend_levels=(None, None),
+    engine: str = "merge",
+    partitions: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+    link_index=None,
 ) -> pd.DataFrame:
     """
     Links data across two :class:`pandas.DataFrame` objects by date proximity.
@@ -39,8 +52,11 @@ def date_proximity(
     ----------
     left : DataFrame
         Contains the timepoint anchor
-    right : DataFrame
-        To be linked to ``left``
+    right : DataFrame or iterable of DataFrame
+        To be linked to ``left``. Can also be an iterable of DataFrame chunks
+        with the same columns (e.g. from ``pd.read_csv(..., chunksize=...)`` or
+        the record batches of a Parquet file), which are linked one at a time
+        so ``right`` never has to be loaded into memory all at once.
     id_on: str
         Primary column to join on. These must be found in both DataFrames.
     id_left_on : str
@@ -70,7 +86,11 @@ def date_proximity(
         * later: get only rows that are lter (more recent) than the timepoint anchor
         * earlier_or_later: get rows that are earlier or later than the timepoint anchor
     days : int, default 90
-        The time range measured in days
+        The time range measured in days, including fractions of days from the time
+        of day of the dates. If the ``operators.dates.fractional_days`` option is
+        set to False, days are counted between the days of the dates instead,
+        ignoring their time of day (see :func:`macpie.datetimetools.to_day_ordinals`),
+        so ``diff_days`` are whole numbers.
     left_link_id : str, optional
         The id column in the left DataFrame to act as the primary key of that
         data. This helps to ensure there are no duplicates in the left
@@ -100,6 +120,33 @@ def date_proximity(
         Pass a value of ``None`` instead of a string to indicate that the column
         index in ``left`` or ``right`` should be left as-is. At least one of the
         values must not be ``None``.
+    engine : {'merge', 'interval'}, default 'merge'
+        Indicates how candidate rows of the right DataFrame are found
+
+        * merge: merge all rows of the right DataFrame with the same id, then
+          filter out the ones outside of the time range
+        * interval: sort both DataFrames by id and date, and only generate the
+          rows that are within the time range (or only the nearest rows if
+          ``get='closest'``). Uses far less memory when ids have many rows on
+          both sides. Results are identical to ``merge``.
+    partitions : int, optional
+        Split the ids into this many partitions (by the position of the first
+        row of each id in ``left``, modulo ``partitions``) and link one
+        partition at a time, so that at most one partition's worth of merged
+        rows is held in memory. If ``right`` is an iterable of chunks, each
+        chunk is split up. Only ``right`` can be read in chunks: ``left`` (and
+        its id codes and dates) is always held in memory in full. Results are
+        identical to linking everything at once.
+    n_jobs : int, optional
+        Number of processes to use to find the rows to link, one partition
+        of the ids per task (``partitions`` defaults to ``n_jobs``). ``-1``
+        means using all processors. Results are identical to using a single
+        process.
+    link_index : LinkIndex, optional
+        A :class:`macpie.LinkIndex` built from the ``id_left_on`` and
+        ``date_left_on`` columns of ``left``, so they don't need to be
+        converted, factorized and checked for duplicates again. Raises a
+        ValueError if it wasn't built from them (see :meth:`macpie.LinkIndex.validate`).
 
     Returns
     -------
@@ -126,10 +173,85 @@ def date_proximity(
         merge=merge,
         merge_suffixes=merge_suffixes,
         prepend_levels=prepend_levels,
+        engine=engine,
+        partitions=partitions,
+        n_jobs=n_jobs,
+        link_index=link_index,
     )
     return op.get_result()
 
 
+def date_proximity_many(left, rights, rights_options=None, **kwargs) -> List[pd.DataFrame]:
+    """
+    Links data across a "left" :class:`pandas.DataFrame` and each of several
+    "right" DataFrames by date proximity.
+
+    Same as calling :func:`date_proximity` once for every DataFrame in
+    ``rights``, except that ``left`` is only validated and prepared once
+    (column lookups, date conversion, suffixes and its id index), and that
+    work is reused for every right DataFrame.
+
+    Parameters
+    ----------
+    left : DataFrame
+        Contains the timepoint anchor
+    rights : iterable of DataFrame
+        To be linked to ``left``, one at a time. Every element can also be an
+        iterable of DataFrame chunks (see :func:`date_proximity`).
+    rights_options : iterable of dict, optional
+        One dict for each DataFrame in ``rights``, whose ``id_right_on``,
+        ``date_right_on`` and ``right_level`` (the right level of
+        ``prepend_levels``) keys, if any, are used for that DataFrame instead
+        of the ones in ``kwargs``.
+    **kwargs
+        Keyword arguments of :func:`date_proximity`, used for every right
+        DataFrame.
+
+    Returns
+    -------
+    List[DataFrame]
+        A DataFrame of the linked objects for each DataFrame in ``rights``.
+    """
+    if rights_options is None:
+        rights_options = itertools.repeat({})
+
+    # options of each right not in its rights_options
+    left_level, right_level = kwargs.get("prepend_levels", (None, None))
+    default_options = {
+        "id_right_on": kwargs.get("id_right_on", kwargs.get("id_on")),
+        "date_right_on": kwargs.get("date_right_on", kwargs.get("date_on")),
+        "right_level": right_level,
+    }
+
+    results = []
+    op = None
+    for right, options in zip(rights, rights_options):
+        if op is None:
+            first_kwargs = dict(kwargs)
+            for side in ["id", "date"]:
+                if f"{side}_right_on" in options:
+                    # id_on/date_on can't be combined with id_right_on/date_right_on
+                    if first_kwargs.get(f"{side}_on") is not None:
+                        first_kwargs[f"{side}_left_on"] = first_kwargs.pop(f"{side}_on")
+                    first_kwargs[f"{side}_right_on"] = options[f"{side}_right_on"]
+            first_kwargs["prepend_levels"] = (
+                left_level,
+                options.get("right_level", right_level),
+            )
+            op = _DateProximityOperation(left, right, **first_kwargs)
+        else:
+            options = {**default_options, **options}
+            op = op._with_right(
+                right,
+                id_right_on=options["id_right_on"],
+                date_right_on=options["date_right_on"],
+                right_level=options["right_level"],
+            )
+        results.append(op.get_result())
+
+    return results
+
+
 class _DateProximityOperation:
     def __init__(
         self,
@@ -151,6 +273,10 @@ class _DateProximityOperation:
         merge="partial",
         merge_suffixes=get_option("operators.binary.column_suffixes"),
         prepend_levels=(None, None),
+        engine: str = "merge",
+        partitions: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        link_index=None,
     ):
         self.left = left
         self.right = right
@@ -189,127 +315,335 @@ class _DateProximityOperation:
         self.merge = merge
         self.merge_suffixes = merge_suffixes
         self.prepend_levels = prepend_levels
+        self.engine = engine
+        self.partitions = partitions
+        self.n_jobs = n_jobs
+        self.link_index = link_index
 
         self._left_suffix = get_option("operators.binary.column_suffixes")[0]
         self._right_suffix = get_option("operators.binary.column_suffixes")[1]
-        self._diff_days_col = get_option("column.system.diff_days")
-        self._abs_diff_days_col = get_option("column.system.abs_diff_days")
         self._merge_indicator_col = get_option("column.system.merge")
+        self._fractional_days = get_option("operators.dates.fractional_days")
 
         self._validate_specification()
 
     def get_result(self):
-        result = self._get_all()
+        pairs = self._get_all()
         if self.get == "closest":
-            result = self._get_closest(result)
-        result = self._handle_dropna(result)
-        result = self._handle_duplicates(result)
-        result = self._handle_merge(result)
+            pairs = self._get_closest(pairs)
+        pairs = self._handle_dropna(pairs)
+        pairs = self._handle_duplicates(pairs)
 
-        return result
+        return self._take_rows(pairs)
 
     def _get_all(self):
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            # Ignore the following warning caused when merging on dataframes
-            # with MultiIndex columns:
-            # PerformanceWarning: dropping on a non-lexsorted multi-index
-            # without a level parameter may impact performance.
-            # obj = obj._drop_axis(labels, axis, level=level, errors=errors)
-
-            everything = pd.merge(
-                self.link_table,
-                self.right,
-                how="left",
-                left_on=self.id_left_on,
-                right_on=self.id_right_on,
-                indicator=self._merge_indicator_col,
-            )
-
-        # fix the leveling of the merge indicator column created by pd.merge
-        if self._right_level:
-            everything.rename(
-                columns={
-                    self._merge_indicator_col: self._right_level,
-                    "": self._merge_indicator_col,
-                },
-                inplace=True,
-            )
+        """Pairs of left and right rows whose ids match and whose dates are within
+        range, as a DataFrame with the position of the left row in :attr:`link_table`
+        (``left``), the position of the right row in :attr:`_right_rows` (``right``)
+        and their date difference (``diff_days``).
+
+        Only the id and date columns are used, one partition of the ids (and one
+        chunk of ``right``) at a time. Pairs are ordered and indexed like the rows
+        of merging :attr:`link_table` with ``right`` on the id columns would be.
+        """
+        # the left side is the same for every right linked with _with_right
+        if self._left_codes is None and self.link_index is not None:
+            self._left_codes = self.link_index.get_row_codes()
+            self._left_dates = self.link_index.get_row_dates(self._fractional_days)
+            self._left_ids = self.link_index.ids
+        elif self._left_codes is None:
+            self._left_codes = self._get_left_id_codes()
+            self._left_dates = self._get_date_values(self.link_table[self.date_left_on])
+
+        left_codes = self._left_codes
+        left_dates = self._left_dates
+
+        n_ids = len(self._left_ids)
+        n_partitions = self.partitions or self._n_workers
+
+        # number of right rows seen so far for each id
+        n_matches = np.zeros(n_ids, dtype=np.int64)
+
+        left_indexers = []
+        right_indexers = []
+        right_ranks = []
+        right_dates_parts = []
+        right_parts = []
+        n_right_rows = 0
+
+        # ids are assigned to partitions by their code (their order of first
+        # appearance in left), round robin, so left is partitioned once for all chunks
+        left_partitions = _partition_positions(left_codes, n_partitions)
+        left_codes_parts = [left_codes[left_pos] for left_pos in left_partitions]
+        left_dates_parts = [left_dates[left_pos] for left_pos in left_partitions]
+
+        if self._n_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self._n_workers)
+        else:
+            executor = contextlib.nullcontext()
+
+        with executor:
+            mapper = executor.map if self._n_workers > 1 else map
+
+            for right in self._iter_right():
+                right_codes = self._get_right_id_codes(right)
+                right_dates = self._get_date_values(right[self.date_right_on])
+
+                # rank of each right row within its id, across all chunks
+                # (rows whose id isn't in left get a rank too, but are never linked)
+                matched_codes = np.where(right_codes >= 0, right_codes, n_ids)
+                ranks = pd.Series(matched_codes).groupby(matched_codes).cumcount().to_numpy()
+                ranks += np.append(n_matches, 0)[matched_codes]
+                n_matches += np.bincount(matched_codes, minlength=n_ids + 1)[:n_ids]
+
+                right_partitions = _partition_positions(right_codes, n_partitions)
+
+                candidates = mapper(
+                    _get_candidate_indexers,
+                    left_codes_parts,
+                    left_dates_parts,
+                    [right_codes[right_pos] for right_pos in right_partitions],
+                    [right_dates[right_pos] for right_pos in right_partitions],
+                    itertools.repeat(self.days),
+                    itertools.repeat(self.when),
+                    itertools.repeat(self.get),
+                    itertools.repeat(self.engine),
+                    itertools.repeat(self._fractional_days),
+                )
 
-        # create a column 'diff_days' with date difference in days
-        everything = everything.mac.add_diff_days(
-            self.date_left_on, self.date_right_on, self._diff_days_col
+                chunk_indexers = []
+                for left_pos, right_pos, (left_indexer, right_indexer) in zip(
+                    left_partitions, right_partitions, candidates
+                ):
+                    left_indexers.append(left_pos[left_indexer])
+                    chunk_indexers.append(right_pos[right_indexer])
+
+                chunk_indexer = np.concatenate(chunk_indexers)
+                right_ranks.append(ranks[chunk_indexer])
+                right_dates_parts.append(right_dates[chunk_indexer])
+
+                if self._right_chunks is None:
+                    right_indexers.append(chunk_indexer)
+                else:
+                    # chunks aren't kept around, so take the rows that can be linked now
+                    right_parts.append(right.take(chunk_indexer))
+                    right_indexers.append(np.arange(len(chunk_indexer)) + n_right_rows)
+                    n_right_rows += len(chunk_indexer)
+
+        if self._right_chunks is None:
+            self._right_rows = self.right
+        else:
+            self._right_rows = pd.concat(right_parts, ignore_index=True)
+
+        # position each row would have had in the full merge: every left row
+        # takes up one slot per right row with the same id (or one slot if none),
+        # and right rows keep their original order within an id
+        n_matches = n_matches[left_codes]
+        slots = np.maximum(n_matches, 1)
+        left_offsets = np.cumsum(slots) - slots
+
+        left_indexer = np.concatenate(left_indexers)
+        result_index = left_offsets[left_indexer] + np.concatenate(right_ranks)
+        order = np.argsort(result_index, kind="stable")
+
+        left_indexer = left_indexer[order]
+        right_dates = np.concatenate(right_dates_parts)[order]
+        diff_days = right_dates - left_dates[left_indexer]
+        if self._fractional_days:
+            diff_days = diff_days.view("m8[ns]") / np.timedelta64(1, "D")
+
+        # a left row without any id match would have made the full merge
+        # introduce missing values, which upcast the dtypes of right's columns
+        self._has_unmatched = bool((n_matches == 0).any())
+
+        pairs = pd.DataFrame(
+            {
+                "left": left_indexer,
+                "right": np.concatenate(right_indexers)[order],
+                "diff_days": diff_days,
+            },
+            index=result_index[order],
         )
 
-        # keep rows where the date differences within range
-        # create copy to avoid chained indexing and getting a SettingWithCopyWarning
-        all_candidates = everything.loc[abs(everything[self._diff_days_col]) <= self.days].copy()
+        # keep pairs where the date differences within range
+        pairs = pairs.loc[pairs["diff_days"].abs() <= self.days]
 
         if self.when == "earlier":
-            all_candidates = all_candidates.loc[all_candidates[self._diff_days_col] <= 0]
+            pairs = pairs.loc[pairs["diff_days"] <= 0]
         elif self.when == "later":
-            all_candidates = all_candidates.loc[all_candidates[self._diff_days_col] >= 0]
+            pairs = pairs.loc[pairs["diff_days"] >= 0]
+
+        return pairs
+
+    def _get_date_values(self, dates):
+        """int32 day ordinals of ``dates``, or int64 nanoseconds if counting
+        fractional days.
+        """
+        if self._fractional_days:
+            return pd.DatetimeIndex(dates).asi8
+        return datetimetools.to_day_ordinals(dates)
+
+    def _iter_right(self):
+        yield self.right
+        if self._right_chunks is not None:
+            for chunk in self._right_chunks:
+                yield self._prepare_right(chunk)
+
+    def _get_left_id_codes(self):
+        """Factorize the id columns of :attr:`link_table` into integer codes."""
+        codes, self._left_ids = _factorize_ids(_get_id_frame(self.link_table, self.id_left_on))
+        return codes
+
+    def _get_right_id_codes(self, right):
+        """Factorize the id columns of ``right`` into the codes of
+        :meth:`_get_left_id_codes`, or -1 for ids not in :attr:`link_table`.
+        """
+        n_ids = len(self._left_ids)
+        right_ids = _get_id_frame(right, self.id_right_on)
+        ids = pd.concat([self._left_ids, right_ids], ignore_index=True)
+        codes = ids.groupby(list(ids.columns), sort=False, dropna=False).ngroup().to_numpy()
+
+        lookup = np.full(codes.max(initial=-1) + 1, -1)
+        lookup[codes[:n_ids]] = np.arange(n_ids)
+
+        return lookup[codes[n_ids:]]
+
+    def _get_closest(self, pairs):
+        if self._left_ranks is None:
+            # rank of each left row when sorted on the link table columns
+            sorter = self.link_table.reset_index(drop=True).sort_values(
+                by=self.link_table_cols, na_position="last"
+            )
+            self._left_ranks = np.empty(len(sorter), dtype=np.int64)
+            self._left_ranks[sorter.index] = np.arange(len(sorter))
+            # rows with missing ids don't belong to any group when grouping by id
+            self._left_has_na_ids = self.link_table[self.id_left_on].isna().any(axis=1).to_numpy()
 
-        return all_candidates
+        pairs = pairs.assign(abs_diff_days=pairs["diff_days"].abs())
 
-    def _get_closest(self, all_candidates):
-        # create a column containing the absolute value of diff_days
-        all_candidates.loc[:, self._abs_diff_days_col] = all_candidates[self._diff_days_col].abs()
+        closest = pairs["abs_diff_days"] == pairs.groupby("left")["abs_diff_days"].transform("min")
+        closest &= ~self._left_has_na_ids[pairs["left"]]
+        pairs = pairs.loc[closest]
 
-        all_candidates = all_candidates.sort_values(
-            by=self.link_table_cols + [self._abs_diff_days_col],
-            # by=['index', self._abs_diff_days_col],
-            inplace=False,
-            na_position="last",
-        )
+        # sort by the link table columns of the left row, then abs_diff_days
+        order = np.lexsort((pairs["abs_diff_days"], self._left_ranks[pairs["left"]]))
 
-        groupby_cols = self.id_left_on + [self.date_left_on]
+        return pairs.take(order)
 
-        closest_candidates = all_candidates[
-            (
-                all_candidates[self._abs_diff_days_col]
-                == all_candidates.groupby(groupby_cols)[[self._abs_diff_days_col]].transform(
-                    "min"
-                )[self._abs_diff_days_col]
-            )
-        ]
+    def _handle_dropna(self, pairs):
+        if self.dropna is False:
+            # every left row, followed by its pairs, as a left merge would have it
+            left = pairs["left"].to_numpy()
+            n_pairs = np.bincount(left, minlength=len(self.link_table))
+            slots = np.maximum(n_pairs, 1)
 
-        return closest_candidates
+            order = np.argsort(left, kind="stable")
+            left = left[order]
+            steps = np.arange(len(left)) - (np.cumsum(n_pairs) - n_pairs)[left]
 
-    def _handle_dropna(self, result):
-        if self.dropna is False:
-            left_frame = self.left[self.link_table_cols] if self.merge == "partial" else self.left
-            result = pd.merge(
-                left_frame, result, how="left", on=self.link_table_cols, indicator=False
-            )
+            taker = np.full(slots.sum(), -1)
+            taker[(np.cumsum(slots) - slots)[left] + steps] = order
 
-        return result
+            pairs = pairs.reset_index(drop=True).reindex(taker)
+            pairs["left"] = np.repeat(np.arange(len(slots)), slots)
+            pairs["right"] = pairs["right"].fillna(-1).astype(np.int64)
+            pairs = pairs.reset_index(drop=True)
+
+        return pairs
 
-    def _handle_duplicates(self, result):
-        dups = result.duplicated(subset=self.link_table_cols, keep=False)
+    def _handle_duplicates(self, pairs):
+        # rows linking the same left row
+        # (pairs are grouped by left row, so duplicates are adjacent)
+        dups = duplicated_sorted(pairs["left"], keep=False)
 
         # handle duplicates
         if dups.any():
             if self.drop_duplicates:
-                result = result.drop_duplicates(
-                    subset=self.link_table_cols, keep="last", ignore_index=True
-                )
+                keep = ~duplicated_sorted(pairs["left"], keep="last").to_numpy()
+                pairs = pairs[keep].reset_index(drop=True)
             elif self.duplicates_indicator:
-                result.mac.insert(self.duplicates_indicator_name, dups)
+                pairs = pairs.assign(duplicates=dups)
+        return pairs
+
+    def _take_rows(self, pairs):
+        """Take the columns of the rows in ``pairs`` from left and right, and
+        label them as in a merge of the two followed by :meth:`_get_merge_label`.
+        """
+        if self.dropna is False and self.merge == "full":
+            left_frame = self.left
+        else:
+            left_frame = self.link_table
+        left_part = left_frame.take(pairs["left"].to_numpy())
+
+        right_indexer = pairs["right"].to_numpy()
+        missing = right_indexer == -1
+        right_part = self._right_rows.take(right_indexer[~missing])
+
+        if missing.any() or self._has_unmatched:
+            # reindex to get the missing values (and dtypes) a merge would have,
+            # adding a missing row at the end in case there are none
+            taker = np.full(len(right_indexer) + 1, -1)
+            taker[:-1][~missing] = np.arange(len(right_part))
+            right_part.index = pd.RangeIndex(len(right_part))
+            right_part = right_part.reindex(taker).iloc[:-1]
+
+        merge_indicator = pd.Categorical.from_codes(
+            np.where(missing, -1, 2), categories=["left_only", "right_only", "both"]
+        )
+        system_cols = [merge_indicator, pairs["diff_days"].to_numpy(dtype=np.float64)]
+        if self.get == "closest":
+            system_cols.append(pairs["abs_diff_days"].to_numpy(dtype=np.float64))
+        system_part = pd.DataFrame(dict(enumerate(system_cols)), index=pairs.index)
+
+        left_part.index = pairs.index
+        right_part.index = pairs.index
+
+        result = pd.concat([left_part, right_part, system_part], axis=1, copy=False)
+        result.columns = self._get_labels(left_frame.columns, right_part.columns)
+
+        if "duplicates" in pairs:
+            result.mac.insert(
+                self._get_merge_label(self.duplicates_indicator_name), pairs["duplicates"]
+            )
+
         return result
 
-    def _handle_merge(self, result):
+    def _get_labels(self, left_columns, right_columns):
+        left_labels = [f"{col}{self._left_suffix}" for col in left_columns]
+        right_labels = [f"{col}{self._right_suffix}" for col in right_columns]
+        merge_indicator_col = self._merge_indicator_col
+
+        if self._left_level:
+            left_labels = [(self._left_level, label) for label in left_labels]
+
+        if self._right_level:
+            right_labels = [(self._right_level, label) for label in right_labels]
+            merge_indicator_col = (self._right_level, merge_indicator_col)
+
+        labels = left_labels + right_labels + [merge_indicator_col, self._diff_days_col]
+        if self.get == "closest":
+            labels.append(self._abs_diff_days_col)
+
+        return pd.Index([self._get_merge_label(label) for label in labels])
+
+    def _get_merge_label(self, label):
+        """Column label in the result for a column ``label`` with the left or right
+        suffix added, with the suffix removed or replaced depending on ``merge``.
+        """
+        if isinstance(label, tuple):
+            return tuple(self._get_merge_label(level_label) for level_label in label)
+
         left_suffix = self.merge_suffixes[0]
         right_suffix = self.merge_suffixes[1]
 
         if self.merge == "partial":
-            result = result.mac.drop_suffix(self._right_suffix)
-            result = result.mac.replace_suffix(self._left_suffix, left_suffix)
+            label = strtools.strip_suffix(label, self._right_suffix)
+            label = _replace_suffix(label, self._left_suffix, left_suffix)
         else:
-            result = result.mac.replace_suffix(self._left_suffix, left_suffix)
-            result = result.mac.replace_suffix(self._right_suffix, right_suffix)
+            label = _replace_suffix(label, self._left_suffix, left_suffix)
+            label = _replace_suffix(label, self._right_suffix, right_suffix)
 
-        return result
+        return label
 
     def _validate_specification(self):
         if self.id_on:
@@ -319,12 +653,12 @@ class _DateProximityOperation:
                     'and "id_right_on", but not a combination of both.'
                 )
             self.id_left_on = self.left.mac.get_col_names(self.id_on)
-            self.id_right_on = self.right.mac.get_col_names(self.id_on)
+            self._id_right_on_spec = self.id_on
         elif self.id_left_on and self.id_right_on:
             if len(self.id_left_on) != len(self.id_right_on):
                 raise ValueError("len(id_right_on) must equal len(id_left_on)")
             self.id_left_on = self.left.mac.get_col_names(self.id_left_on)
-            self.id_right_on = self.right.mac.get_col_names(self.id_right_on)
+            self._id_right_on_spec = self.id_right_on
         else:
             raise ValueError(
                 'Must pass argument "id_on" OR "id_left_on" '
@@ -337,57 +671,62 @@ class _DateProximityOperation:
                     'Must pass argument "date_on" OR "date_left_on" '
                     'and "date_right_on", but not a combination of both.'
                 )
-            self.date_left_on = self.left.mac.get_col_name(self.date_left_on)
-            self.date_right_on = self.right.mac.get_col_name(self.date_right_on)
+            self._date_right_on_spec = self.date_right_on
         else:
             if self.date_left_on or self.date_right_on:
                 raise ValueError(
                     'Must pass argument "date_on" OR "date_left_on" '
                     'and "date_right_on", but not a combination of both.'
                 )
-            self.date_left_on = self.date_right_on = self.left.mac.get_col_name(self.date_on)
+            self.date_left_on = self._date_right_on_spec = self.date_on
 
         self.date_left_on = self.left.mac.get_col_name(self.date_left_on)
-        self.date_right_on = self.right.mac.get_col_name(self.date_right_on)
 
-        if not self.left.mac.is_date_col(self.date_left_on):
+        if self.link_index is not None:
+            # also checks that the date column has already been converted
+            self.link_index.validate(self.left, self.id_left_on, self.date_left_on)
+        elif not self.left.mac.is_date_col(self.date_left_on):
             self.left.mac.to_datetime(self.date_left_on)
             # raise TypeError(
             #    f"'date_left_on' column of '{self.date_left_on}' is not a valid date column"
             # )
 
-        if not self.right.mac.is_date_col(self.date_right_on):
-            self.right.mac.to_datetime(self.date_right_on)
-            # raise TypeError(
-            #    f"'date_right_on' column of '{self.date_right_on}' is not a valid date column"
-            # )
-
         if self.get not in ["all", "closest"]:
             raise ValueError(f"invalid get option: {self.get}")
 
         if self.when not in ["earlier", "later", "earlier_or_later"]:
             raise ValueError(f"invalid when option: {self.when}")
 
+        if self.engine not in ["merge", "interval"]:
+            raise ValueError(f"invalid engine option: {self.engine}")
+
+        if self.partitions is not None:
+            if not isinstance(self.partitions, int) or self.partitions < 1:
+                raise ValueError(f"invalid partitions option: {self.partitions}")
+
+        if self.n_jobs is None:
+            self._n_workers = 1
+        elif self.n_jobs == -1:
+            self._n_workers = os.cpu_count() or 1
+        elif isinstance(self.n_jobs, int) and self.n_jobs > 0:
+            self._n_workers = self.n_jobs
+        else:
+            raise ValueError(f"invalid n_jobs option: {self.n_jobs}")
+
         if isinstance(self.days, int):
             if self.days < 0:
                 raise ValueError("days option value cannot be negative")
         else:
             raise TypeError("days option needs to be an integer")
 
-        # check for duplicates
-        if not self.left_link_id:
-            has_dupes = self.left[self.id_left_on + [self.date_left_on]].duplicated().any()
-            if has_dupes:
-                raise ValueError(
-                    f"Duplicate rows with the same '{self.id_left_on}' and '{self.date_left_on}' exist. Aborting."
-                )
-        else:
+        if self.left_link_id:
             self.left_link_id = self.left.mac.get_col_name(self.left_link_id)
-            has_dupes = self.left[self.left_link_id].duplicated().any()
-            if has_dupes:
-                raise ValueError(
-                    f"ID column '{self.left_link_id}' must be unique but is not. Aborting."
-                )
+
+        # check for duplicates, which the link index has done already
+        if self.link_index is None or self.link_index.link_id_col_name != self.left_link_id:
+            _validate_left_duplicates(
+                self.left, self.id_left_on, self.date_left_on, self.left_link_id
+            )
 
         if self.merge not in ["partial", "full"]:
             raise ValueError(f"invalid merge option: {self.merge}")
@@ -401,8 +740,6 @@ class _DateProximityOperation:
                 "'merge_suffixes' needs to be a tuple or list of two strings (e.g. ('_x','_y'))"
             )
 
-        self._add_suffixes()
-
         if not lltools.is_list_like(self.prepend_levels):
             raise ValueError(
                 "'prepend_levels' needs to be a tuple or list of two values "
@@ -414,36 +751,69 @@ class _DateProximityOperation:
                 "(e.g. ('left','right') or (None,'right'))"
             )
 
+        # suffixes and levels are only added to the labels of the result,
+        # see _get_labels
         self._left_level = self.prepend_levels[0]
-        self._right_level = self.prepend_levels[1]
 
-        if self._left_level:
-            self.left = self.left.mac.prepend_multi_index_level(self._left_level, axis=1)
-            self.id_left_on = [(self._left_level, id_left_on) for id_left_on in self.id_left_on]
-            self.date_left_on = (self._left_level, self.date_left_on)
-            if self.left_link_id:
-                self.left_link_id = (self._left_level, self.left_link_id)
+        self._create_link_helpers()
+
+        self._set_right(
+            self.right, self._id_right_on_spec, self._date_right_on_spec, self.prepend_levels[1]
+        )
+
+    def _set_right(self, right, id_right_on, date_right_on, right_level):
+        """Validate and prepare ``right`` (or an iterable of chunks of it)
+        to be linked to the already prepared left DataFrame.
+        """
+        self._right_chunks = None
+        if isinstance(right, pd.DataFrame):
+            self.right = right
+        else:
+            # an iterable of chunks, validate using the first one
+            self._right_chunks = iter(right)
+            self.right = next(self._right_chunks, None)
+            if not isinstance(self.right, pd.DataFrame):
+                raise TypeError("right needs to be a DataFrame or an iterable of DataFrames")
+
+        self.id_right_on = self.right.mac.get_col_names(lltools.maybe_make_list(id_right_on))
+        if len(self.id_left_on) != len(self.id_right_on):
+            raise ValueError("len(id_right_on) must equal len(id_left_on)")
+
+        self.date_right_on = self.right.mac.get_col_name(date_right_on)
+
+        self._right_level = right_level
+        self._diff_days_col = get_option("column.system.diff_days")
+        self._abs_diff_days_col = get_option("column.system.abs_diff_days")
+
         if self._right_level:
-            self.right = self.right.mac.prepend_multi_index_level(self._right_level, axis=1)
-            self.id_right_on = [
-                (self._right_level, id_right_on) for id_right_on in self.id_right_on
-            ]
-            self.date_right_on = (self._right_level, self.date_right_on)
             self._diff_days_col = (self._right_level, self._diff_days_col)
             self._abs_diff_days_col = (self._right_level, self._abs_diff_days_col)
 
-        self._create_link_helpers()
+        self.right = self._prepare_right(self.right)
+
+    def _with_right(self, right, id_right_on=None, date_right_on=None, right_level=None):
+        """Copy of this operation that links the same, already prepared left
+        DataFrame to ``right`` instead. Id and date columns not passed are
+        the same as the ones of this operation.
+        """
+        op = copy.copy(self)
+        op._set_right(
+            right,
+            self._id_right_on_spec if id_right_on is None else id_right_on,
+            self._date_right_on_spec if date_right_on is None else date_right_on,
+            right_level,
+        )
+        return op
 
-    def _add_suffixes(self):
-        self.left = self.left.add_suffix(self._left_suffix)
-        self.right = self.right.add_suffix(self._right_suffix)
-        self.id_left_on = [id_col_name + self._left_suffix for id_col_name in self.id_left_on]
-        self.id_right_on = [id_col_name + self._right_suffix for id_col_name in self.id_right_on]
-        self.date_left_on = self.date_left_on + self._left_suffix
-        self.date_right_on = self.date_right_on + self._right_suffix
+    def _prepare_right(self, right):
+        """Convert the date column of ``right``, or of a chunk of it."""
+        if not right.mac.is_date_col(self.date_right_on):
+            right.mac.to_datetime(self.date_right_on)
+            # raise TypeError(
+            #    f"'date_right_on' column of '{self.date_right_on}' is not a valid date column"
+            # )
 
-        if self.left_link_id:
-            self.left_link_id = self.left_link_id + self._left_suffix
+        return right
 
     def _create_link_helpers(self):
         link_table_cols = []
@@ -454,6 +824,222 @@ class _DateProximityOperation:
 
         self.link_table_cols = link_table_cols
         self.link_table = self.left[link_table_cols]
+        self._left_codes = None
+        self._left_ranks = None
+
+
+def _partition_positions(codes, n_partitions):
+    """Positions of the ``codes`` in each of ``n_partitions`` partitions, where the
+    code ``i`` is in partition ``i % n_partitions`` and negative codes in none.
+    """
+    valid_pos = np.flatnonzero(codes >= 0)
+    partitions = codes[valid_pos] % n_partitions
+    order = np.argsort(partitions, kind="stable")
+    offsets = np.cumsum(np.bincount(partitions, minlength=n_partitions))[:-1]
+    return np.split(valid_pos[order], offsets)
+
+
+def _get_candidate_indexers(
+    left_codes, left_dates, right_codes, right_dates, days, when, get, engine, fractional_days
+):
+    """Positions of the pairs of left and right rows that are candidates for
+    being linked by :class:`_DateProximityOperation`. Module-level, so it can
+    be run in worker processes.
+    """
+    if fractional_days:
+        # dates are int64 nanoseconds
+        window = pd.Timedelta(days=days).value
+        # pad the window so float rounding in the exact diff_days checks,
+        # which are done afterwards for every engine, can't exclude more rows
+        pad = pd.Timedelta(seconds=1).value
+        na_value = _iNaT
+    else:
+        # dates are int32 day ordinals, and diff_days are exact
+        window = days
+        pad = 0
+        na_value = datetimetools.DAY_ORDINAL_NA
+
+    lower = -window if when != "later" else 0
+    upper = window if when != "earlier" else 0
+
+    if engine == "merge":
+        # pair up every row with the same id, like the merge does
+        left_indexer, right_indexer = _interval_join_indexers(
+            left_codes, left_dates, right_codes, right_dates, None, None, na_value=na_value
+        )
+        diffs = right_dates[right_indexer] - left_dates[left_indexer]
+        in_range = (diffs >= lower - pad) & (diffs <= upper + pad)
+        return left_indexer[in_range], right_indexer[in_range]
+
+    return _interval_join_indexers(
+        left_codes,
+        left_dates,
+        right_codes,
+        right_dates,
+        lower,
+        upper,
+        tolerance=pad,
+        closest=get == "closest",
+        na_value=na_value,
+    )
+
+
+def _replace_suffix(label, old_suffix, new_suffix):
+    # same as macpie.pandas.replace_suffix, for a single label
+    if label.endswith(old_suffix):
+        return label[: -len(old_suffix)] + new_suffix
+    return label
+
+
+def _factorize_ids(id_frame):
+    """Integer codes of the ids in the rows of ``id_frame`` (see :func:`_get_id_frame`),
+    and a DataFrame with one row per id, in order of their codes.
+    """
+    codes = id_frame.groupby(list(id_frame.columns), sort=False, dropna=False).ngroup()
+    codes = codes.to_numpy()
+
+    return codes, id_frame.take(np.unique(codes, return_index=True)[1])
+
+
+def _validate_left_duplicates(
+    left, id_left_on, date_left_on, left_link_id=None, codes=None, dates=None, order=None
+):
+    """
+    Raise a ValueError if ``left`` has duplicate rows on the id and date columns
+    (or on ``left_link_id`` if given).
+
+    The rows are sorted by their id ``codes`` (see :func:`_factorize_ids`) and
+    int64 ``dates`` (computed from ``left`` if not given), unless their sorted
+    ``order`` is given, so that duplicates are adjacent and found by
+    :func:`macpie.pandas.duplicated_sorted` in one pass.
+    """
+    if not left_link_id:
+        if codes is None:
+            codes, _ = _factorize_ids(_get_id_frame(left, id_left_on))
+        if dates is None:
+            dates = pd.DatetimeIndex(left[date_left_on]).asi8
+        if order is None:
+            order = np.lexsort((dates, codes))
+        keys = pd.DataFrame({"codes": codes[order], "dates": dates[order]})
+        has_dupes = duplicated_sorted(keys).any()
+        if has_dupes:
+            raise ValueError(
+                f"Duplicate rows with the same '{id_left_on}' and '{date_left_on}' exist. Aborting."
+            )
+    else:
+        # codes of missing ids are all -1, so they are duplicates of each other
+        # as with Series.duplicated
+        link_id_codes = np.sort(pd.factorize(left[left_link_id])[0])
+        has_dupes = duplicated_sorted(pd.Series(link_id_codes)).any()
+        if has_dupes:
+            raise ValueError(f"ID column '{left_link_id}' must be unique but is not. Aborting.")
+
+
+def _get_id_frame(df, id_cols):
+    """The id columns of ``df``, relabeled by position so the ids of
+    different DataFrames can be concatenated.
+    """
+    return df[id_cols].set_axis(range(len(id_cols)), axis=1)
+
+
+def _interval_join_indexers(
+    left_codes,
+    left_values,
+    right_codes,
+    right_values,
+    lower,
+    upper,
+    tolerance=0,
+    closest=False,
+    na_value=_iNaT,
+):
+    """
+    For each left row, find the right rows with the same code whose value ``v``
+    satisfies ``left_value + lower <= v <= left_value + upper``, without
+    generating any of the pairs outside of that range.
+
+    Values are integer arrays (e.g. datetime64[ns] as int64, or int32 day
+    ordinals), where ``na_value`` marks a missing value that never matches. Both bounds are widened by
+    ``tolerance``, and a bound of ``None`` means the range is unbounded on
+    that side.
+
+    If ``closest`` is True, only the right rows nearest to each left row are
+    found (all of them in case of ties), as with a nearest-neighbour
+    :func:`pandas.merge_asof`. Rows up to ``tolerance`` further away than the
+    nearest one are included as well, so callers can do an exact comparison
+    afterwards.
+
+    Returns
+    -------
+    Tuple[ndarray, ndarray]
+        (left_indexer, right_indexer) positions of all matching pairs,
+        ordered by left position, then right position.
+    """
+    left_pos = np.flatnonzero(left_values != na_value)
+    right_pos = np.flatnonzero(right_values != na_value)
+
+    left_vals = left_values[left_pos]
+    right_vals = right_values[right_pos]
+
+    # rank the right values so each (code, value) pair can be packed
+    # into a single sortable int64 key
+    uniques = np.unique(right_vals)
+    n_ranks = len(uniques) + 1
+    right_keys = right_codes[right_pos].astype(np.int64) * n_ranks
+    right_keys += np.searchsorted(uniques, right_vals)
+    sorter = np.argsort(right_keys, kind="stable")
+    right_keys = right_keys[sorter]
+
+    left_keys = left_codes[left_pos].astype(np.int64) * n_ranks
+
+    def first_at_least(keys, vals):
+        # sorted position of first right value >= vals with the same code
+        return np.searchsorted(right_keys, keys + np.searchsorted(uniques, vals, side="left"))
+
+    def first_above(keys, vals):
+        # sorted position of first right value > vals with the same code
+        return np.searchsorted(right_keys, keys + np.searchsorted(uniques, vals, side="right"))
+
+    if lower is None:
+        starts = np.searchsorted(right_keys, left_keys)
+    else:
+        starts = first_at_least(left_keys, left_vals + lower - tolerance)
+
+    if upper is None:
+        ends = np.searchsorted(right_keys, left_keys + n_ranks)
+    else:
+        ends = first_above(left_keys, left_vals + upper + tolerance)
+
+    if closest:
+        # distance to the nearest earlier and later right value within the
+        # exact range (a value only within tolerance can't be the nearest)
+        no_dist = np.iinfo(np.int64).max
+        sorted_vals = right_vals[sorter]
+        dists = np.full(len(left_vals), no_dist)
+
+        before = first_above(left_keys, left_vals) - 1
+        found = before >= first_at_least(left_keys, left_vals + lower)
+        dists[found] = left_vals[found] - sorted_vals[before[found]]
+
+        after = first_at_least(left_keys, left_vals)
+        found = after < first_above(left_keys, left_vals + upper)
+        dists[found] = np.minimum(dists[found], sorted_vals[after[found]] - left_vals[found])
+
+        # narrow each range down to the nearest distance
+        found = dists != no_dist
+        keys, vals, dists = left_keys[found], left_vals[found], dists[found]
+        starts[found] = first_at_least(keys, vals + np.maximum(lower, -dists) - tolerance)
+        ends[found] = first_above(keys, vals + np.minimum(upper, dists) + tolerance)
+
+    counts = ends - starts
+
+    left_indexer = np.repeat(left_pos, counts)
+    # position within the sorted right keys of each generated pair
+    steps = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    right_indexer = right_pos[sorter[np.repeat(starts, counts) + steps]]
+
+    order = np.lexsort((right_indexer, left_indexer))
+    return left_indexer[order], right_indexer[order]
 
 
 def merge(
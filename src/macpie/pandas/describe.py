@@ -6,11 +6,16 @@ import pandas as pd
 
 import macpie.pandas as mppd
 from macpie._config import get_option
-from macpie.tools import lltools
+from macpie.tools import datetimetools, lltools
 
 
 def add_diff_days(
-    df: pd.DataFrame, col_start: str, col_end: str, diff_days_col: str = None, inplace=False
+    df: pd.DataFrame,
+    col_start: str,
+    col_end: str,
+    diff_days_col: str = None,
+    inplace=False,
+    fractional_days: bool = None,
 ):
     """
     Adds a column whose values are the number of days between ``col_start`` and ``col_end``
@@ -26,6 +31,10 @@ def add_diff_days(
         Give the added column a different name other than the default
     inplace : bool, default False
         Whether to add the column in place or return a copy
+    fractional_days : bool, default=``mp.get_option('operators.dates.fractional_days')``
+        Whether to count fractional days using the time of day of the dates
+        (e.g. 0.5 for 12 hours), or whole days between the days of the dates
+        (see :func:`macpie.datetimetools.to_day_ordinals`)
 
     Returns
     -------
@@ -36,14 +45,26 @@ def add_diff_days(
     if diff_days_col is None:
         diff_days_col = get_option("column.system.diff_days")
 
+    if fractional_days is None:
+        fractional_days = get_option("operators.dates.fractional_days")
+
     if col_start == col_end:
         raise KeyError("date columns have the same name: {col_start}=={col_end}")
 
     if not inplace:
         df = df.copy()
 
-    df[diff_days_col] = df[col_end] - df[col_start]
-    df[diff_days_col] = df[diff_days_col] / np.timedelta64(1, "D")
+    if fractional_days:
+        df[diff_days_col] = df[col_end] - df[col_start]
+        df[diff_days_col] = df[diff_days_col] / np.timedelta64(1, "D")
+    else:
+        start = datetimetools.to_day_ordinals(df[col_start])
+        end = datetimetools.to_day_ordinals(df[col_end])
+        diff_days = (end - start).astype(np.float64)
+        diff_days[
+            (start == datetimetools.DAY_ORDINAL_NA) | (end == datetimetools.DAY_ORDINAL_NA)
+        ] = np.nan
+        df[diff_days_col] = diff_days
 
     if not inplace:
         return df
@@ -131,6 +152,61 @@ def count_trailers(ser: pd.Series, predicates=None, count_na=True, count_empty_s
     return counter
 
 
+def duplicated_sorted(df, subset=None, keep="first"):
+    """
+    Return a boolean Series denoting duplicate rows, like
+    :meth:`pandas.DataFrame.duplicated`, for data whose duplicate rows are
+    next to each other (e.g. when sorted or grouped by ``subset``).
+
+    Rows are only compared with the row before them rather than hashed, so
+    this takes a single O(n) pass over the ``subset`` columns. Missing values
+    are equal to each other, like in :meth:`pandas.DataFrame.duplicated`.
+
+    Parameters
+    ----------
+    df : DataFrame or Series
+    subset : column label or sequence of labels, optional
+        Only consider these columns for identifying duplicates, by default
+        all of the columns.
+    keep : {'first', 'last', False}, default 'first'
+        Determines which duplicates (if any) to mark.
+
+        * first : Mark duplicates as ``True`` except for the first occurrence.
+        * last : Mark duplicates as ``True`` except for the last occurrence.
+        * False : Mark all duplicates as ``True``.
+
+    Returns
+    -------
+    Series
+        Boolean series for each duplicated row.
+    """
+
+    if keep not in ["first", "last", False]:
+        raise ValueError(f"invalid keep option: {keep}")
+
+    if isinstance(df, pd.Series):
+        columns = [df]
+    elif subset is None:
+        columns = [col for _, col in df.items()]
+    else:
+        columns = [df[col] for col in lltools.maybe_make_list(subset)]
+
+    # whether each row (but the first) equals the row before it
+    same_as_previous = np.ones(max(len(df) - 1, 0), dtype=bool)
+    for col in columns:
+        values = col.to_numpy()
+        isna = pd.isna(values)
+        same_as_previous &= (values[1:] == values[:-1]) | (isna[1:] & isna[:-1])
+
+    dups = np.zeros(len(df), dtype=bool)
+    if keep in ["first", False]:
+        dups[1:] |= same_as_previous
+    if keep in ["last", False]:
+        dups[:-1] |= same_as_previous
+
+    return pd.Series(dups, index=df.index, name=df.name if isinstance(df, pd.Series) else None)
+
+
 def is_date_col(df: pd.DataFrame, arr_or_dtype):
     """
     Check whether the provided array or dtype is of the datetime64 dtype.
@@ -1,16 +1,19 @@
+import numpy as np
 import pandas as pd
 
 from macpie._config import get_option
-from macpie.tools import validatortools
+from macpie.pandas.describe import duplicated_sorted
+from macpie.tools import datetimetools, validatortools
 
 
 def group_by_keep_one(
     df: pd.DataFrame,
     group_by_col: str,
     date_col_name: str,
-    keep: str = "all",
+    keep="all",
     id_col_name: str = None,
     drop_duplicates: bool = False,
+    per: str = None,
 ) -> pd.DataFrame:
     """
     Given a :class:`pandas.DataFrame` object, group on the ``group_by_col`` column
@@ -24,12 +27,23 @@ def group_by_keep_one(
         The DataFrame column to group on
     date_col_name : str
         The date column to determine which row is earliest or latest
-    keep: {'all', 'earliest', 'latest'}, default 'all'
+    keep: {'all', 'earliest', 'latest'}, int or slice, default 'all'
         Specify which row of each group to keep.
 
         * all: keep all rows
         * earliest: in each group, keep only the earliest (i.e. oldest) row
         * latest: in each group, keep only the latest (i.e. most recent) row
+        * int: in each group, keep only the rows on the n-th earliest date,
+          counting from 0. Negative numbers count back from the latest date,
+          so ``0`` is the same as ``earliest`` and ``-1`` as ``latest``
+        * slice: in each group, keep only the rows on these dates, numbered
+          as with an int (e.g. ``slice(3)`` for the first 3 dates, or
+          ``slice(-2, None)`` for the last 2)
+
+        If the ``operators.dates.fractional_days`` option is set to False, dates
+        are compared by day, ignoring their time of day: rows on the same day are
+        ties (e.g. all the rows on the earliest day are kept), and duplicates are
+        rows on the same day.
     id_col_name : str, optional
         Used to sort results if there are duplicates. If ``drop_duplicates=True``,
         the column specified here will also be used for identifying duplicates
@@ -38,6 +52,11 @@ def group_by_keep_one(
         'earliest' or 'latest' in each group, drop all duplicates
         except the first occurrence. If ``id_col_name`` is specified,
         then that column will also be used for identifying duplicates
+    per : str, optional
+        A period frequency (e.g. ``'Y'`` for year or ``'M'`` for month, see
+        :meth:`pandas.Series.dt.to_period`). If given, ``keep`` is applied
+        to the rows of each period of each group, e.g. ``keep='latest', per='Y'``
+        keeps the latest row of each year of each group
 
     Returns
     -------
@@ -45,49 +64,182 @@ def group_by_keep_one(
         A DataFrame of the result.
     """
 
-    # groupby.first() and groupby.last() can't handle NaN values (ongoing bug)
-    # use groupby.nth(0) and groupby.nth(-1) instead
-
     group_by_col = df.mac.get_col_name(group_by_col)
 
     date_col_name = df.mac.to_datetime(date_col_name)
 
-    if keep not in ["all", "earliest", "latest"]:
-        raise ValueError("invalid keep option")
+    if isinstance(keep, slice):
+        if keep.step is not None and keep.step < 1:
+            raise ValueError(f"invalid keep option: {keep}")
+    elif not (keep in ["all", "earliest", "latest"] or pd.api.types.is_integer(keep)):
+        raise ValueError(f"invalid keep option: {keep}")
 
     id_col_name = df.mac.get_col_name(id_col_name) if id_col_name is not None else None
 
     drop_duplicates = validatortools.validate_bool_kwarg(drop_duplicates, "drop_duplicates")
 
-    cols = [group_by_col, date_col_name]
+    groups = df[group_by_col]
+    dates = df[date_col_name]
+
+    # rows where group_by col or date col is na are dropped
+    valid = (groups.notna() & dates.notna()).to_numpy()
+
+    # integer codes in the order of the values, so rows can be sorted by them
+    group_codes = _sort_codes(groups)
+    date_values = pd.DatetimeIndex(dates).asi8
+    id_codes = _sort_codes(df[id_col_name]) if id_col_name is not None else None
+
+    # compare dates by day (as int32 day ordinals), unless counting fractional days
+    fractional_days = get_option("operators.dates.fractional_days")
+    if fractional_days:
+        day_values = date_values
+    else:
+        day_values = datetimetools.to_day_ordinals(dates)
+
+    # the groups of rows that keep is applied to
+    segment_keys = [group_codes]
+    if per is not None:
+        segment_keys.append(_period_ordinals(dates, per))
+
+    rows = np.flatnonzero(valid)
+    if keep in ["earliest", "latest"]:
+        # keep every row on the earliest/latest date of each group, in case of ties
+        group_days = (
+            pd.Series(day_values[rows])
+            .groupby([key[rows] for key in segment_keys], sort=False)
+            .transform("min" if keep == "earliest" else "max")
+        )
+        rows = rows[day_values[rows] == group_days.to_numpy()]
+
+    # only the kept rows are sorted, by group, date (and id)
+    sort_codes = [group_codes[rows], _sort_codes(date_values[rows])]
+    if id_col_name is not None:
+        sort_codes.append(id_codes[rows])
+    rows = rows[_argsort_codes(sort_codes)]
 
-    # first drop rows where group_by col or date col is na and re-index
-    df = df.dropna(subset=cols).reset_index(drop=True)
+    if keep not in ["all", "earliest", "latest"]:
+        # keep every row on the selected dates of each group, in case of ties
+        date_nums, date_counts = _number_dates(
+            [key[rows] for key in segment_keys], day_values[rows]
+        )
+        rows = rows[_select_dates(date_nums, date_counts, keep)]
+
+    result = df.take(rows)
+    if keep == "all":
+        # positions of the rows among the rows that were not dropped
+        result.index = np.cumsum(valid)[rows] - 1
+    else:
+        result = result.reset_index(drop=True)
+
+    # duplicates have the same group, day (and id), so they are adjacent when
+    # sorted by those, which the rows already are unless they have ids and
+    # different times on the same day
+    dup_codes = [group_codes[rows], day_values[rows]]
+    if id_col_name is not None:
+        dup_codes.append(id_codes[rows])
+    if id_col_name is not None and not fractional_days:
+        # day ordinals as non-negative codes
+        dup_codes[1] = dup_codes[1] - dup_codes[1].min(initial=0)
+        dup_order = _argsort_codes(dup_codes)
+    else:
+        dup_order = np.arange(len(rows))
+    dup_keys = pd.DataFrame({i: codes[dup_order] for i, codes in enumerate(dup_codes)})
+
+    dups = np.empty(len(rows), dtype=bool)
+    dups[dup_order] = duplicated_sorted(dup_keys, keep=False).to_numpy()
+    if dups.any():
+        if drop_duplicates:
+            firsts = np.empty(len(rows), dtype=bool)
+            firsts[dup_order] = ~duplicated_sorted(dup_keys, keep="first").to_numpy()
+            result = result[firsts].reset_index(drop=True)
+        else:
+            result.mac.insert(
+                get_option("column.system.duplicates"), pd.Series(dups, index=result.index)
+            )
 
-    df = df.sort_values(
-        by=cols + [id_col_name] if id_col_name is not None else cols, na_position="last"
-    )
+    return result
 
-    if keep in {"earliest", "latest"}:
-        pre_results = None
 
-        if keep == "earliest":
-            pre_results = df.groupby(group_by_col, sort=False, as_index=False).nth(0)
-        else:
-            # keep == 'latest'
-            pre_results = df.groupby(group_by_col, sort=False, as_index=False).nth(-1)
+def _period_ordinals(dates, per):
+    """Ordinals of the periods of frequency ``per`` that ``dates`` are in."""
+    dates = pd.DatetimeIndex(dates)
+    if dates.tz is not None:
+        # periods of the local dates
+        dates = dates.tz_localize(None)
+    return dates.to_period(per).asi8
 
-        # in case there are duplicates, keep them
 
-        pre_results = pre_results.filter(items=cols)
-        df = pd.merge(df, pre_results, how="inner", on=cols, indicator=False)
+def _number_dates(segment_keys, day_values):
+    """
+    Number the distinct dates of each segment of rows (with the same
+    ``segment_keys``) from 0, for rows sorted by segment and date.
 
-    dup_cols = cols + [id_col_name] if id_col_name is not None else cols
-    dups = df.duplicated(subset=dup_cols, keep=False)
-    if dups.any():
-        if drop_duplicates:
-            df = df.drop_duplicates(subset=dup_cols, keep="first", ignore_index=True)
-        else:
-            df.mac.insert(get_option("column.system.duplicates"), dups)
+    Returns
+    -------
+    tuple
+        ``(date_nums, date_counts)``: the number of the date of each row,
+        and the number of distinct dates in the segment of each row
+    """
+    # whether each row is the first of its segment/date
+    new_segment = np.zeros(len(day_values), dtype=bool)
+    new_segment[:1] = True
+    for key in segment_keys:
+        new_segment[1:] |= key[1:] != key[:-1]
+    new_date = new_segment.copy()
+    new_date[1:] |= day_values[1:] != day_values[:-1]
+
+    # running count of dates, restarted at each segment
+    date_cumcount = np.cumsum(new_date)
+    segment_ids = np.cumsum(new_segment) - 1
+    segment_starts = date_cumcount[new_segment]
+    segment_ends = np.append(segment_starts[1:] - 1, date_cumcount[-1:])
+
+    date_nums = date_cumcount - segment_starts[segment_ids]
+    date_counts = (segment_ends - segment_starts + 1)[segment_ids]
+    return date_nums, date_counts
+
+
+def _select_dates(date_nums, date_counts, keep):
+    """Mask of the rows whose date number (see :func:`_number_dates`) is
+    selected by ``keep`` (an int or slice).
+    """
+    if not isinstance(keep, slice):
+        if keep < 0:
+            return date_nums - date_counts == keep
+        return date_nums == keep
+
+    def bound(value, default):
+        if value is None:
+            return default
+        if value < 0:
+            return np.maximum(date_counts + value, 0)
+        return np.minimum(value, date_counts)
+
+    start = bound(keep.start, 0)
+    stop = bound(keep.stop, date_counts)
+    step = keep.step or 1
+    return (date_nums >= start) & (date_nums < stop) & ((date_nums - start) % step == 0)
+
+
+def _sort_codes(values):
+    """Integer codes of ``values`` that sort like the values, with missing
+    values last.
+    """
+    codes, uniques = pd.factorize(values, sort=True)
+    return np.where(codes == -1, len(uniques), codes)
 
-    return df
+
+def _argsort_codes(codes):
+    """Stable order of the rows sorted by each array of non-negative integer
+    ``codes`` in turn, like :func:`numpy.lexsort` with the keys reversed.
+    """
+    # combine the codes into one int64 key unless it could overflow
+    key = np.zeros(len(codes[0]), dtype=np.int64)
+    bound = 1
+    for col_codes in codes:
+        size = int(col_codes.max(initial=-1)) + 1
+        bound *= size
+        if bound >= 2**63:
+            return np.lexsort(codes[::-1])
+        key = key * size + col_codes
+    return np.argsort(key, kind="stable")
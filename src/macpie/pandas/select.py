@@ -1,11 +1,12 @@
 from collections import defaultdict
 import itertools
 from typing import List
+import weakref
 
 import pandas as pd
 
 import macpie.pandas as mppd
-from macpie.tools import lltools, strtools
+from macpie.tools import lltools
 
 
 def filter_by_id(df: pd.DataFrame, id_col_name: str, ids: List[int]) -> pd.DataFrame:
@@ -179,22 +180,73 @@ def get_col_name(df: pd.DataFrame, col_name):
         If `col_name` is None or not found in the DataFrame.
     """
 
-    if col_name is None:
-        raise KeyError("column to get is 'None'")
+    return _get_col_name_lookup(df.columns).get(col_name)
 
-    if lltools.is_list_like(col_name):
-        # handle MultiIndex
-        for col in df.columns:
-            if lltools.list_like_str_equal(col, col_name, case_sensitive=False):
-                return col
-        raise KeyError(f"column not found: {col_name}")
 
-    if isinstance(col_name, str):
-        for col in df.columns:
-            if strtools.str_equals(col, col_name, case_sensitive=False):
-                return col
+class _ColNameLookup:
+    """
+    Case-insensitive lookup of the columns of an Index, keyed by the
+    casefolded column name (or the casefolded levels of a MultiIndex column
+    name). Each table is built on first use, keeping the first matching column.
+    """
+
+    def __init__(self, columns):
+        # weakly, so the cached lookup doesn't keep its Index alive
+        self._columns_ref = weakref.ref(columns)
+        self._by_str = None
+        self._by_levels = None
+
+    def get(self, col_name):
+        if col_name is None:
+            raise KeyError("column to get is 'None'")
+
+        if lltools.is_list_like(col_name):
+            # handle MultiIndex
+            if self._by_levels is None:
+                self._by_levels = {}
+                for col in self._columns_ref():
+                    if lltools.is_list_like(col) or isinstance(col, str):
+                        self._by_levels.setdefault(_casefold_levels(col), col)
+            table, key = self._by_levels, _casefold_levels(col_name)
+        elif isinstance(col_name, str):
+            if self._by_str is None:
+                self._by_str = {}
+                for col in self._columns_ref():
+                    self._by_str.setdefault(str(col).casefold(), col)
+            table, key = self._by_str, col_name.casefold()
+        else:
+            table, key = {}, None
+
+        if key not in table:
+            raise KeyError(f"column not found: {col_name}")
+        return table[key]
+
+
+def _casefold_levels(col):
+    return tuple(str(level).casefold() for level in col)
+
 
-    raise KeyError(f"column not found: {col_name}")
+# id(Index) -> (weak reference to the Index, its _ColNameLookup)
+_col_name_lookups = {}
+
+
+def _get_col_name_lookup(columns):
+    """
+    The :class:`_ColNameLookup` of ``columns``, cached for as long as the
+    (immutable) Index exists, so it's rebuilt only when the columns change.
+    """
+    key = id(columns)
+    entry = _col_name_lookups.get(key)
+    if entry is not None and entry[0]() is columns:
+        return entry[1]
+
+    def remove(ref):
+        if _col_name_lookups.get(key, (None,))[0] is ref:
+            del _col_name_lookups[key]
+
+    lookup = _ColNameLookup(columns)
+    _col_name_lookups[key] = (weakref.ref(columns, remove), lookup)
+    return lookup
 
 
 def get_col_names(df: pd.DataFrame, col_names: List[str], strict=True):
@@ -216,10 +268,12 @@ def get_col_names(df: pd.DataFrame, col_names: List[str], strict=True):
         The list of properly-cased column names.
     """
 
+    lookup = _get_col_name_lookup(df.columns)
+
     df_col_names = []
     for col in col_names:
         try:
-            df_col = get_col_name(df, col)
+            df_col = lookup.get(col)
         except KeyError as e:
             if strict:
                 raise e
@@ -4,9 +4,14 @@ Utility functions related to dates and times.
 
 import datetime
 
+import numpy as np
 import pandas as pd
 
 
+#: Day ordinal of a missing date (see :func:`to_day_ordinals`)
+DAY_ORDINAL_NA = np.iinfo(np.int32).min
+
+
 def current_datetime_str(fmt="%Y%m%d_%H%M%S", ms=False, ms_prefix="_"):
     """
     Get the current datetime with second precision with default
@@ -49,3 +54,29 @@ def reformat_datetime_str(arg, format="%Y-%m-%d", **kwargs):
     if isinstance(dt, (pd.Timestamp, datetime.datetime)) and not pd.isnull(dt):
         return dt.strftime(format)
     return dt
+
+
+def to_day_ordinals(values):
+    """
+    Convert dates to int32 "day ordinals", i.e. the number of days since
+    1970-01-01, ignoring the time of day. Differences in whole days and
+    comparisons of dates by day are then integer operations on a compact array.
+
+    Parameters
+    ----------
+    values : array-like
+        Dates (e.g. a datetime64 Series), or int64 nanoseconds since the epoch.
+        Timezone-aware dates are converted using their local time.
+
+    Returns
+    -------
+    ndarray
+        int32 day ordinals, where missing dates are ``DAY_ORDINAL_NA``
+    """
+    values = pd.DatetimeIndex(values)
+    if values.tz is not None:
+        values = values.tz_localize(None)
+
+    ordinals = (values.asi8 // pd.Timedelta(days=1).value).astype(np.int32)
+    ordinals[values.isna()] = DAY_ORDINAL_NA
+    return ordinals
@@ -18,10 +18,11 @@ def autofit_column_width(ws):
 
     :param ws: :class:`openpyxl.worksheet.worksheet.Worksheet` to adjust
     """
-    for column_cells in ws.columns:
-        length = max(len(str(cell.value or "")) for cell in column_cells)
+    # values only, without creating the cells of the worksheet
+    for col_idx, column_values in enumerate(ws.iter_cols(values_only=True), 1):
+        length = max(len(str(value or "")) for value in column_values)
         length = min((length + 2) * 1.2, 65)
-        ws.column_dimensions[column_cells[0].column_letter].width = length
+        ws.column_dimensions[pyxl.utils.get_column_letter(col_idx)].width = length
 
 
 def get_column_index(ws, col_header: str = None):
@@ -283,10 +284,10 @@ def to_tablib_dataset(wb, sheet_name=None, headers=True, skip_lines=0, tablib_cl
     dset = tablib_class()
     dset.title = ws.title
 
-    for i, row in enumerate(ws.rows):
+    for i, row_vals in enumerate(ws.iter_rows(values_only=True)):
         if i < skip_lines:
             continue
-        row_vals = [c.value for c in row]
+        row_vals = list(row_vals)
         if i == skip_lines and headers:
             dset.headers = row_vals
         else:
@@ -1,7 +1,11 @@
 import collections
+import contextlib
 import functools
+import hashlib
 import time
 
+from macpie._config import get_option
+
 
 class MethodHistory:
     """Decorator for class methods for tracking history of
@@ -9,9 +13,18 @@ class MethodHistory:
 
     When a class method is decorated with ``@MethodHistory``, each time that
     method is invoked, a record will be added to the class instance's ``_method_history``
-    attribute. The record will include before and after information using
-    the instance's ``to_dict()`` method, as well as useful information like
-    the method signature used in the invocation and duration of the method call.
+    attribute. The record will include before and after snapshots of the
+    instance, as well as useful information like the method signature used in
+    the invocation and duration of the method call.
+
+    What is recorded depends on the ``history.mode`` option:
+
+    * ``"off"``: no record is added.
+    * ``"light"``: the snapshots only include the shape, a hash of the column
+      labels, the dtypes and the ``_metadata`` attributes of the instance,
+      which doesn't depend on the number of rows.
+    * ``"full"``: the snapshots are the instance's ``to_dict()``, which converts
+      all of the data to Python objects (twice per call).
     """
 
     def __init__(self, method):
@@ -23,12 +36,32 @@ class MethodHistory:
         # method to call
         instance = args[0]  # thanks to __get__ below
 
-        method_name = self.method.__name__
+        with MethodHistory.record(instance, self.method.__name__, args, kwargs):
+            return self.method(*args, **kwargs)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def record(instance, method_name, args=(), kwargs=None):
+        """Context manager that adds a record of a call of ``method_name`` with
+        ``args`` (starting with ``instance``) and ``kwargs`` to the history of
+        ``instance``, taking the before and after snapshots around the code it
+        wraps. Used for calls not made through a decorated method.
+        """
+        mode = get_option("history.mode")
+        if mode == "off":
+            yield
+            return
+
+        if mode == "full":
+            snapshot = instance.to_dict
+        else:
+            snapshot = functools.partial(light_snapshot, instance)
+
         method_sig = collections.OrderedDict()
         for i, arg in enumerate(args):
             method_sig["arg" + str(i + 1)] = repr(arg)
 
-        for k, v in kwargs.items():
+        for k, v in (kwargs or {}).items():
             method_sig[k] = repr(v)
 
         if "_method_history" not in instance.__dict__:
@@ -37,7 +70,7 @@ class MethodHistory:
         record = {
             "method_name": method_name,
             "method_sig": dict(method_sig),
-            "before": instance.to_dict(),
+            "before": snapshot(),
             "after": None,
             "run_time": None,
         }
@@ -45,14 +78,12 @@ class MethodHistory:
         instance._method_history.append(record)
 
         start_time = time.perf_counter()
-        value = self.method(*args, **kwargs)
+        yield
         end_time = time.perf_counter()
         run_time = end_time - start_time
 
-        instance._method_history[-1]["after"] = instance.to_dict()
-        instance._method_history[-1]["run_time"] = f"{run_time:.3f} secs"
-
-        return value
+        record["after"] = snapshot()
+        record["run_time"] = f"{run_time:.3f} secs"
 
     def __get__(self, instance, owner):
         # By implementing this descriptor method, when __call__ is invoked,
@@ -98,3 +129,39 @@ class MethodTimer:
 
     def __get__(self, instance, owner):
         return functools.partial(self.__call__, instance)
+
+
+def light_snapshot(obj):
+    """Take a snapshot of a DataFrame (or Series) that is cheap to take and to
+    store, i.e. one that doesn't depend on the number of rows.
+
+    Parameters
+    ----------
+    obj : DataFrame or Series
+
+    Returns
+    -------
+    dict
+        The ``shape``, a ``columns_hash`` of the column labels, the ``dtypes``
+        by column, and the ``metadata`` (i.e. the ``_metadata`` attributes
+        not holding functions) of ``obj``.
+    """
+    if obj.ndim == 1:
+        col_labels = [obj.name]
+        dtypes = {str(obj.name): str(obj.dtype)}
+    else:
+        col_labels = list(obj.columns)
+        dtypes = {str(col): str(dtype) for col, dtype in obj.dtypes.items()}
+
+    metadata = {}
+    for attr in getattr(obj, "_metadata", []):
+        val = getattr(obj, attr, None)
+        if not callable(val):
+            metadata[attr.lstrip("_")] = list(val) if isinstance(val, list) else val
+
+    return {
+        "shape": obj.shape,
+        "columns_hash": hashlib.sha1(repr(col_labels).encode()).hexdigest(),
+        "dtypes": dtypes,
+        "metadata": metadata,
+    }
@@ -1,10 +1,14 @@
 from pathlib import Path
 from shutil import copy
 
+import click
+from click.testing import CliRunner
 import pandas as pd
 import pytest
 
 import macpie as mp
+from macpie.cli.macpie.keepone import parse_keep, parse_per
+from macpie.cli.macpie.main import main
 from macpie.testing import DebugDir
 
 THIS_DIR = Path(__file__).parent.absolute()
@@ -20,3 +24,36 @@ def test_cli_keepone(cli_keepone_big, debugdir):
     expected_result = mp.pandas.read_file(THIS_DIR / "expected_result.xlsx")
 
     pd.testing.assert_frame_equal(result, expected_result)
+
+
+def test_parse_keep():
+    assert parse_keep("Earliest") == "earliest"
+    assert parse_keep("2") == 2
+    assert parse_keep("-1") == -1
+    assert parse_keep("0:3") == slice(0, 3)
+    assert parse_keep("-2:") == slice(-2, None)
+    assert parse_keep("::2") == slice(None, None, 2)
+
+    for value in ["first", "1.5", "1:2:3:4", "::0", "0:3:-1"]:
+        with pytest.raises(click.BadParameter):
+            parse_keep(value)
+
+
+@pytest.mark.parametrize("keep", ["::0", "::-1"])
+def test_cli_keepone_bad_step(keep):
+    runner = CliRunner()
+    primary = str(Path("tests/data/instr1_primaryall.csv").resolve())
+    result = runner.invoke(main, ["--id2-col", "pidn", "keepone", "--keep", keep, primary])
+
+    assert result.exit_code == 2
+    assert "step must be positive" in result.output
+
+
+def test_parse_per():
+    assert parse_per(None) is None
+    assert parse_per("Y") == "Y"
+    assert parse_per(" 2M ") == "2M"
+
+    for value in ["bogus", "BM", ""]:
+        with pytest.raises(click.BadParameter):
+            parse_per(value)
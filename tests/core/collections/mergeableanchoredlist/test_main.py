@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+
 import macpie as mp
 
 
@@ -32,3 +35,64 @@ def test_dups(cli_link_small_with_dups):
 
     assert len(dups["instr2_all"]) == 12
     assert len(dups["instr3_all"]) == 17
+
+
+def test_merge():
+    primary = mp.Dataset(
+        {"InstrID": [1, 2, 2, 3], "PIDN": [1, 1, 1, 2], "A": ["a", "b", "c", "d"]},
+        id_col_name="InstrID",
+        name="primary",
+    )
+    sec1 = mp.Dataset({"InstrID_x": [3, 1, 4], "B": [True, False, True]}, name="sec1")
+    sec2 = mp.Dataset({"InstrID_x": [2.0, np.nan], "C": [10, 20]}, name="sec2")
+    sec3 = mp.Dataset({"InstrID_x": [1, 1], "D": [1, 2]}, name="sec3")
+
+    mal = mp.MergeableAnchoredList(primary, secondary_anchor_col="InstrID_x")
+    for sec in [sec1, sec2, sec3]:
+        mal.add_secondary(sec)
+    mal.merge()
+
+    expected = pd.DataFrame(
+        {
+            ("primary", "InstrID"): [1, 2, 2, 3],
+            ("primary", "PIDN"): [1, 1, 1, 2],
+            ("primary", "A"): ["a", "b", "c", "d"],
+            ("sec1", "InstrID_x"): [1, np.nan, np.nan, 3],
+            ("sec1", "B"): [False, np.nan, np.nan, True],
+            ("sec2", "InstrID_x"): [np.nan, 2.0, 2.0, np.nan],
+            ("sec2", "C"): [np.nan, 10, 10, np.nan],
+        },
+        index=[1, 2, 3, 4],
+    )
+    pd.testing.assert_frame_equal(pd.DataFrame(mal.merged_dset), expected)
+
+    # sec3 has duplicates, so isn't merged
+    assert sec3.has_tag(mp.Dataset.tag_duplicates)
+    assert not sec3.has_tag(mp.MergeableAnchoredList.tag_merged)
+
+
+def test_field_index():
+    primary = mp.Dataset({"InstrID": [1, 2], "A": [3, 4]}, id_col_name="InstrID", name="primary")
+    sec1 = mp.Dataset({"InstrID_x": [1, 2], "_mp_B": [5, 6]}, name="sec1")
+
+    mal = mp.MergeableAnchoredList(primary, secondary_anchor_col="InstrID_x")
+    mal.add_secondary(sec1)
+
+    field_index = mal._get_field_index()
+    assert mal._get_field_index() is field_index
+    all_fields = mal.all_fields
+    assert field_index.positions == {field: all_fields.index(field) for field in all_fields}
+    assert field_index.key_fields == set(mal.key_fields)
+    assert field_index.sys_fields == {("sec1", "_mp_B")}
+
+    # changing the Datasets or their columns rebuilds it
+    sec2 = mp.Dataset({"InstrID_x": [2], "C": [7]}, name="sec2")
+    mal.add_secondary(sec2)
+    assert ("sec2", "C") in mal._get_field_index().positions
+
+    sec2["_mp_D"] = 8
+    assert ("sec2", "_mp_D") in mal._get_field_index().sys_fields
+
+    selected_fields = mp.DatasetFields(("sec2", "C"), ("primary", "A"), ("sec1", "_mp_B"))
+    selected_fields.sort(mal)
+    assert list(selected_fields) == [("primary", "A"), ("sec1", "_mp_B"), ("sec2", "C")]
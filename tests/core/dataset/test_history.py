@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 import macpie as mp
 
 
@@ -21,3 +23,28 @@ def test_history():
 
     record2 = secondary.history[1]
     assert record2["method_name"] == "group_by_keep_one"
+
+
+def test_history_mode():
+    primary = mp.LavaDataset.from_file(THIS_DIR / "primary.xlsx")
+
+    primary.group_by_keep_one()
+    record = primary.history[-1]
+    assert record["before"]["shape"] == primary.shape
+    assert record["before"]["dtypes"]["DCDate"] == "datetime64[ns]"
+    assert record["before"]["metadata"]["date_col_name"] == "DCDate"
+    assert record["before"]["columns_hash"] == record["after"]["columns_hash"]
+
+    mp.set_option("history.mode", "full")
+    try:
+        primary.group_by_keep_one()
+        assert primary.history[-1]["before"] == primary.to_dict()
+
+        mp.set_option("history.mode", "off")
+        primary.group_by_keep_one()
+        assert len(primary.history) == 2
+    finally:
+        mp.reset_option("history.mode")
+
+    with pytest.raises(ValueError):
+        mp.set_option("history.mode", "on")
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import dateutil
 import numpy as np
+import pandas as pd
 import pytest
 
 import macpie as mp
@@ -121,6 +122,63 @@ def test_display_name_generator():
     assert df2.display_name == "renee_a_b"
 
 
+def test_dataset_wrap():
+    df = pd.DataFrame(
+        {"PIDN": [1, 2], "DCDate": pd.to_datetime(["1/1/2001", "2/2/2002"]), "name": ["a", "b"]}
+    )
+
+    dset = mp.Dataset.wrap(df, date_col_name="DCDate", id2_col_name="PIDN", name="wrapped")
+    assert np.shares_memory(dset["PIDN"].to_numpy(), df["PIDN"].to_numpy())
+    assert dset.date_col_name == "DCDate"
+    assert dset.id2_col_name == "PIDN"
+    assert dset.id_col_name is None
+    assert dset.name == "wrapped"
+    assert dset.tags == []
+    assert dset.display_name == "wrapped"
+
+    # a column with the same name as metadata is left alone
+    assert dset["name"].tolist() == ["a", "b"]
+
+    assert dset.equals(mp.Dataset(df, date_col_name="DCDate", id2_col_name="PIDN", name="wrapped"))
+
+    # metadata is propagated through pandas operations
+    sliced = dset.iloc[:1]
+    assert isinstance(sliced, mp.Dataset)
+    assert sliced.date_col_name == "DCDate"
+    assert sliced.name == "wrapped"
+
+    # the metadata is trusted as is, so no datetime conversion
+    df = pd.DataFrame({"PIDN": [1, 2], "DCDate": ["1/1/2001", "2/2/2002"]})
+    assert mp.Dataset.wrap(df, date_col_name="DCDate")["DCDate"].dtype == object
+
+
+def test_dataset_constructor_fast_path(monkeypatch):
+    dset = mp.Dataset(
+        {"InstrID": [1, 2, 3], "DCDate": ["1/1/2001", "2/2/2002", "3/3/2003"], "x": [1, 2, 3]},
+        id_col_name="instrid",
+        date_col_name="dcdate",
+        name="fast",
+        tags=["a"],
+    )
+
+    # results of operations don't go through __init__, so the metadata isn't validated again
+    def fail(*args, **kwargs):
+        raise AssertionError("Dataset.__init__ called")
+
+    monkeypatch.setattr(mp.Dataset, "__init__", fail)
+
+    for result in [dset.iloc[1:], dset[dset["x"] > 1], dset.copy(), dset.sort_values("x")]:
+        assert isinstance(result, mp.Dataset)
+        assert result.id_col_name == "InstrID"
+        assert result.date_col_name == "DCDate"
+        assert result.name == "fast"
+        assert result.tags == ["a"]
+        assert result.display_name == "fast_a"
+
+    monkeypatch.undo()
+    assert dset.iloc[1:].equals(dset.iloc[1:].copy())
+
+
 def test_lava_dataset():
 
     primary_from_file = mp.LavaDataset.from_file(DATA_DIR / "primary.xlsx")
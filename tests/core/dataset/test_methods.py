@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import pandas as pd
 
 import macpie as mp
@@ -64,3 +66,59 @@ def test_rename_col():
     dset.prepend_level("level", inplace=True)
 
     assert dset.columns.nlevels == 2
+
+
+def test_date_proximity_many():
+    primary = mp.Dataset.from_file(
+        Path(__file__).parent / "primary.xlsx",
+        id_col_name="InstrID",
+        date_col_name="DCDate",
+        id2_col_name="PIDN",
+        name="primary",
+    )
+
+    secondaries = [
+        mp.Dataset.from_file(
+            Path(__file__).parent / "secondary.xlsx",
+            id_col_name="InstrID",
+            date_col_name="DCDate",
+            id2_col_name="PIDN",
+            name=name,
+        )
+        for name in ["secondary1", "secondary2"]
+    ]
+
+    expected = [
+        primary.date_proximity(secondary, get="closest", prepend_level_name=True)
+        for secondary in secondaries
+    ]
+    results = primary.date_proximity_many(secondaries, get="closest", prepend_level_name=True)
+
+    for result, exp in zip(results, expected):
+        assert result.name == exp.name
+        assert result.id_col_name == exp.id_col_name
+        pd.testing.assert_frame_equal(result, exp)
+
+    # one record per secondary, like date_proximity
+    records = primary.history[-2:]
+    assert [record["method_name"] for record in records] == ["date_proximity"] * 2
+    assert "secondary1" in records[0]["method_sig"]["right_dset"]
+    assert "secondary2" in records[1]["method_sig"]["right_dset"]
+    assert all(record["after"] is not None for record in records)
+
+
+def test_group_by_keep_one():
+    primary = mp.Dataset.from_file(
+        Path(__file__).parent / "primary.xlsx",
+        id_col_name="InstrID",
+        date_col_name="DCDate",
+        id2_col_name="PIDN",
+        name="primary",
+    )
+
+    expected = mp.pandas.group_by_keep_one(
+        pd.DataFrame(primary), "PIDN", "DCDate", keep=-2, id_col_name="InstrID", per="Y"
+    )
+    result = primary.group_by_keep_one(keep=-2, per="Y")
+
+    pd.testing.assert_frame_equal(pd.DataFrame(result), expected)
@@ -25,3 +25,78 @@ def test():
 
     record2 = primary.history[1]
     assert record2["method_name"] == "group_by_keep_one"
+
+
+def test_columns():
+    fields = mp.DatasetFields(("sec1", "A"), ("prim", ("B", "b")), title="fields")
+    fields.extend([("sec1", "C"), ("sec2", "D")], tags=["x"])
+    fields.extendleft([("sec2", "E")], tags=["y"])
+    fields.append(("prim", "F"), tags=["x", "y"])
+
+    assert fields.height == len(fields) == 6
+    assert fields.width == 2
+    assert list(fields) == [
+        ("sec2", "E"),
+        ("sec1", "A"),
+        ("prim", ("B", "b")),
+        ("sec1", "C"),
+        ("sec2", "D"),
+        ("prim", "F"),
+    ]
+    assert fields.unique_datasets == ["sec2", "sec1", "prim"]
+    assert fields.to_dict() == {"sec2": ["E", "D"], "sec1": ["A", "C"], "prim": [("B", "b"), "F"]}
+
+    x_fields = fields.filter("x")
+    assert x_fields.title == "fields"
+    assert list(x_fields) == [("sec1", "C"), ("sec2", "D"), ("prim", "F")]
+    assert list(fields.filter(["y", "z"])) == [("sec2", "E"), ("prim", "F")]
+    assert len(fields.filter("z")) == 0
+    assert [row.tags for row in x_fields.data] == [["x"], ["x"], ["x", "y"]]
+
+    # tablib methods still work on the rows
+    x_fields.append_col_fill("x", header="Merge?")
+    assert x_fields.width == 3
+    assert x_fields.df.columns.tolist() == ["Dataset", "Field", "Merge?"]
+    assert list(x_fields.filter("y")) == [("prim", "F")]
+    assert x_fields.to_dict() == {"sec1": ["C"], "sec2": ["D"], "prim": ["F"]}
+
+
+def test_columns_tablib_operations():
+    fields = mp.DatasetFields(("sec1", "A"), ("prim", "B"))
+    fields.extend([("sec1", "C")], tags=["x"])
+    assert fields.unique_datasets == ["sec1", "prim"]
+
+    # rows changed by tablib methods are seen by the DatasetFields methods
+    fields.insert(1, ("sec2", "D"), tags=["x"])
+    fields.rpush(("prim", "E"))
+    assert list(fields) == [
+        ("sec1", "A"),
+        ("sec2", "D"),
+        ("prim", "B"),
+        ("sec1", "C"),
+        ("prim", "E"),
+    ]
+    assert list(fields.filter("x")) == [("sec2", "D"), ("sec1", "C")]
+
+    fields[0] = ("sec3", "F")
+    del fields[3]
+    assert list(fields) == [("sec3", "F"), ("sec2", "D"), ("prim", "B"), ("prim", "E")]
+    assert fields.unique_datasets == ["sec3", "sec2", "prim"]
+    assert fields.to_dict() == {"sec3": ["F"], "sec2": ["D"], "prim": ["B", "E"]}
+    assert list(fields.filter("x")) == [("sec2", "D")]
+
+    fields.append(("prim", "B"))
+    fields.remove_duplicates()
+    assert fields.height == 4
+
+    fields.extendleft([("sec4", "G")], tags=["y"])
+    assert fields.export("csv").splitlines() == [
+        "Dataset,Field",
+        "sec4,G",
+        "sec3,F",
+        "sec2,D",
+        "prim,B",
+        "prim,E",
+    ]
+    assert fields.dict[0] == {"Dataset": "sec4", "Field": "G"}
+    assert [row.tags for row in fields.filter(["x", "y"]).data] == [["y"], ["x"]]
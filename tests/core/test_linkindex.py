@@ -0,0 +1,145 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import macpie as mp
+
+
+DATA_DIR = Path("tests/data/").resolve()
+
+
+@pytest.fixture
+def primary():
+    return mp.Dataset(
+        pd.read_excel(DATA_DIR / "instr1.xlsx", sheet_name="primary"),
+        date_col_name="DCDate",
+        id2_col_name="PIDN",
+        name="primary",
+    )
+
+
+@pytest.fixture
+def secondary():
+    return mp.Dataset.from_file(
+        DATA_DIR / "instr1_all.csv",
+        id_col_name="InstrID",
+        date_col_name="DCDate",
+        id2_col_name="PIDN",
+        name="instr1_all",
+    )
+
+
+@pytest.mark.parametrize("engine", ["merge", "interval"])
+@pytest.mark.parametrize("fractional_days", [True, False])
+def test_link_index(primary, secondary, engine, fractional_days):
+    link_index = mp.LinkIndex.from_dataset(primary)
+
+    assert len(link_index) == len(primary)
+
+    mp.set_option("operators.dates.fractional_days", fractional_days)
+    try:
+        expected = primary.date_proximity(secondary, get="closest", engine=engine)
+        result = primary.date_proximity(
+            secondary, get="closest", engine=engine, link_index=link_index
+        )
+    finally:
+        mp.reset_option("operators.dates.fractional_days")
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_link_index_npz(primary, secondary, tmp_path):
+    link_index = mp.LinkIndex.from_dataset(primary)
+    link_index.to_npz(tmp_path / "link_index.npz")
+
+    loaded = mp.LinkIndex.from_npz(tmp_path / "link_index.npz")
+
+    assert loaded.id_col_names == link_index.id_col_names
+    assert loaded.date_col_name == link_index.date_col_name
+    assert loaded.link_id_col_name == link_index.link_id_col_name
+    assert loaded.dtypes == link_index.dtypes
+    assert loaded.fingerprint is None
+
+    expected = primary.date_proximity(secondary, link_index=link_index)
+    result = primary.date_proximity(secondary, link_index=loaded)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_link_index_df_npz(tmp_path):
+    df = pd.DataFrame(
+        {
+            ("lvl", "id"): ["a", "b", "a", None],
+            ("lvl", "date"): ["2001-01-01", "2001-01-01", "2002-01-01", "2003-01-01"],
+        }
+    )
+    link_index = mp.LinkIndex.from_df(df, [("lvl", "id")], ("lvl", "date"))
+    link_index.to_npz(tmp_path / "link_index.npz")
+
+    loaded = mp.LinkIndex.from_npz(tmp_path / "link_index.npz")
+
+    assert loaded.id_col_names == [("lvl", "id")]
+    assert loaded.date_col_name == ("lvl", "date")
+    assert (loaded.get_row_codes() == [0, 1, 0, 2]).all()
+    assert (loaded.get_row_dates() == link_index.get_row_dates()).all()
+    assert (loaded.day_ordinals == link_index.day_ordinals).all()
+    pd.testing.assert_frame_equal(loaded.ids, link_index.ids.reset_index(drop=True))
+
+
+def test_link_index_mismatch(primary, secondary):
+    link_index = mp.LinkIndex.from_dataset(primary.iloc[:10])
+
+    with pytest.raises(ValueError):
+        primary.date_proximity(secondary, link_index=link_index)
+
+
+def test_link_index_sorted():
+    df = pd.DataFrame(
+        {
+            "id": [2, 1, 2, 1],
+            "date": pd.to_datetime(["2001-01-03", "2001-01-02", "2001-01-01", None]),
+        }
+    )
+    link_index = mp.LinkIndex.from_df(df, "id", "date")
+
+    # rows sorted by id code (in order of first appearance), then date
+    assert link_index.order.tolist() == [2, 0, 3, 1]
+    assert link_index.offsets.tolist() == [0, 2, 4]
+    assert link_index.day_ordinals[:2].tolist() == [11323, 11325]
+    assert (link_index.get_row_codes() == [0, 1, 0, 1]).all()
+    assert (link_index.get_row_dates() == pd.DatetimeIndex(df["date"]).asi8).all()
+
+
+def test_link_index_stale(primary, secondary):
+    link_index = mp.LinkIndex.from_dataset(primary)
+
+    # different dtypes
+    modified = primary.copy()
+    modified["PIDN"] = modified["PIDN"].astype(str)
+    with pytest.raises(ValueError):
+        modified.date_proximity(secondary, link_index=link_index)
+
+    link_index = mp.LinkIndex.from_dataset(primary, verify=True)
+
+    # same rows, ids and dates, but in a different order
+    reordered = primary.iloc[::-1].reset_index(drop=True)
+    with pytest.raises(ValueError):
+        reordered.date_proximity(secondary, link_index=link_index)
+
+    # a modified date
+    modified = primary.copy()
+    modified.loc[0, "DCDate"] = pd.Timestamp("1900-01-01")
+    with pytest.raises(ValueError):
+        modified.date_proximity(secondary, link_index=link_index)
+
+    expected = primary.date_proximity(secondary)
+    result = primary.date_proximity(secondary, link_index=link_index)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_link_index_duplicates():
+    df = pd.DataFrame({"id": [1, 1], "date": ["2001-01-01", "2001-01-01"]})
+
+    with pytest.raises(ValueError):
+        mp.LinkIndex.from_df(df, "id", "date")
@@ -176,6 +176,30 @@ class TestMACPieExcel:
         dset_2_1_parsed = mp.read_excel(tmp_path / "dset_2_1.xlsx")
         pd.testing.assert_frame_equal(dset_2_1, dset_2_1_parsed)
 
+    def test_col_filter(self, tmp_path, engine):
+        dset_1_1 = mp.Dataset(pd.DataFrame(data, columns=reg_columns, index=reg_index))
+        dset_1_1.to_excel(tmp_path / "dset_1_1.xlsx", engine=engine, header=True, index=True)
+
+        dset_1_1_parsed = mp.read_excel(
+            tmp_path / "dset_1_1.xlsx", col_filter=lambda col: col in ["col3", "ids"]
+        )
+        pd.testing.assert_frame_equal(dset_1_1[["col3", "ids"]], dset_1_1_parsed)
+
+        # dropping the first column of each level 0 label
+        columns_2 = pd.MultiIndex.from_product([["a", "b"], reg_columns])
+        df_2_2 = pd.DataFrame([row + row for row in data], columns=columns_2, index=mi_index)
+        dset_2_2 = mp.Dataset(df_2_2)
+        dset_2_2.to_excel(tmp_path / "dset_2_2.xlsx", engine=engine, header=True, index=True)
+
+        dset_2_2_parsed = mp.read_excel(
+            tmp_path / "dset_2_2.xlsx", col_filter=lambda col: col[1] not in ["col1", "date"]
+        )
+        expected = dset_2_2.loc[:, ~dset_2_2.columns.get_level_values(1).isin(["col1", "date"])]
+        pd.testing.assert_frame_equal(expected, dset_2_2_parsed)
+
+        with pytest.raises(ValueError):
+            mp.read_excel(tmp_path / "dset_1_1.xlsx", col_filter=bool, usecols=[0, 1])
+
     def test_basic_collection(self, tmp_path, engine):
         basic_list = mp.BasicList([reg_dset, mi_dset])
 
@@ -221,3 +245,231 @@ class TestMACPieExcel:
         mi_dset_parsed = basic_list_from_file["mi_test_name"]
         mi_dset_parsed.index = mi_index
         pd.testing.assert_frame_equal(mi_dset_parsed, mi_dset)
+
+
+def test_body_blocks(tmp_path, monkeypatch):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    dups_col_name = mp.get_option("column.system.duplicates")
+    dset = mp.Dataset(
+        pd.DataFrame(
+            {
+                "ints": [1, 2, 3, 4, 5],
+                "floats": [1.5, float("nan"), float("inf"), -float("inf"), 0.25],
+                "bools": [True, False, True, False, True],
+                "dates": pd.to_datetime(["1/1/2001", None, "3/3/2003", "4/4/2004", "5/5/2005"]),
+                "objects": ["a", None, 3, "=1+1", 2.5],
+                dups_col_name: [False, True, True, False, False],
+            }
+        )
+    )
+    # crossing blocks
+    monkeypatch.setattr(mp.io.formats.excel.MACPieExcelFormatter, "body_block_size", 2)
+    dset.to_excel(tmp_path / "blocks.xlsx", engine="mp_xlsxwriter", na_rep="NA", inf_rep="INF")
+
+    monkeypatch.setattr(
+        mp.io.formats.excel.MACPieExcelFormatter, "can_format_body_blocks", lambda self: False
+    )
+    dset.to_excel(tmp_path / "cells.xlsx", engine="mp_xlsxwriter", na_rep="NA", inf_rep="INF")
+
+    wks_blocks = openpyxl.load_workbook(tmp_path / "blocks.xlsx").worksheets[0]
+    wks_cells = openpyxl.load_workbook(tmp_path / "cells.xlsx").worksheets[0]
+    assert wks_blocks.max_row == wks_cells.max_row == 6
+    for row_blocks, row_cells in zip(wks_blocks.iter_rows(), wks_cells.iter_rows()):
+        for cell_blocks, cell_cells in zip(row_blocks, row_cells):
+            assert cell_blocks.value == cell_cells.value
+            assert cell_blocks.data_type == cell_cells.data_type
+            assert cell_blocks.number_format == cell_cells.number_format
+            assert cell_blocks.fill.fgColor.rgb == cell_cells.fill.fgColor.rgb
+
+    # duplicates are highlighted
+    assert wks_blocks["B3"].fill.fgColor.rgb == wks_blocks["B4"].fill.fgColor.rgb != "00000000"
+    assert wks_blocks["B2"].fill.fgColor.rgb == "00000000"
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_body_blocks_merges(tmp_path, monkeypatch, streaming):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    index = pd.MultiIndex.from_arrays([["a", "a", "a", "b", "b"], [1, 2, 3, 4, 5]])
+    dset = mp.Dataset(pd.DataFrame({"col": [1, 2, 3, 4, 5]}, index=index))
+
+    # merged cells crossing blocks
+    monkeypatch.setattr(mp.io.formats.excel.MACPieExcelFormatter, "body_block_size", 2)
+    with mp.MACPieExcelWriter(tmp_path / "blocks.xlsx", streaming=streaming) as writer:
+        dset.to_excel(writer, index=True)
+
+    monkeypatch.setattr(
+        mp.io.formats.excel.MACPieExcelFormatter, "can_format_body_blocks", lambda self: False
+    )
+    dset.to_excel(tmp_path / "cells.xlsx", engine="mp_xlsxwriter", index=True)
+
+    wks_blocks = openpyxl.load_workbook(tmp_path / "blocks.xlsx").worksheets[0]
+    wks_cells = openpyxl.load_workbook(tmp_path / "cells.xlsx").worksheets[0]
+    assert sorted(map(str, wks_cells.merged_cells.ranges)) == ["A2:A4", "A5:A6"]
+    if streaming:
+        # rows already written can't be merged, so the labels are in every row
+        assert not wks_blocks.merged_cells.ranges
+        assert [cell.value for cell in wks_blocks["A"]] == [None, "a", "a", "a", "b", "b"]
+    else:
+        assert sorted(map(str, wks_blocks.merged_cells.ranges)) == ["A2:A4", "A5:A6"]
+        for row_blocks, row_cells in zip(wks_blocks.iter_rows(), wks_cells.iter_rows()):
+            assert [cell.value for cell in row_blocks] == [cell.value for cell in row_cells]
+
+    pd.testing.assert_frame_equal(
+        mp.read_excel(tmp_path / "blocks.xlsx", index_col=[0, 1]),
+        mp.read_excel(tmp_path / "cells.xlsx", index_col=[0, 1]),
+    )
+
+
+def test_streaming(tmp_path):
+    dups_col_name = mp.get_option("column.system.duplicates")
+    dset = mp.Dataset(
+        pd.DataFrame(data, columns=reg_columns, index=mi_index).assign(
+            **{dups_col_name: [True, True, False]}
+        ),
+        id_col_name="ids",
+        date_col_name="date",
+        name="streamed",
+    )
+    basic_list = mp.BasicList([reg_dset, dset])
+
+    basic_list.to_excel(tmp_path / "streaming.xlsx", streaming=True, index=True)
+    basic_list.to_excel(tmp_path / "not_streaming.xlsx", streaming=False, index=True)
+
+    for filename in ["streaming.xlsx", "not_streaming.xlsx"]:
+        basic_list_from_file = mp.read_excel(tmp_path / filename, as_collection=True)
+        assert isinstance(basic_list_from_file, mp.BasicList)
+        pd.testing.assert_frame_equal(basic_list_from_file[0], reg_dset)
+        pd.testing.assert_frame_equal(basic_list_from_file[1], dset)
+
+    try:
+        mp.set_option("excel.writer.streaming", True)
+        with mp.MACPieExcelWriter(tmp_path / "option.xlsx") as writer:
+            assert writer.streaming
+            # rows of a sheet must be written in order
+            reg_dset.to_excel(writer, sheet_name="sheet", startrow=10)
+            with pytest.raises(ValueError):
+                reg_dset.to_excel(writer, sheet_name="sheet")
+    finally:
+        mp.reset_option("excel.writer.streaming")
+
+    with pytest.raises(ValueError):
+        mp.MACPieExcelWriter(tmp_path / "openpyxl.xlsx", engine="mp_openpyxl", streaming=True)
+
+
+def test_autofit_columns(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+
+    dset = mp.Dataset(
+        pd.DataFrame({"short": ["a", "bb", None, "ccc"], "long": ["a", "bb", "c" * 20, None]}),
+        name="autofit",
+    )
+
+    def write_widths(filename, sample_size=None):
+        try:
+            mp.set_option("excel.writer.autofit_sample_size", sample_size)
+            with mp.MACPieExcelWriter(
+                tmp_path / filename, engine_kwargs={"options": {"autofit_columns": True}}
+            ) as writer:
+                dset.to_excel(writer, na_rep="NA")
+        finally:
+            mp.reset_option("excel.writer.autofit_sample_size")
+        wks = openpyxl.load_workbook(tmp_path / filename)["autofit"]
+        return [wks.column_dimensions[col].width for col in ["A", "B"]]
+
+    # widths of "short" (header) and of "c" * 20
+    widths = write_widths("all.xlsx")
+    assert widths[0] < widths[1]
+    # rows 0 and 2 are measured
+    assert write_widths("sampled.xlsx", sample_size=2) == widths
+    # only row 0 is measured, so the headers are the longest strings
+    first_widths = write_widths("first.xlsx", sample_size=1)
+    assert first_widths[0] == widths[0]
+    assert first_widths[1] < widths[1]
+
+
+@pytest.mark.parametrize("engine", ["mp_openpyxl", "mp_calamine"])
+def test_reader_engines(tmp_path, engine):
+    if engine == "mp_calamine":
+        pytest.importorskip("python_calamine")
+
+    dset_2_2 = mp.Dataset(pd.DataFrame(data, columns=mi_columns, index=mi_index))
+    dset_2_2.to_excel(tmp_path / "dset_2_2.xlsx", header=True, index=True)
+
+    with mp.MACPieExcelFile(tmp_path / "dset_2_2.xlsx", engine=engine) as excel_file:
+        assert excel_file.engine == engine
+        pd.testing.assert_frame_equal(dset_2_2, mp.read_excel(excel_file))
+
+    dset_2_2_parsed = mp.read_excel(
+        tmp_path / "dset_2_2.xlsx", engine=engine, col_filter=lambda col: col[1] != "date"
+    )
+    pd.testing.assert_frame_equal(dset_2_2.drop(columns=("level", "date")), dset_2_2_parsed)
+
+    basic_list = mp.BasicList([reg_dset, mi_dset])
+    basic_list.to_excel(tmp_path / "basic_list.xlsx", index=True)
+    basic_list_from_file = mp.read_excel(
+        tmp_path / "basic_list.xlsx", as_collection=True, engine=engine
+    )
+    assert isinstance(basic_list_from_file, mp.BasicList)
+    pd.testing.assert_frame_equal(basic_list_from_file[0], reg_dset)
+    pd.testing.assert_frame_equal(basic_list_from_file[1], mi_dset)
+
+    # the default doesn't depend on which packages are installed
+    with mp.MACPieExcelFile(tmp_path / "dset_2_2.xlsx") as excel_file:
+        assert excel_file.engine == "mp_openpyxl"
+
+    try:
+        mp.set_option("excel.reader.engine", engine)
+        with mp.MACPieExcelFile(tmp_path / "dset_2_2.xlsx") as excel_file:
+            assert excel_file.engine == engine
+        mp.set_option("excel.reader.engine", "auto")
+        with mp.MACPieExcelFile(tmp_path / "dset_2_2.xlsx") as excel_file:
+            assert excel_file.engine in ("mp_openpyxl", "mp_calamine")
+    finally:
+        mp.reset_option("excel.reader.engine")
+
+    with pytest.raises(ValueError):
+        mp.MACPieExcelFile(tmp_path / "dset_2_2.xlsx", engine="openpyxl")
+
+
+def test_lazy(tmp_path):
+    dsets = [
+        mp.Dataset(
+            reg_df, id_col_name="ids", date_col_name="date", name=f"dset{i}", tags=[f"t{i}"]
+        )
+        for i in range(3)
+    ]
+    mp.BasicList(dsets).to_excel(tmp_path / "lazy.xlsx", index=True)
+
+    try:
+        mp.set_option("excel.reader.max_parsed_sheets", 2)
+        basic_list = mp.read_excel(tmp_path / "lazy.xlsx", as_collection=True, lazy=True)
+        assert isinstance(basic_list, mp.BasicList)
+        assert all(isinstance(dset, mp.LazyDataset) for dset in basic_list)
+
+        # names and tags do not need the sheets
+        assert [dset.name for dset in basic_list] == ["dset0", "dset1", "dset2"]
+        filtered = basic_list.filter("t1")
+        assert [dset.name for dset in filtered] == ["dset1"]
+        assert not any(dset.is_loaded for dset in basic_list)
+
+        pd.testing.assert_frame_equal(filtered[0].load(), dsets[1])
+        assert basic_list[0]["col1"].tolist() == [1, 2, 3]
+        assert basic_list[1].id_col_name == "ids"
+        assert [dset.is_loaded for dset in basic_list] == [True, True, False]
+
+        # the least recently used sheet is evicted, and parsed again when used
+        pd.testing.assert_frame_equal(basic_list[2].load(), dsets[2])
+        assert [dset.is_loaded for dset in basic_list] == [False, True, True]
+        pd.testing.assert_frame_equal(basic_list[0].load(), dsets[0])
+    finally:
+        mp.reset_option("excel.reader.max_parsed_sheets")
+
+    with mp.MACPieExcelFile(tmp_path / "lazy.xlsx") as excel_file:
+        # the system sheets are only parsed when needed
+        assert "_dataset_dicts" not in vars(excel_file)
+        lazy_dsets = excel_file.parse(sheet_name=[0, 2], lazy=True)
+        assert [dset.name for dset in lazy_dsets.values()] == ["dset0", "dset2"]
+        assert lazy_dsets[2].tags == ["t2"]
+        pd.testing.assert_frame_equal(lazy_dsets[2].load(), dsets[2])
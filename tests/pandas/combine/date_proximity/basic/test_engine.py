@@ -0,0 +1,116 @@
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from macpie.pandas import read_file
+
+
+DATA_DIR = Path("tests/data/").resolve()
+
+primary = pd.read_excel(DATA_DIR / "instr1.xlsx", sheet_name="primary")
+secondary = read_file(DATA_DIR / "instr1_all.csv")
+
+
+@pytest.mark.parametrize("get", ["all", "closest"])
+@pytest.mark.parametrize("when", ["earlier", "later", "earlier_or_later"])
+@pytest.mark.parametrize("dropna", [True, False])
+def test_interval_engine(get, when, dropna):
+    kwargs = {
+        "id_on": "pidn",
+        "date_on": "dcdate",
+        "get": get,
+        "when": when,
+        "days": 90,
+        "dropna": dropna,
+        "duplicates_indicator": True,
+    }
+
+    expected = primary.mac.date_proximity(secondary, engine="merge", **kwargs)
+    result = primary.mac.date_proximity(secondary, engine="interval", **kwargs)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_interval_engine_missing_values():
+    d1 = {
+        "PIDN": [1, 2, 3, 4],
+        "DCDate": [datetime(2001, 3, 2), None, datetime(2001, 8, 1), datetime(2001, 8, 1)],
+        "Col1": [1, 2, 3, 4],
+    }
+    primary = pd.DataFrame(data=d1)
+
+    d2 = {
+        "PIDN": [1, 1, 2, 3, None, 1],
+        "DCDate": [
+            datetime(2001, 3, 2),
+            datetime(2001, 1, 2),
+            datetime(2001, 3, 2),
+            None,
+            datetime(2001, 8, 1),
+            datetime(2000, 3, 2),
+        ],
+        "Col1": [5, 6, 7, 8, 9, 10],
+        "Col2": [True, False, True, False, True, False],
+    }
+    secondary = pd.DataFrame(data=d2, index=[10, 8, 6, 4, 2, 0])
+
+    for prepend_levels in [(None, None), ("left", "right")]:
+        for dropna in [True, False]:
+            kwargs = {
+                "id_on": "pidn",
+                "date_on": "dcdate",
+                "dropna": dropna,
+                "merge": "full",
+                "prepend_levels": prepend_levels,
+            }
+
+            expected = primary.mac.date_proximity(secondary, engine="merge", **kwargs)
+            result = primary.mac.date_proximity(secondary, engine="interval", **kwargs)
+
+            pd.testing.assert_frame_equal(result, expected)
+
+
+def test_invalid_engine():
+    with pytest.raises(ValueError):
+        primary.mac.date_proximity(secondary, id_on="pidn", date_on="dcdate", engine="blah")
+
+
+@pytest.mark.parametrize("when", ["earlier", "later", "earlier_or_later"])
+@pytest.mark.parametrize("days", [0, 10, 90])
+def test_interval_engine_closest_ties(when, days):
+    d1 = {
+        "PIDN": [1, 2, 3],
+        "DCDate": [datetime(2001, 3, 2), datetime(2001, 3, 2), datetime(2001, 8, 1)],
+    }
+    primary = pd.DataFrame(data=d1)
+
+    d2 = {
+        "PIDN": [1, 1, 1, 2, 2, 2, 3],
+        "DCDate": [
+            datetime(2001, 2, 25),
+            datetime(2001, 3, 7),
+            datetime(2001, 3, 7),
+            datetime(2001, 3, 2),
+            datetime(2001, 1, 2),
+            datetime(2001, 3, 2),
+            datetime(2001, 9, 1),
+        ],
+        "Col1": [1, 2, 3, 4, 5, 6, 7],
+    }
+    secondary = pd.DataFrame(data=d2)
+
+    kwargs = {
+        "id_on": "pidn",
+        "date_on": "dcdate",
+        "get": "closest",
+        "when": when,
+        "days": days,
+        "duplicates_indicator": True,
+    }
+
+    expected = primary.mac.date_proximity(secondary, engine="merge", **kwargs)
+    result = primary.mac.date_proximity(secondary, engine="interval", **kwargs)
+
+    pd.testing.assert_frame_equal(result, expected)
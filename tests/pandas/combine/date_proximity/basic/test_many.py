@@ -0,0 +1,89 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import macpie as mp
+
+
+DATA_DIR = Path("tests/data/").resolve()
+
+primary = pd.read_excel(DATA_DIR / "instr1.xlsx", sheet_name="primary")
+secondary = pd.read_csv(DATA_DIR / "instr1_all.csv")
+
+
+@pytest.mark.parametrize("engine", ["merge", "interval"])
+@pytest.mark.parametrize("prepend_levels", [(None, None), ("left", "right")])
+def test_date_proximity_many(engine, prepend_levels):
+    rights = [
+        secondary,
+        secondary.rename(columns={"PIDN": "pidn", "DCDate": "dcdate"}),
+        secondary.iloc[::3],
+    ]
+
+    kwargs = {
+        "id_on": "pidn",
+        "date_on": "dcdate",
+        "get": "closest",
+        "days": 90,
+        "merge": "full",
+        "prepend_levels": prepend_levels,
+        "engine": engine,
+    }
+
+    expected = [primary.mac.date_proximity(right.copy(), **kwargs) for right in rights]
+    results = primary.mac.date_proximity_many((right.copy() for right in rights), **kwargs)
+
+    assert len(results) == len(expected)
+    for result, exp in zip(results, expected):
+        pd.testing.assert_frame_equal(result, exp)
+
+
+def test_date_proximity_many_empty():
+    assert mp.pandas.date_proximity_many(primary, [], id_on="pidn", date_on="dcdate") == []
+
+
+def test_date_proximity_many_rights_options():
+    rights = [
+        secondary.rename(columns={"PIDN": "id", "DCDate": "visit"}),
+        secondary,
+    ]
+    rights_options = [
+        {"id_right_on": "id", "date_right_on": "visit", "right_level": "first"},
+        {"right_level": "second"},
+    ]
+
+    kwargs = {"get": "closest", "merge": "full"}
+
+    expected = [
+        primary.mac.date_proximity(
+            rights[0].copy(),
+            id_left_on="pidn",
+            id_right_on="id",
+            date_left_on="dcdate",
+            date_right_on="visit",
+            prepend_levels=("primary", "first"),
+            **kwargs,
+        ),
+        primary.mac.date_proximity(
+            rights[1].copy(),
+            id_on="pidn",
+            date_on="dcdate",
+            prepend_levels=("primary", "second"),
+            **kwargs,
+        ),
+    ]
+    # id_on and date_on are used for the rights without their own columns
+    results = mp.pandas.date_proximity_many(
+        primary,
+        [right.copy() for right in rights],
+        rights_options=rights_options,
+        id_on="pidn",
+        date_on="dcdate",
+        prepend_levels=("primary", None),
+        **kwargs,
+    )
+
+    assert len(results) == len(expected)
+    for result, exp in zip(results, expected):
+        pd.testing.assert_frame_equal(result, exp)
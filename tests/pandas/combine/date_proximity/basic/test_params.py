@@ -3,6 +3,8 @@ from datetime import datetime
 import pandas as pd
 import pytest
 
+import macpie as mp
+
 
 def test_params_1():
     d1 = {
@@ -219,3 +221,41 @@ def test_params_2():
             days="asdf",
             merge="partial",
         )
+
+
+@pytest.mark.parametrize("engine", ["merge", "interval"])
+def test_fractional_days(engine):
+    d1 = {
+        "PIDN": [1, 2],
+        "DCDate": [datetime(2001, 3, 2, 18), datetime(2001, 8, 1, 12)],
+    }
+    primary = pd.DataFrame(data=d1)
+
+    d2 = {
+        "PIDN": [1, 1, 2],
+        "DCDate": [datetime(2001, 3, 12, 6), datetime(2001, 3, 12, 20), datetime(2001, 8, 11, 6)],
+        "Col1": [1, 2, 3],
+    }
+    secondary = pd.DataFrame(data=d2)
+
+    kwargs = {"id_on": "pidn", "date_on": "dcdate", "days": 10, "engine": engine}
+
+    # by default, days include the time of day of the dates
+    result = primary.mac.date_proximity(secondary, dropna=True, **kwargs)
+    assert result["Col1"].tolist() == [1, 3]
+    assert result["_mp_diff_days"].tolist() == [9.5, 9.75]
+
+    result = primary.mac.date_proximity(secondary, get="closest", **kwargs)
+    assert result["Col1"].tolist() == [1, 3]
+
+    # or are counted between the days of the dates
+    mp.set_option("operators.dates.fractional_days", False)
+    try:
+        result = primary.mac.date_proximity(secondary, dropna=True, **kwargs)
+        assert result["Col1"].tolist() == [1, 2, 3]
+        assert result["_mp_diff_days"].tolist() == [10.0, 10.0, 10.0]
+
+        result = primary.mac.date_proximity(secondary, get="closest", **kwargs)
+        assert result["Col1"].tolist() == [1, 2, 3]
+    finally:
+        mp.reset_option("operators.dates.fractional_days")
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+
+DATA_DIR = Path("tests/data/").resolve()
+
+primary = pd.read_excel(DATA_DIR / "instr1.xlsx", sheet_name="primary")
+secondary = pd.read_csv(DATA_DIR / "instr1_all.csv")
+
+
+@pytest.mark.parametrize("engine", ["merge", "interval"])
+@pytest.mark.parametrize("get", ["all", "closest"])
+@pytest.mark.parametrize("dropna", [True, False])
+@pytest.mark.parametrize("partitions", [1, 3, 50])
+def test_partitions(engine, get, dropna, partitions):
+    kwargs = {
+        "id_on": "pidn",
+        "date_on": "dcdate",
+        "get": get,
+        "days": 90,
+        "dropna": dropna,
+        "duplicates_indicator": True,
+        "engine": engine,
+    }
+
+    expected = primary.mac.date_proximity(secondary.copy(), **kwargs)
+    result = primary.mac.date_proximity(secondary.copy(), partitions=partitions, **kwargs)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("engine", ["merge", "interval"])
+@pytest.mark.parametrize("get", ["all", "closest"])
+@pytest.mark.parametrize("prepend_levels", [(None, None), ("left", "right")])
+def test_chunks(engine, get, prepend_levels):
+    kwargs = {
+        "id_on": "pidn",
+        "date_on": "dcdate",
+        "get": get,
+        "days": 90,
+        "merge": "full",
+        "prepend_levels": prepend_levels,
+        "engine": engine,
+    }
+
+    expected = primary.mac.date_proximity(secondary.copy(), **kwargs)
+
+    with pd.read_csv(DATA_DIR / "instr1_all.csv", chunksize=1000) as reader:
+        result = primary.mac.date_proximity(reader, **kwargs)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("engine", ["merge", "interval"])
+@pytest.mark.parametrize("get", ["all", "closest"])
+def test_n_jobs(engine, get):
+    kwargs = {
+        "id_on": "pidn",
+        "date_on": "dcdate",
+        "get": get,
+        "days": 90,
+        "duplicates_indicator": True,
+        "engine": engine,
+    }
+
+    expected = primary.mac.date_proximity(secondary.copy(), **kwargs)
+    result = primary.mac.date_proximity(secondary.copy(), n_jobs=2, **kwargs)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_invalid_partitions():
+    with pytest.raises(ValueError):
+        primary.mac.date_proximity(secondary, id_on="pidn", date_on="dcdate", partitions=0)
+
+    with pytest.raises(TypeError):
+        primary.mac.date_proximity([], id_on="pidn", date_on="dcdate")
+
+    with pytest.raises(ValueError):
+        primary.mac.date_proximity(secondary, id_on="pidn", date_on="dcdate", n_jobs=0)
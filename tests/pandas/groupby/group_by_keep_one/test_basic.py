@@ -3,6 +3,8 @@ from datetime import datetime
 import pandas as pd
 import pytest
 
+import macpie as mp
+
 
 def test_keep():
 
@@ -87,3 +89,135 @@ def test_2():
     expected_result = pd.DataFrame(data=expected_result_dict)
 
     assert result.equals(expected_result)
+
+
+def test_fractional_days():
+    d = {
+        "PIDN": [1, 1, 1, 2],
+        "DCDate": [
+            datetime(2001, 3, 2, 18),
+            datetime(2001, 3, 2, 6),
+            datetime(2001, 3, 5),
+            datetime(2001, 8, 1),
+        ],
+        "Col3": [7, 8, 9, 10],
+    }
+    df = pd.DataFrame(data=d)
+
+    # by default, dates are compared with their time of day
+    result = df.mac.group_by_keep_one(group_by_col="pidn", date_col_name="dcdate", keep="earliest")
+    assert result["Col3"].tolist() == [8, 10]
+    assert "_mp_duplicates" not in result.columns
+
+    # compared by day, rows on the same day are ties
+    mp.set_option("operators.dates.fractional_days", False)
+    try:
+        result = df.mac.group_by_keep_one(
+            group_by_col="pidn", date_col_name="dcdate", keep="earliest"
+        )
+        assert result["Col3"].tolist() == [8, 7, 10]
+        assert result["_mp_duplicates"].tolist() == [True, True, False]
+    finally:
+        mp.reset_option("operators.dates.fractional_days")
+
+
+def test_time_of_day_drop_duplicates():
+    # rows on the same day, at different times, are not duplicates by default
+    d = {
+        "PIDN": [1, 1, 1, 2, 2],
+        "DCDate": [
+            datetime(2001, 3, 2, 18),
+            datetime(2001, 3, 2, 6),
+            datetime(2001, 3, 2, 6),
+            datetime(2001, 8, 1, 9),
+            datetime(2001, 8, 1, 10),
+        ],
+        "Col3": [7, 8, 9, 10, 11],
+    }
+    df = pd.DataFrame(data=d)
+
+    result = df.mac.group_by_keep_one(
+        group_by_col="pidn", date_col_name="dcdate", keep="all", drop_duplicates=True
+    )
+    assert result["Col3"].tolist() == [8, 7, 10, 11]
+
+    result = df.mac.group_by_keep_one(group_by_col="pidn", date_col_name="dcdate", keep="latest")
+    assert result["Col3"].tolist() == [7, 11]
+
+    mp.set_option("operators.dates.fractional_days", False)
+    try:
+        result = df.mac.group_by_keep_one(
+            group_by_col="pidn", date_col_name="dcdate", keep="all", drop_duplicates=True
+        )
+        assert result["Col3"].tolist() == [8, 10]
+    finally:
+        mp.reset_option("operators.dates.fractional_days")
+
+
+def test_keep_int_and_slice():
+    d = {
+        "PIDN": [1, 1, 1, 1, 1, 2, 2],
+        "DCDate": [
+            datetime(2001, 3, 2),
+            datetime(2001, 1, 2),
+            datetime(2001, 5, 2),
+            datetime(2001, 3, 2),
+            datetime(2001, 7, 2),
+            datetime(2002, 1, 1),
+            datetime(2002, 2, 1),
+        ],
+        "Col3": [1, 2, 3, 4, 5, 6, 7],
+    }
+    df = pd.DataFrame(data=d)
+
+    def keep_col3(keep, **kwargs):
+        result = df.mac.group_by_keep_one(
+            group_by_col="pidn", date_col_name="dcdate", keep=keep, **kwargs
+        )
+        return result["Col3"].tolist()
+
+    # rows on the same date are all kept
+    assert keep_col3(1) == [1, 4, 7]
+    assert keep_col3(0) == keep_col3("earliest")
+    assert keep_col3(-1) == keep_col3("latest")
+    assert keep_col3(-3) == [1, 4]
+    assert keep_col3(5) == []
+
+    assert keep_col3(slice(2)) == [2, 1, 4, 6, 7]
+    assert keep_col3(slice(-2, None)) == [3, 5, 6, 7]
+    assert keep_col3(slice(1, -1)) == [1, 4, 3]
+    assert keep_col3(slice(None, None, 2)) == [2, 3, 6]
+
+    with pytest.raises(ValueError):
+        keep_col3(slice(None, None, -1))
+
+    with pytest.raises(ValueError):
+        keep_col3(1.5)
+
+
+def test_per():
+    d = {
+        "PIDN": [1, 1, 1, 1, 2],
+        "DCDate": [
+            datetime(2001, 3, 2),
+            datetime(2001, 8, 2),
+            datetime(2002, 1, 2),
+            datetime(2002, 6, 2),
+            datetime(2001, 1, 1),
+        ],
+        "Col3": [1, 2, 3, 4, 5],
+    }
+    df = pd.DataFrame(data=d)
+
+    result = df.mac.group_by_keep_one(
+        group_by_col="pidn", date_col_name="dcdate", keep="latest", per="Y"
+    )
+    assert result["Col3"].tolist() == [2, 4, 5]
+
+    result = df.mac.group_by_keep_one(group_by_col="pidn", date_col_name="dcdate", keep=0, per="Y")
+    assert result["Col3"].tolist() == [1, 3, 5]
+
+    result = df.mac.group_by_keep_one(
+        group_by_col="pidn", date_col_name="dcdate", keep=slice(1, None), per="Y"
+    )
+    assert result["Col3"].tolist() == [2, 4]
@@ -144,6 +144,25 @@ def test_get_col_name():
     with pytest.raises(KeyError):
         df.mac.get_col_name(None)
 
+    # lookups follow changes to the columns
+    df = df.rename(columns={"col1": "Col1"})
+    assert df.mac.get_col_name("COL1") == "Col1"
+    df.columns = pd.MultiIndex.from_product([["a"], df.columns])
+    assert df.mac.get_col_name(("A", "col1")) == ("a", "Col1")
+
+    with pytest.raises(KeyError):
+        df.mac.get_col_name(("a", "colZZZ"))
+
+
+def test_get_col_names():
+    df = pd.DataFrame(columns=["Col1", "col2", "COL2", "date"])
+
+    assert df.mac.get_col_names(["col1", "col2", "DATE"]) == ["Col1", "col2", "date"]
+    assert df.mac.get_col_names(["colZZZ", "date"], strict=False) == [None, "date"]
+
+    with pytest.raises(KeyError):
+        df.mac.get_col_names(["colZZZ", "date"])
+
 
 def test_get_cols_by_prefixes():
     d = {
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+import macpie as mp
+
+
+def test_dataframe_accessor():
+    df = pd.DataFrame({"PIDN": [1, 2]})
+
+    assert df.mac.get_col_name("pidn") == "PIDN"
+    assert df.mac.get_col_name is df.mac.get_col_name
+    assert df.mac.col_count() == 1
+
+    with pytest.raises(AttributeError):
+        df.mac.not_a_function
+
+
+@pytest.mark.parametrize(
+    "accessor_class, obj",
+    [
+        (mp.MacDataFrameAccessor, pd.DataFrame({"PIDN": [1, 2]})),
+        (mp.MacSeriesAccessor, pd.Series([1, 2])),
+    ],
+)
+def test_register(accessor_class, obj):
+    def len_plus(obj, plus=0):
+        return len(obj) + plus
+
+    try:
+        assert accessor_class.register(len_plus) is len_plus
+        accessor_class.register(name="length_plus")(len_plus)
+
+        assert obj.mac.len_plus() == 2
+        assert obj.mac.length_plus(plus=1) == 3
+
+        with pytest.raises(ValueError):
+            accessor_class.register(len_plus)
+    finally:
+        for name in ["len_plus", "length_plus"]:
+            accessor_class._accessor_funcs.pop(name, None)
+        accessor_class.accessor_api[:] = [
+            func for func in accessor_class.accessor_api if func is not len_plus
+        ]
@@ -28,6 +28,27 @@ def test_add_diff_days():
     assert df[mp.get_option("column.system.diff_days")].equals(pd.Series([365.0, 28.0, 1.0]))
 
 
+def test_add_diff_days_fractional_days():
+    d = {
+        "col1": [datetime(2001, 3, 2, 18), datetime(2001, 2, 1), None],
+        "col2": [datetime(2001, 3, 3, 6), datetime(2001, 2, 1, 12), datetime(2001, 8, 2)],
+    }
+    df = pd.DataFrame(data=d)
+
+    result = df.mac.add_diff_days("col1", "col2", diff_days_col="days")
+    assert result["days"].equals(pd.Series([0.5, 0.5, np.nan]))
+
+    result = df.mac.add_diff_days("col1", "col2", diff_days_col="days", fractional_days=False)
+    assert result["days"].equals(pd.Series([1.0, 0.0, np.nan]))
+
+    mp.set_option("operators.dates.fractional_days", False)
+    try:
+        result = df.mac.add_diff_days("col1", "col2", diff_days_col="days")
+        assert result["days"].equals(pd.Series([1.0, 0.0, np.nan]))
+    finally:
+        mp.reset_option("operators.dates.fractional_days")
+
+
 def test_any_duplicates():
     d = {
         "col1": ["a", "b", "c"],
@@ -87,6 +108,26 @@ def test_count_trailers():
     assert ser2.mac.count_trailers(predicates=lambda x: x == 4) == 3
 
 
+def test_duplicated_sorted():
+    d = {
+        "col1": ["a", "a", "a", "b", "b", "c", None, None],
+        "col2": [1, 1, 2, 3, 3, 3, np.nan, np.nan],
+    }
+    df = pd.DataFrame(data=d)
+
+    with pytest.raises(ValueError):
+        df.mac.duplicated_sorted(keep="middle")
+
+    for keep in ["first", "last", False]:
+        assert df.mac.duplicated_sorted(keep=keep).equals(df.duplicated(keep=keep))
+        assert df.mac.duplicated_sorted("col1", keep=keep).equals(
+            df.duplicated("col1", keep=keep)
+        )
+        assert df["col2"].mac.duplicated_sorted(keep=keep).equals(
+            df["col2"].duplicated(keep=keep)
+        )
+
+
 def test_is_date_col():
     d = {
         "col1": [1, 2, 3],
@@ -16,3 +16,22 @@ def test_reformat_datetime_str():
     assert pd.isnull(datetimetools.reformat_datetime_str("zzzz", errors="coerce")) is True
 
     assert datetimetools.reformat_datetime_str("zzzz", errors="ignore") == "zzzz"
+
+
+def test_to_day_ordinals():
+    dates = pd.Series(
+        pd.to_datetime(["1970-01-01 23:59", "1969-12-31 00:01", None, "2001-03-02 12:00"])
+    )
+
+    expected = [0, -1, datetimetools.DAY_ORDINAL_NA, 11383]
+
+    result = datetimetools.to_day_ordinals(dates)
+    assert result.dtype == "int32"
+    assert result.tolist() == expected
+
+    # int64 nanoseconds since the epoch
+    assert datetimetools.to_day_ordinals(pd.DatetimeIndex(dates).asi8).tolist() == expected
+
+    # timezone-aware dates use their local time
+    result = datetimetools.to_day_ordinals(dates.dt.tz_localize("US/Pacific"))
+    assert result.tolist() == expected